@@ -0,0 +1,182 @@
+"""
+Compara, em um servidor MySQL, as consultas frequentes de PublicacaoService com cursores comuns
+(consultas_preparadas=False) e com comandos preparados sobre a extensão C (consultas_preparadas=True).
+
+Usa a conexão definida como padrão nas configurações do aplicativo; prefira uma base de testes, pois
+são incluídas publicações (removidas ao final) e a data de revisão das publicações lidas é regravada.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.consultas_mysql --repeticoes 200 --saida consultas.json
+
+Para cada operação e modo o resultado traz os tempos (ms) de relógio e o tempo de CPU do processo (ms);
+as duas implementações são executadas alternadamente, após uma execução de aquecimento de cada uma.
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from contextlib import redirect_stdout
+from datetime import date, datetime
+
+import mysql.connector
+
+from benchmarks.executar import obter_commit, resumir
+from services.config_service import ConfigService
+from services.publicacao_service import PublicacaoService
+
+
+MODOS = {"classica": False, "preparada": True}
+
+
+def criar_servicos():
+    """
+    Cria um PublicacaoService de cada modo, com pools separados, a partir da conexão padrão
+    """
+    config_service = ConfigService()
+    default_config = config_service.get_default_connection()
+    if not default_config:
+        raise SystemExit("Nenhuma conexão foi definida como padrão !")
+    conn = config_service.get_dados_conexao(default_config)
+    return {modo: PublicacaoService(conn['host'], conn['user'], conn['password'], conn['database'], conn['port'],
+                                    consultas_preparadas=preparada)
+            for modo, preparada in MODOS.items()}
+
+
+def medir_lado_a_lado(servicos, operacao, argumentos):
+    """
+    Executa operacao(servico, argumento) em cada modo, alternando os modos a cada argumento.
+    Retorna {modo: ([tempos de relógio], [tempos de CPU])} em milissegundos.
+    """
+    tempos = {modo: ([], []) for modo in servicos}
+    for modo, servico in servicos.items():
+        operacao(servico, argumentos[0])
+    for argumento in argumentos:
+        for modo, servico in servicos.items():
+            inicio_cpu = time.process_time()
+            inicio = time.perf_counter()
+            operacao(servico, argumento)
+            tempos[modo][0].append((time.perf_counter() - inicio) * 1000)
+            tempos[modo][1].append((time.process_time() - inicio_cpu) * 1000)
+    return tempos
+
+
+def medir(servicos, repeticoes, gerador):
+    """
+    Mede lista de títulos, leitura por id, inclusão e atualização nos dois modos
+    """
+    servico = servicos["classica"]
+    with servico.pool.conexao() as connection:
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SELECT COUNT(*) FROM publicacoes")
+            quantidade = cursor.fetchone()[0]
+        finally:
+            cursor.close()
+    if not quantidade:
+        raise SystemExit("A base não tem publicações para medir.")
+    primeira_pagina = servico.get_titulos_publicados_pagina(limite=200)
+    ids = [linha["id"] for linha in primeira_pagina]
+    ids = gerador.sample(ids, min(repeticoes, len(ids)))
+    originais = {id_publicacao: servico.get_publicacao_by_id(id_publicacao) for id_publicacao in ids}
+    ultima = primeira_pagina[-1]
+
+    operacoes = {
+        "titulos_primeira_pagina": (lambda s, _: s.get_titulos_publicados_pagina(limite=200), range(repeticoes)),
+        "titulos_pagina_seguinte": (
+            lambda s, _: s.get_titulos_publicados_pagina(ultima["titulo"], ultima["id"], 200), range(repeticoes)),
+        "publicacao_por_id": (lambda s, id_publicacao: s.get_publicacao_by_id(id_publicacao), ids),
+        "metadados_publicacao": (lambda s, id_publicacao: s.get_metadados_publicacao(id_publicacao), ids),
+        "atualizar_campos_publicacao": (
+            lambda s, id_publicacao: s.atualizar_campos_publicacao(id_publicacao, {"data_revisao": date.today()}), ids),
+    }
+
+    incluidos = []
+
+    def incluir(s, id_publicacao):
+        publicacao = originais[id_publicacao]
+        incluidos.append(s.incluir_publicacao(
+            f"{publicacao['titulo']} (benchmark)", publicacao["id_tipopublicacao"], publicacao["tags"],
+            f"{publicacao['url']}_benchmark", date.today(), 0, publicacao["texto"], publicacao["image_link"]))
+    operacoes["incluir_publicacao"] = (incluir, ids)
+
+    resultados = []
+    try:
+        for operacao, (funcao, argumentos) in operacoes.items():
+            argumentos = list(argumentos)
+            for modo, (tempos, tempos_cpu) in medir_lado_a_lado(servicos, funcao, argumentos).items():
+                item = resumir(quantidade, operacao, tempos)
+                item["modo"] = modo
+                item["cpu_mediana_ms"] = round(statistics.median(tempos_cpu), 3)
+                item["cpu_media_ms"] = round(statistics.fmean(tempos_cpu), 3)
+                resultados.append(item)
+    finally:
+        # Desfaz as gravações do benchmark
+        with servico.pool.conexao() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.executemany("DELETE FROM publicacoes_tags WHERE id_publicacao = %s", [(i,) for i in incluidos])
+                cursor.executemany("DELETE FROM publicacoes WHERE id = %s", [(i,) for i in incluidos])
+                cursor.executemany(
+                    "UPDATE publicacoes SET data_revisao = %s WHERE id = %s",
+                    [(publicacao["data_revisao"], id_publicacao) for id_publicacao, publicacao in originais.items()])
+                connection.commit()
+            finally:
+                cursor.close()
+    return resultados
+
+
+def exibir_comparacao(resultados):
+    """
+    Exibe a razão entre as medianas com comandos preparados e com cursores comuns
+    """
+    por_operacao = {}
+    for item in resultados:
+        por_operacao.setdefault(item["operacao"], {})[item["modo"]] = item
+    print("Preparada / clássica (mediana de relógio, mediana de CPU):", file=sys.stderr)
+    for operacao, modos in por_operacao.items():
+        classica, preparada = modos["classica"], modos["preparada"]
+        razao_cpu = preparada["cpu_mediana_ms"] / classica["cpu_mediana_ms"] if classica["cpu_mediana_ms"] else float("nan")
+        print(f"  {operacao:<32} {preparada['mediana_ms'] / classica['mediana_ms']:6.2f}x {razao_cpu:6.2f}x", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara cursores comuns e comandos preparados em um servidor MySQL")
+    parser.add_argument("--repeticoes", type=int, default=100, help="Repetições de cada operação em cada modo")
+    parser.add_argument("--semente", type=int, default=42, help="Semente da escolha das publicações lidas")
+    parser.add_argument("--saida", default="-", help="Arquivo JSON do resultado ('-' para a saída padrão)")
+    args = parser.parse_args()
+
+    resultado = {
+        "commit": obter_commit(),
+        "data": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "mysql_connector": mysql.connector.__version__,
+        "extensao_c": mysql.connector.HAVE_CEXT,
+        "plataforma": platform.platform(),
+        "parametros": {"repeticoes": args.repeticoes, "semente": args.semente},
+        "resultados": []
+    }
+    # As mensagens dos serviços vão para a saída de erro, deixando a saída padrão apenas com o JSON
+    with redirect_stdout(sys.stderr):
+        servicos = criar_servicos()
+        try:
+            resultado["resultados"] = medir(servicos, args.repeticoes, random.Random(args.semente))
+        finally:
+            for servico in servicos.values():
+                servico.disconnect()
+
+    texto = json.dumps(resultado, indent=2, ensure_ascii=False)
+    if args.saida == "-":
+        print(texto)
+    else:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            arquivo.write(texto)
+    exibir_comparacao(resultado["resultados"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
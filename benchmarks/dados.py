@@ -0,0 +1,102 @@
+import os
+import random
+import sqlite3
+from datetime import date, timedelta
+
+from benchmarks.publicacao_sqlite import criar_esquema
+from services.publicacao_service import PublicacaoService
+
+
+PALAVRAS = (
+    "python", "linux", "banco", "dados", "consulta", "servidor", "cliente", "interface", "janela", "desempenho",
+    "memória", "índice", "tabela", "conexão", "publicação", "blog", "código", "função", "classe", "módulo",
+    "teste", "rede", "arquivo", "texto", "imagem", "página", "busca", "cache", "thread", "processo",
+    "compilador", "algoritmo", "estrutura", "lista", "dicionário", "configuração", "aplicação", "sistema",
+    "projeto", "versão", "erro", "exceção", "depuração", "otimização", "latência", "transação", "usuário"
+)
+TAGS = ("Python", "Linux", "C#", "ASP.Net", "MySQL", "Qt", "Docker", "Git", "JavaScript", "SQL")
+
+
+def _texto_base(gerador, tamanho=256 * 1024):
+    """
+    Texto aleatório do qual os textos das publicações são recortados (gerar cada um palavra a palavra
+    tornaria a carga de 1M de publicações lenta demais)
+    """
+    palavras = []
+    total = 0
+    while total < tamanho:
+        palavra = gerador.choice(PALAVRAS)
+        palavras.append(palavra)
+        total += len(palavra) + 1
+        if gerador.random() < 0.08:
+            palavras.append(".\n\n")
+    return " ".join(palavras)
+
+
+def gerar_publicacoes(quantidade, semente=42, texto_mediano=2000):
+    """
+    Gera tuplas (id_tipopublicacao, titulo, tags, url, data_publicacao, data_revisao, ativo, texto, image_link).
+
+    O tamanho do texto segue uma distribuição log-normal com mediana `texto_mediano` caracteres,
+    com poucas publicações muito longas, como em um blog real.
+    """
+    gerador = random.Random(semente)
+    base = _texto_base(gerador)
+    inicio = date(2010, 1, 1)
+    for numero in range(1, quantidade + 1):
+        titulo = " ".join(gerador.choice(PALAVRAS) for _ in range(gerador.randint(3, 8))).capitalize()
+        titulo = f"{titulo} {numero}"
+        tamanho = min(max(int(gerador.lognormvariate(0, 0.8) * texto_mediano), 200), len(base))
+        posicao = gerador.randrange(len(base) - tamanho + 1)
+        data_publicacao = inicio + timedelta(days=gerador.randrange(5000))
+        data_revisao = data_publicacao + timedelta(days=gerador.randrange(400)) if gerador.random() < 0.3 else None
+        yield (
+            gerador.randint(1, 3),
+            titulo,
+            ", ".join(gerador.sample(TAGS, gerador.randint(1, 3))),
+            f"{titulo.lower().replace(' ', '_')}",
+            data_publicacao.isoformat(),
+            data_revisao.isoformat() if data_revisao else None,
+            1 if gerador.random() < 0.95 else 0,
+            base[posicao:posicao + tamanho],
+            f"https://imagens.exemplo.com/{numero}.png" if gerador.random() < 0.5 else None
+        )
+
+
+def popular(caminho_db, quantidade, semente=42, texto_mediano=2000, tamanho_lote=10000, recriar=False):
+    """
+    Cria o arquivo SQLite com `quantidade` publicações. Um arquivo já populado com a mesma quantidade
+    é reaproveitado, pois a carga de 1M de publicações leva minutos.
+
+    :return: Quantidade de publicações no arquivo.
+    """
+    if recriar and os.path.exists(caminho_db):
+        os.remove(caminho_db)
+    criar_esquema(caminho_db)
+    conexao = sqlite3.connect(caminho_db)
+    try:
+        existentes = conexao.execute("SELECT COUNT(*) FROM publicacoes;").fetchone()[0]
+        if existentes == quantidade:
+            return existentes
+        conexao.execute("DELETE FROM publicacoes;")
+        conexao.execute("DELETE FROM sqlite_sequence WHERE name = 'publicacoes';")
+        query = """
+            INSERT INTO publicacoes (id_tipopublicacao, titulo, tags, url, data_publicacao, data_revisao, ativo, texto, image_link)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);
+        """
+        lote = []
+        for publicacao in gerar_publicacoes(quantidade, semente, texto_mediano):
+            lote.append(publicacao)
+            if len(lote) >= tamanho_lote:
+                conexao.executemany(query, lote)
+                lote = []
+        if lote:
+            conexao.executemany(query, lote)
+        # Mesmo valor gravado pelo aplicativo, calculado aqui de uma vez em vez de na primeira verificação de título
+        conexao.create_function("normalizar_titulo", 1, PublicacaoService.normalizar_titulo, deterministic=True)
+        conexao.execute("UPDATE publicacoes SET titulo_normalizado = normalizar_titulo(titulo);")
+        conexao.commit()
+        conexao.execute("ANALYZE;")
+        return quantidade
+    finally:
+        conexao.close()
@@ -0,0 +1,260 @@
+"""
+Benchmarks do Blog Desktop sobre bases SQLite locais de tamanhos crescentes, sem rede e sem servidor MySQL.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.executar --tamanhos 1000 100000 1000000 --saida resultado.json
+    python -m benchmarks.executar --tamanhos 1000 --comparar resultado.json
+
+O resultado é um JSON com o commit, o ambiente e, para cada tamanho e operação,
+os tempos (ms) mínimo, mediana, média, p95 e máximo.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import date, datetime
+
+from benchmarks.dados import popular
+from benchmarks.publicacao_sqlite import PublicacaoServiceSQLite
+from services.cache_publicacoes import CachePublicacoes
+
+
+def medir(funcao, argumentos):
+    """
+    Executa funcao uma vez para cada item de argumentos e retorna os tempos em milissegundos
+    """
+    tempos = []
+    for argumento in argumentos:
+        inicio = time.perf_counter()
+        funcao(argumento)
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return tempos
+
+
+def resumir(quantidade, operacao, tempos):
+    ordenados = sorted(tempos)
+    return {
+        "tamanho": quantidade,
+        "operacao": operacao,
+        "repeticoes": len(tempos),
+        "min_ms": round(ordenados[0], 3),
+        "mediana_ms": round(statistics.median(ordenados), 3),
+        "media_ms": round(statistics.fmean(ordenados), 3),
+        "p95_ms": round(ordenados[min(len(ordenados) - 1, int(len(ordenados) * 0.95))], 3),
+        "max_ms": round(ordenados[-1], 3)
+    }
+
+
+def medir_servico(caminho_db, quantidade, repeticoes, gerador):
+    """
+    Mede as operações de PublicacaoService: lista de títulos, leitura por id, inclusão e atualização
+    """
+    resultados = []
+    servico = PublicacaoServiceSQLite(caminho_db)
+    ids = gerador.sample(range(1, quantidade + 1), min(repeticoes, quantidade))
+
+    resultados.append(resumir(quantidade, "titulos_primeira_pagina", medir(
+        lambda _: servico.get_titulos_publicados_pagina(limite=200), range(repeticoes))))
+
+    ultima = {"titulo": None, "id": None}
+
+    def proxima_pagina(_):
+        pagina = servico.get_titulos_publicados_pagina(ultima["titulo"], ultima["id"], 200)
+        if pagina:
+            ultima.update(pagina[-1])
+    resultados.append(resumir(quantidade, "titulos_pagina_seguinte", medir(proxima_pagina, range(repeticoes))))
+
+    marca = servico.get_marca_sincronizacao()
+    resultados.append(resumir(quantidade, "titulos_alterados", medir(
+        lambda _: servico.get_titulos_alterados(marca), range(repeticoes))))
+
+    resultados.append(resumir(quantidade, "publicacao_por_id", medir(servico.get_publicacao_by_id, ids)))
+
+    servico_cache = PublicacaoServiceSQLite(caminho_db, CachePublicacoes())
+    for id_publicacao in ids:
+        servico_cache.get_publicacao_by_id(id_publicacao)
+    resultados.append(resumir(quantidade, "publicacao_por_id_cache", medir(servico_cache.get_publicacao_by_id, ids)))
+
+    publicacoes = [servico.get_publicacao_by_id(id_publicacao) for id_publicacao in ids]
+    resultados.append(resumir(quantidade, "existe_titulo", medir(
+        lambda publicacao: servico.existe_titulo(publicacao["titulo"], publicacao["id"]), publicacoes)))
+
+    incluidos = []
+
+    def incluir(publicacao):
+        incluidos.append(servico.incluir_publicacao(
+            f"{publicacao['titulo']} (cópia)", publicacao["id_tipopublicacao"], publicacao["tags"],
+            publicacao["url"], date.today(), 1, publicacao["texto"], publicacao["image_link"]))
+    resultados.append(resumir(quantidade, "incluir_publicacao", medir(incluir, publicacoes)))
+
+    def atualizar(publicacao):
+        servico.atualizar_publicacao(
+            publicacao["id"], publicacao["titulo"], publicacao["id_tipopublicacao"], publicacao["tags"],
+            date.today(), publicacao["ativo"], publicacao["texto"] + " revisado", publicacao["image_link"])
+    resultados.append(resumir(quantidade, "atualizar_publicacao", medir(atualizar, publicacoes)))
+
+    # Desfaz as gravações para que a base possa ser reaproveitada na próxima execução
+    conexao = sqlite3.connect(caminho_db)
+    with conexao:
+        conexao.executemany("DELETE FROM publicacoes WHERE id = ?;", [(id_publicacao,) for id_publicacao in incluidos])
+        conexao.executemany(
+            "UPDATE publicacoes SET texto = ?, data_revisao = ? WHERE id = ?;",
+            [(publicacao["texto"], publicacao["data_revisao"] and publicacao["data_revisao"].isoformat(), publicacao["id"])
+             for publicacao in publicacoes])
+    conexao.close()
+    servico.disconnect()
+    servico_cache.disconnect()
+    return resultados
+
+
+def medir_janela(caminho_db, quantidade, repeticoes, gerador):
+    """
+    Mede o preenchimento da MainWindow (Qt offscreen): abertura até as combos carregadas,
+    exibição de uma publicação e carga de mais uma página de títulos ao rolar a lista
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    import main_window
+    from enumScreenState import EnumScreenState
+    from services.config_service import ConfigService
+
+    class ConfigServiceBenchmark(ConfigService):
+        def get_default_connection(self):
+            return {"url": "jdbc:mysql://benchmark:3306/blog", "username": "benchmark", "password": "",
+                    "driverclassname": "", "type": "benchmark"}
+
+    main_window.ConfigService = ConfigServiceBenchmark
+    main_window.criar_publicacao_service = lambda conn, cache: PublicacaoServiceSQLite(caminho_db, cache)
+    main_window.ARQUIVO_CACHE_PUBLICACOES = None
+    main_window.ARQUIVO_DIARIO_GRAVACOES = ":memory:"
+    main_window.ARQUIVO_RASCUNHOS = ":memory:"
+    app = QApplication.instance() or QApplication([])
+
+    def esperar(condicao, timeout=120):
+        limite = time.perf_counter() + timeout
+        while not condicao():
+            if time.perf_counter() > limite:
+                raise TimeoutError("A janela não terminou de carregar no tempo limite")
+            app.processEvents()
+
+    resultados = []
+    janelas = []
+
+    def abrir(_):
+        janela = main_window.MainWindow()
+        janela.show()
+        esperar(lambda: janela.current_state == EnumScreenState.INICIAL
+                and janela.titulos_model.rowCount() > 0
+                and janela.cboTipoPublicacao.count() > 0
+                and not janela.executor.ocupado())
+        janelas.append(janela)
+    resultados.append(resumir(quantidade, "janela_inicializacao", medir(abrir, range(max(3, repeticoes // 10)))))
+
+    janela = janelas.pop()
+    for outra in janelas:
+        outra.close()
+
+    def exibir(id_publicacao):
+        janela.txtTextoPublicacao.clear()
+        janela.exibir_publicacao(id_publicacao)
+        esperar(lambda: janela.id_publicacao_atual == id_publicacao
+                and janela.carregamento_texto is None
+                and not janela.executor.ocupado())
+    ids = gerador.sample(range(1, quantidade + 1), min(repeticoes, quantidade))
+    resultados.append(resumir(quantidade, "janela_exibir_publicacao", medir(exibir, ids)))
+
+    paginas = []
+    janela.titulos_model.pagina_carregada.connect(paginas.append)
+
+    janela.titulos_model.recarregar()
+    esperar(lambda: paginas and not janela.executor.ocupado())
+
+    def rolar(_):
+        carregadas = len(paginas)
+        janela.titulos_model.fetchMore()
+        esperar(lambda: len(paginas) > carregadas and not janela.executor.ocupado())
+    # Apenas páginas existentes: a primeira já foi carregada e a última pode vir incompleta
+    paginas_restantes = max(1, (quantidade - 1) // main_window.TAMANHO_PAGINA_TITULOS)
+    resultados.append(resumir(quantidade, "janela_proxima_pagina_titulos", medir(rolar, range(min(repeticoes, paginas_restantes)))))
+
+    janela.close()
+    app.processEvents()
+    return resultados
+
+
+def obter_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def comparar(resultado, arquivo_anterior):
+    """
+    Exibe a razão entre as medianas do resultado atual e de uma execução anterior
+    """
+    with open(arquivo_anterior, encoding="utf-8") as arquivo:
+        anterior = json.load(arquivo)
+    medianas = {(item["tamanho"], item["operacao"]): item["mediana_ms"] for item in anterior["resultados"]}
+    print(f"Comparação com {anterior.get('commit')} (mediana atual / anterior):", file=sys.stderr)
+    for item in resultado["resultados"]:
+        mediana_anterior = medianas.get((item["tamanho"], item["operacao"]))
+        if mediana_anterior:
+            print(f"  {item['tamanho']:>8} {item['operacao']:<32} {item['mediana_ms'] / mediana_anterior:6.2f}x", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks do Blog Desktop sobre bases SQLite locais")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[1000, 100000, 1000000], help="Quantidades de publicações")
+    parser.add_argument("--repeticoes", type=int, default=50, help="Repetições de cada operação")
+    parser.add_argument("--semente", type=int, default=42, help="Semente dos dados gerados")
+    parser.add_argument("--texto-mediano", type=int, default=2000, help="Tamanho mediano do texto das publicações (caracteres)")
+    parser.add_argument("--diretorio", default=tempfile.gettempdir(), help="Diretório dos arquivos SQLite gerados")
+    parser.add_argument("--recriar", action="store_true", help="Gera novamente as bases já existentes")
+    parser.add_argument("--sem-janela", action="store_true", help="Não mede a MainWindow")
+    parser.add_argument("--saida", default="-", help="Arquivo JSON do resultado ('-' para a saída padrão)")
+    parser.add_argument("--comparar", help="Resultado JSON anterior para comparação")
+    args = parser.parse_args()
+
+    resultado = {
+        "commit": obter_commit(),
+        "data": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "plataforma": platform.platform(),
+        "parametros": {"repeticoes": args.repeticoes, "semente": args.semente, "texto_mediano": args.texto_mediano},
+        "resultados": []
+    }
+    # As mensagens dos serviços vão para a saída de erro, deixando a saída padrão apenas com o JSON
+    with redirect_stdout(sys.stderr):
+        for quantidade in args.tamanhos:
+            caminho_db = os.path.join(args.diretorio, f"blog_benchmark_{quantidade}_{args.semente}_{args.texto_mediano}.db")
+            inicio = time.perf_counter()
+            popular(caminho_db, quantidade, args.semente, args.texto_mediano, recriar=args.recriar)
+            print(f"Base com {quantidade} publicações pronta em {time.perf_counter() - inicio:.1f}s: {caminho_db}")
+            gerador = random.Random(args.semente)
+            resultado["resultados"].extend(medir_servico(caminho_db, quantidade, args.repeticoes, gerador))
+            if not args.sem_janela:
+                resultado["resultados"].extend(medir_janela(caminho_db, quantidade, args.repeticoes, gerador))
+
+    texto = json.dumps(resultado, indent=2, ensure_ascii=False)
+    if args.saida == "-":
+        print(texto)
+    else:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            arquivo.write(texto)
+    if args.comparar:
+        comparar(resultado, args.comparar)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
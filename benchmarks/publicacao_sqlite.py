@@ -0,0 +1,252 @@
+import queue
+import re
+import sqlite3
+from contextlib import contextmanager
+from datetime import date, datetime
+
+from services.publicacao_service import PublicacaoService
+
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS tipopublicacao (
+    id INTEGER PRIMARY KEY,
+    nome TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS publicacoes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    id_tipopublicacao INTEGER NOT NULL,
+    titulo TEXT NOT NULL,
+    tags TEXT,
+    url TEXT,
+    data_publicacao TEXT,
+    data_revisao TEXT,
+    ativo INTEGER NOT NULL DEFAULT 1,
+    texto TEXT,
+    image_link TEXT,
+    titulo_normalizado TEXT,
+    atualizado_em TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now'))
+);
+CREATE INDEX IF NOT EXISTS idx_publicacoes_titulo ON publicacoes (titulo, id);
+CREATE INDEX IF NOT EXISTS idx_publicacoes_titulo_normalizado ON publicacoes (titulo_normalizado);
+CREATE INDEX IF NOT EXISTS idx_publicacoes_url ON publicacoes (url);
+CREATE INDEX IF NOT EXISTS idx_publicacoes_atualizado_em ON publicacoes (atualizado_em);
+-- Equivalente ao ON UPDATE CURRENT_TIMESTAMP(6) da coluna no MySQL
+CREATE TRIGGER IF NOT EXISTS tr_publicacoes_atualizado_em AFTER UPDATE ON publicacoes
+WHEN NEW.atualizado_em = OLD.atualizado_em
+BEGIN
+    UPDATE publicacoes SET atualizado_em = strftime('%Y-%m-%dT%H:%M:%f', 'now') WHERE id = NEW.id;
+END;
+"""
+
+
+def _converter_query(query):
+    # INSERT IGNORE do MySQL equivale a INSERT OR IGNORE no SQLite
+    return query.replace("INSERT IGNORE", "INSERT OR IGNORE").replace("%s", "?")
+
+
+def _converter_parametro(valor):
+    if isinstance(valor, (date, datetime)):
+        return valor.isoformat()
+    return valor
+
+
+def _converter_valor(coluna, valor):
+    # As datas são gravadas como texto ISO; o MySQL as devolve como date e datetime
+    if isinstance(valor, str) and ("data_" in coluna or coluna == "atualizado_em"):
+        return datetime.fromisoformat(valor) if "T" in valor else date.fromisoformat(valor)
+    return valor
+
+
+class CursorSQLite:
+    """
+    Cursor com a mesma interface usada do cursor do mysql-connector (placeholders %s, dictionary=True)
+    """
+    def __init__(self, conexao, dictionary=False):
+        self._cursor = conexao.cursor()
+        self.dictionary = dictionary
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    def execute(self, query, params=()):
+        self._cursor.execute(_converter_query(query), tuple(_converter_parametro(valor) for valor in params))
+
+    def executemany(self, query, lista_params):
+        self._cursor.executemany(
+            _converter_query(query),
+            (tuple(_converter_parametro(valor) for valor in params) for params in lista_params))
+
+    def fetchone(self):
+        linha = self._cursor.fetchone()
+        return None if linha is None else self._converter(linha)
+
+    def fetchmany(self, tamanho):
+        return [self._converter(linha) for linha in self._cursor.fetchmany(tamanho)]
+
+    def fetchall(self):
+        return [self._converter(linha) for linha in self._cursor.fetchall()]
+
+    def close(self):
+        self._cursor.close()
+
+    def _converter(self, linha):
+        colunas = [descricao[0] for descricao in self._cursor.description]
+        valores = [_converter_valor(coluna, valor) for coluna, valor in zip(colunas, linha)]
+        return dict(zip(colunas, valores)) if self.dictionary else tuple(valores)
+
+
+class ConexaoSQLite:
+    """
+    Conexão SQLite com os métodos da conexão do mysql-connector usados por PublicacaoService
+    """
+    unread_result = False
+
+    def __init__(self, caminho_db):
+        self._conexao = sqlite3.connect(caminho_db, check_same_thread=False)
+        self._conexao.create_function("CHAR_LENGTH", 1, lambda texto: None if texto is None else len(texto), deterministic=True)
+        self._conexao.create_function("NOW", 0, lambda: datetime.now().isoformat(sep=" ", timespec="seconds"))
+
+    def cursor(self, dictionary=False, buffered=True):
+        return CursorSQLite(self._conexao, dictionary)
+
+    def is_connected(self):
+        return True
+
+    def commit(self):
+        self._conexao.commit()
+
+    def rollback(self):
+        self._conexao.rollback()
+
+    def consume_results(self):
+        pass
+
+    def close(self):
+        self._conexao.close()
+
+
+class PoolSQLite:
+    """
+    Substitui ConexaoPool: empresta conexões SQLite para o mesmo arquivo, uma por thread em uso
+    """
+    def __init__(self, caminho_db):
+        self.caminho_db = caminho_db
+        self._livres = queue.LifoQueue()
+
+    @contextmanager
+    def conexao(self):
+        try:
+            conexao = self._livres.get_nowait()
+        except queue.Empty:
+            conexao = ConexaoSQLite(self.caminho_db)
+        try:
+            yield conexao
+        finally:
+            self._livres.put(conexao)
+
+    def encerrar(self):
+        while True:
+            try:
+                conexao = self._livres.get_nowait()
+            except queue.Empty:
+                break
+            conexao.close()
+
+
+class PublicacaoServiceSQLite(PublicacaoService):
+    """
+    PublicacaoService sobre um arquivo SQLite local, para os benchmarks rodarem sem rede e sem servidor MySQL.
+
+    Apenas o pool de conexões é substituído: as consultas, a paginação e o uso do cache são os de
+    PublicacaoService. A pesquisa FULLTEXT, exclusiva do MySQL, é aproximada com LIKE.
+    """
+    DDL_TAGS = (
+        """
+        CREATE TABLE IF NOT EXISTS tags (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nome TEXT NOT NULL COLLATE NOCASE UNIQUE
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS publicacoes_tags (
+            id_tag INTEGER NOT NULL,
+            id_publicacao INTEGER NOT NULL,
+            PRIMARY KEY (id_tag, id_publicacao)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_publicacoes_tags_publicacao ON publicacoes_tags (id_publicacao)"
+    )
+
+    def __init__(self, caminho_db, cache=None):
+        """
+        :param caminho_db: Arquivo SQLite criado por criar_esquema/popular.
+        :param cache: CachePublicacoes opcional usado por get_publicacao_by_id.
+        """
+        self.cache = cache
+        # Comandos preparados no servidor são exclusivos do MySQL
+        self.consultas_preparadas = False
+        self._indice_fulltext_verificado = True
+        self._indice_url_verificado = True
+        self._tabela_gravacoes_verificada = False
+        self._tabelas_tags_verificadas = False
+        self._coluna_titulo_verificada = False
+        # A coluna atualizado_em faz parte do ESQUEMA
+        self._coluna_atualizado_em_verificada = True
+        self.pool = PoolSQLite(caminho_db)
+
+    def garantir_indice_fulltext(self):
+        pass
+
+    def garantir_coluna_titulo_normalizado(self):
+        # A coluna faz parte do ESQUEMA; resta preencher as publicações sem o título normalizado
+        if self._coluna_titulo_verificada:
+            return
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor()
+            try:
+                self._preencher_titulos_normalizados(connection, cursor)
+                self._coluna_titulo_verificada = True
+            finally:
+                cursor.close()
+
+    def pesquisar_publicacoes(self, termos, limite=20):
+        palavras = [palavra for palavra in re.findall(r'\w+', termos) if len(palavra) >= 3]
+        if not palavras:
+            return []
+        condicoes = " AND ".join("(titulo LIKE %s OR tags LIKE %s)" for _ in palavras)
+        params = []
+        for palavra in palavras:
+            params.extend((f"%{palavra}%", f"%{palavra}%"))
+        query = f"""
+            SELECT id, titulo, 1.0 AS relevancia, substr(texto, 1, 240) AS trecho
+            FROM publicacoes
+            WHERE {condicoes}
+            LIMIT %s
+        """
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor(dictionary=True)
+            try:
+                cursor.execute(query, (*params, limite))
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
+
+def criar_esquema(caminho_db):
+    """
+    Cria as tabelas e índices equivalentes aos da base MySQL do blog
+    """
+    conexao = sqlite3.connect(caminho_db)
+    try:
+        conexao.executescript(ESQUEMA)
+        conexao.executemany(
+            "INSERT OR IGNORE INTO tipopublicacao (id, nome) VALUES (?, ?);",
+            [(1, "Artigo"), (2, "Tutorial"), (3, "Notícia")])
+        conexao.commit()
+    finally:
+        conexao.close()
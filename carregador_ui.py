@@ -0,0 +1,44 @@
+import hashlib
+import importlib
+import os
+
+
+def calcular_hash_ui(arquivo_ui):
+    """
+    Calcula o hash do conteúdo de um arquivo .ui, usado para saber se a classe pré-compilada está atualizada
+    """
+    with open(arquivo_ui, "rb") as arquivo:
+        return hashlib.sha1(arquivo.read()).hexdigest()
+
+
+def nome_modulo_ui(arquivo_ui):
+    """
+    Nome do módulo pré-compilado de um arquivo .ui (principal.ui -> ui_principal)
+    """
+    return "ui_" + os.path.splitext(os.path.basename(arquivo_ui))[0]
+
+
+def carregar_ui(widget, arquivo_ui):
+    """
+    Monta no widget a interface descrita em arquivo_ui.
+
+    Usa a classe gerada por compilar_ui.py quando ela corresponde ao conteúdo atual do .ui,
+    evitando interpretar o XML a cada abertura; caso contrário recorre a PyQt5.uic.loadUi.
+    """
+    try:
+        modulo = importlib.import_module(nome_modulo_ui(arquivo_ui))
+    except ImportError:
+        modulo = None
+
+    if modulo is not None and getattr(modulo, "HASH_UI", None) == calcular_hash_ui(arquivo_ui):
+        classe_ui = next(getattr(modulo, nome) for nome in dir(modulo) if nome.startswith("Ui_"))
+        ui = classe_ui()
+        ui.setupUi(widget)
+        # Expõe os controles como atributos do widget, como faz o loadUi
+        for nome, valor in vars(ui).items():
+            setattr(widget, nome, valor)
+        return
+
+    print(f"Interface pré-compilada ausente ou desatualizada para {arquivo_ui}. Execute: python compilar_ui.py")
+    from PyQt5.uic import loadUi
+    loadUi(arquivo_ui, widget)
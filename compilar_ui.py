@@ -0,0 +1,55 @@
+import argparse
+import io
+import sys
+
+from carregador_ui import calcular_hash_ui, nome_modulo_ui
+
+# Arquivos do Qt Designer usados pelo aplicativo
+ARQUIVOS_UI = ["principal.ui", "configuracoes.ui", "diagnostico.ui", "historico.ui"]
+
+
+def compilar(arquivo_ui):
+    """
+    Gera ui_<nome>.py a partir do arquivo .ui, com o hash do .ui de origem
+    """
+    from PyQt5 import uic
+
+    codigo = io.StringIO()
+    uic.compileUi(arquivo_ui, codigo)
+    destino = nome_modulo_ui(arquivo_ui) + ".py"
+    with open(destino, "w", encoding="utf-8") as arquivo:
+        arquivo.write(f"# Gerado por compilar_ui.py a partir de {arquivo_ui}. Não edite este arquivo.\n")
+        arquivo.write(f'HASH_UI = "{calcular_hash_ui(arquivo_ui)}"\n')
+        arquivo.write(codigo.getvalue())
+    print(f"{arquivo_ui} -> {destino}")
+
+
+def verificar(arquivo_ui):
+    """
+    Indica se ui_<nome>.py corresponde ao conteúdo atual do arquivo .ui
+    """
+    try:
+        with open(nome_modulo_ui(arquivo_ui) + ".py", encoding="utf-8") as arquivo:
+            arquivo.readline()
+            return arquivo.readline().strip() == f'HASH_UI = "{calcular_hash_ui(arquivo_ui)}"'
+    except FileNotFoundError:
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pré-compila as interfaces .ui em módulos Python")
+    parser.add_argument("--verificar", action="store_true", help="Apenas verifica se os módulos gerados estão atualizados")
+    args = parser.parse_args()
+
+    if args.verificar:
+        desatualizados = [arquivo_ui for arquivo_ui in ARQUIVOS_UI if not verificar(arquivo_ui)]
+        for arquivo_ui in desatualizados:
+            print(f"{arquivo_ui} está desatualizado. Execute: python compilar_ui.py")
+        sys.exit(1 if desatualizados else 0)
+
+    for arquivo_ui in ARQUIVOS_UI:
+        compilar(arquivo_ui)
+
+
+if __name__ == "__main__":
+    main()
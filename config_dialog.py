@@ -1,20 +1,23 @@
 from PyQt5.QtWidgets import QDialog, QComboBox, QMessageBox
-from PyQt5.uic import loadUi
+from PyQt5.QtCore import pyqtSignal
+from carregador_ui import carregar_ui
 from enumScreenState import EnumScreenState
 from services.config_service import ConfigService
 from typing import Union
-import sys
 
 class ConfigDialog(QDialog):
     """
     Janela de Configurações
     """
+    # Emitido após uma gravação que pode alterar a conexão default; a janela principal reconecta sem reiniciar
+    conexao_alterada = pyqtSignal()
+
     def __init__(self, parent=None):
-        # Classe de serviço de configuração
-        self.config_service = ConfigService()
+        # Classe de serviço de configuração (compartilhada com a janela principal, quando houver)
+        self.config_service = getattr(parent, "config_service", None) or ConfigService()
 
         super().__init__(parent)
-        loadUi("configuracoes.ui", self)
+        carregar_ui(self, "configuracoes.ui")
         self.setFixedSize(self.width(), self.height())
         self.carregar_combo_tipo_conexao()
         self.cboLocalConexao.currentIndexChanged.connect(self.on_cboLocalConexao_currentIndexChanged)
@@ -41,17 +44,6 @@ class ConfigDialog(QDialog):
                 self.btnDefault.setEnabled(True)
                 self.btnAplicar.setEnabled(True)
             
-    def exibir_mensagem_reiniciar(self):
-        """
-        Exibe mensagem de reinicialização do aplicativo
-        """
-        alert = QMessageBox()
-        alert.setWindowTitle("Atenção")
-        alert.setText("Para que a nova configuração tenha efeito, será necessário reiniciar a aplicação.")
-        alert.setIcon(QMessageBox.Information)
-        alert.setStandardButtons(QMessageBox.Ok)
-        alert.exec_()
-        
     def exibir_mensagem_alerta(self, texto):
         alert = QMessageBox(self)
         alert.setWindowTitle("Atenção")
@@ -77,18 +69,12 @@ class ConfigDialog(QDialog):
         """
         Atualiza qual conexão será considerada a padrão
         """
-        self.exibir_mensagem_reiniciar()
         tipo_selecionado = self.cboLocalConexao.currentText()
         if tipo_selecionado:
-            total_items = self.cboLocalConexao.count()
-            # Deixa o item selecionado com isdefault = 1 e os outros com isdefault = 0
-            for index in range(total_items):
-                item_text = self.cboLocalConexao.itemText(index)
-                if item_text == tipo_selecionado:
-                    self.config_service.set_connection_default(1, item_text)
-                else:
-                    self.config_service.set_connection_default(0, item_text)
-            sys.exit(0)
+            # Deixa o item selecionado com isdefault = 1 e os outros com isdefault = 0, em uma única transação
+            self.config_service.set_unica_connection_default(tipo_selecionado)
+            self.conexao_alterada.emit()
+            self.accept()
             
     def on_btnAplicar_Click(self):
         """
@@ -109,13 +95,14 @@ class ConfigDialog(QDialog):
             self.txtPassword.setFocus()
             return
         
-        self.exibir_mensagem_reiniciar()
         self.config_service.set_connection_info(
             self.txtURL.text(), 
             self.txtUsername.text(), 
             self.txtPassword.text(), 
             self.cboLocalConexao.currentText())
-        sys.exit(0)
+        # Se a configuração alterada for a default, a janela principal reconecta com os novos dados
+        self.conexao_alterada.emit()
+        self.accept()
         
     def on_cboLocalConexao_currentIndexChanged(self):
         """
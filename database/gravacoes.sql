@@ -0,0 +1,9 @@
+-- Chaves das gravações do diário local já aplicadas (criada automaticamente pelo aplicativo no primeiro uso)
+
+-- Cada gravação salva no diário (database/diario_gravacoes.db) é enviada com uma chave única, registrada aqui
+-- na mesma transação da alteração: um lote reenviado após uma falha de conexão não é aplicado duas vezes
+CREATE TABLE IF NOT EXISTS gravacoes_aplicadas (
+    chave CHAR(36) PRIMARY KEY,
+    id_publicacao INT NOT NULL,
+    aplicada_em DATETIME NOT NULL
+);
@@ -0,0 +1,23 @@
+-- Índices usados pelas consultas do aplicativo na base MySQL do blog
+
+-- Paginação por chave da lista de títulos: ORDER BY titulo, id / WHERE (titulo, id) > (?, ?)
+CREATE INDEX idx_publicacoes_titulo ON publicacoes (titulo, id);
+
+-- Verificação de título repetido: WHERE titulo_normalizado = ? (criada e preenchida automaticamente pelo aplicativo);
+-- o valor é o título sem acentos, maiúsculas e espaços repetidos, calculado pelo aplicativo a cada gravação
+ALTER TABLE publicacoes
+    ADD COLUMN titulo_normalizado VARCHAR(768) CHARACTER SET ascii COLLATE ascii_bin NULL,
+    ADD INDEX idx_publicacoes_titulo_normalizado (titulo_normalizado);
+
+-- Validação do cache local e atualização incremental da lista de títulos, MAX(atualizado_em) / WHERE atualizado_em >= ?
+-- (criada automaticamente pelo aplicativo):
+-- instante da última gravação de cada publicação, mantido pelo próprio MySQL
+ALTER TABLE publicacoes
+    ADD COLUMN atualizado_em DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+    ADD INDEX idx_publicacoes_atualizado_em (atualizado_em);
+
+-- URL livre para uma nova publicação: WHERE url = ? OR url LIKE 'slug!_%' (criado automaticamente pelo aplicativo)
+CREATE INDEX idx_publicacoes_url ON publicacoes (url);
+
+-- Pesquisa de publicações (criado automaticamente pelo aplicativo na primeira pesquisa)
+ALTER TABLE publicacoes ADD FULLTEXT INDEX ft_publicacoes (titulo, tags, texto);
@@ -0,0 +1,14 @@
+-- Histórico de revisões das publicações (criada automaticamente pelo aplicativo no primeiro uso)
+
+-- dados: JSON comprimido (zlib) com os campos da publicação e o texto inteiro (snapshot = 1)
+-- ou a diferença por linha em relação à revisão anterior (snapshot = 0)
+CREATE TABLE IF NOT EXISTS publicacoes_revisoes (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    id_publicacao INT NOT NULL,
+    numero INT NOT NULL,
+    snapshot TINYINT(1) NOT NULL,
+    tamanho_texto INT NOT NULL,
+    criada_em DATETIME NOT NULL,
+    dados LONGBLOB NOT NULL,
+    UNIQUE KEY uk_publicacoes_revisoes (id_publicacao, numero)
+);
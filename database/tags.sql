@@ -0,0 +1,16 @@
+-- Tags normalizadas das publicações (criadas e preenchidas automaticamente pelo aplicativo no primeiro uso)
+
+-- A coluna publicacoes.tags continua sendo o texto exibido e editado; publicacoes_tags é mantida
+-- na mesma transação de cada inclusão e atualização, para que as consultas por tag usem os índices
+CREATE TABLE IF NOT EXISTS tags (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    nome VARCHAR(100) NOT NULL,
+    UNIQUE KEY uk_tags_nome (nome)
+);
+
+CREATE TABLE IF NOT EXISTS publicacoes_tags (
+    id_tag INT NOT NULL,
+    id_publicacao INT NOT NULL,
+    PRIMARY KEY (id_tag, id_publicacao),
+    KEY idx_publicacoes_tags_publicacao (id_publicacao)
+);
@@ -0,0 +1,75 @@
+from PyQt5.QtWidgets import QDialog, QTableWidgetItem
+from PyQt5.QtCore import Qt
+from carregador_ui import carregar_ui
+from services.metricas import metricas
+
+COLUNAS = ["Operação", "Chamadas", "Erros", "p50 (ms)", "p95 (ms)", "p99 (ms)", "Máx (ms)", "Linhas", "Bytes", "Conexão p95 (ms)"]
+
+
+class ItemNumerico(QTableWidgetItem):
+    """
+    Item de tabela ordenado pelo valor numérico, e não pelo texto
+    """
+    def __init__(self, valor, casas=1):
+        super().__init__("" if valor is None else f"{valor:.{casas}f}")
+        self.valor = -1 if valor is None else valor
+        self.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+
+    def __lt__(self, outro):
+        return self.valor < getattr(outro, "valor", -1)
+
+
+class DiagnosticoDialog(QDialog):
+    """
+    Janela de Diagnóstico: latência por operação (banco, conexão, fila do executor e preenchimento da tela)
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        carregar_ui(self, "diagnostico.ui")
+        self.setFixedSize(self.width(), self.height())
+        self.tblMetricas.setColumnCount(len(COLUNAS))
+        self.tblMetricas.setHorizontalHeaderLabels(COLUNAS)
+        self.btnAtualizar.clicked.connect(self.on_btnAtualizar_Click)
+        self.btnLimpar.clicked.connect(self.on_btnLimpar_Click)
+        self.carregar_metricas()
+
+    def carregar_metricas(self):
+        """
+        Preenche a tabela com o resumo atual das métricas
+        """
+        resumo = metricas.resumo()
+        self.tblMetricas.setSortingEnabled(False)
+        self.tblMetricas.setRowCount(len(resumo))
+        for linha, (operacao, estatistica) in enumerate(sorted(resumo.items())):
+            valores = [
+                QTableWidgetItem(operacao),
+                ItemNumerico(estatistica["chamadas"], 0),
+                ItemNumerico(estatistica["erros"], 0),
+                ItemNumerico(estatistica["p50"]),
+                ItemNumerico(estatistica["p95"]),
+                ItemNumerico(estatistica["p99"]),
+                ItemNumerico(estatistica["max"]),
+                ItemNumerico(estatistica["linhas"], 0),
+                ItemNumerico(estatistica["bytes"], 0),
+                ItemNumerico(estatistica["espera_conexao_p95"])
+            ]
+            for coluna, item in enumerate(valores):
+                self.tblMetricas.setItem(linha, coluna, item)
+        self.tblMetricas.setSortingEnabled(True)
+        self.tblMetricas.resizeColumnsToContents()
+
+        arquivo_log = metricas.arquivo_log
+        self.lblLog.setText(f"Log: {arquivo_log}" if arquivo_log else "Log de métricas desativado")
+
+    def on_btnAtualizar_Click(self):
+        """
+        Click botão btnAtualizar
+        """
+        self.carregar_metricas()
+
+    def on_btnLimpar_Click(self):
+        """
+        Click botão btnLimpar
+        """
+        metricas.limpar()
+        self.carregar_metricas()
@@ -4,4 +4,5 @@ class EnumScreenState(Enum):
     INICIAL = 1,
     NOVO = 2
     SELECIONADO = 3
-    VISUALIZAR = 4
\ No newline at end of file
+    VISUALIZAR = 4
+    DESCONECTADO = 5
\ No newline at end of file
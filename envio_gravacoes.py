@@ -0,0 +1,148 @@
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+
+class EnvioGravacoes(QObject):
+    """
+    Envia ao MySQL, em segundo plano, as gravações salvas no diário local (DiarioGravacoes).
+
+    Cada gravação agenda um envio após `espera_ms`, de forma que gravações próximas sigam no mesmo lote;
+    enquanto houver pendências os lotes seguintes são enviados em sequência. Após uma falha de conexão
+    a espera até a próxima tentativa dobra a cada falha, até `espera_maxima_ms`.
+    """
+    # [(gravação, id_publicacao)] aplicadas no banco
+    gravacoes_aplicadas = pyqtSignal(list)
+    # [gravação] recusadas pelo banco em todas as tentativas, com o último erro em 'erro'
+    gravacoes_rejeitadas = pyqtSignal(list)
+    # Quantidade de gravações aguardando envio
+    pendentes_alterado = pyqtSignal(int)
+    envio_falhou = pyqtSignal(object)
+
+    def __init__(self, diario, executor, obter_service, obter_revisao_service, tamanho_lote=50,
+                 espera_ms=200, espera_inicial_falha_ms=1000, espera_maxima_ms=60000, parent=None):
+        """
+        :param diario: DiarioGravacoes onde as gravações são registradas.
+        :param executor: ExecutorTarefas usado para o envio.
+        :param obter_service: Função que retorna o PublicacaoService atual (None enquanto não conectado).
+        :param obter_revisao_service: Função que retorna o RevisaoService usado para registrar o histórico.
+        :param tamanho_lote: Quantidade máxima de gravações enviadas em uma transação.
+        """
+        super().__init__(parent)
+        self.diario = diario
+        self.executor = executor
+        self.obter_service = obter_service
+        self.obter_revisao_service = obter_revisao_service
+        self.tamanho_lote = tamanho_lote
+        self.espera_ms = espera_ms
+        self.espera_inicial_falha_ms = espera_inicial_falha_ms
+        self.espera_maxima_ms = espera_maxima_ms
+        # Base MySQL de destino (obter_destino); None enquanto não houver conexão
+        self.destino = None
+        self._enviando = False
+        self._falhas = 0
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.enviar)
+
+    def iniciar(self, destino):
+        """
+        Passa a enviar as gravações do destino, começando pelas deixadas pendentes em execuções anteriores
+        """
+        self.destino = destino
+        self._falhas = 0
+        self.pendentes_alterado.emit(self.diario.quantidade_pendentes(destino))
+        self.agendar(0)
+
+    def parar(self):
+        """
+        Interrompe os envios; as gravações pendentes continuam no diário
+        """
+        self.timer.stop()
+        self.executor.cancelar("diario")
+        self._enviando = False
+        self.destino = None
+
+    def registrar_inclusao(self, dados):
+        """
+        Salva a inclusão no diário e agenda o envio
+        """
+        chave = self.diario.registrar_inclusao(self.destino, dados)
+        self._registrada()
+        return chave
+
+    def registrar_atualizacao(self, id_publicacao, alteracoes, anterior):
+        """
+        Salva a atualização no diário e agenda o envio
+        """
+        chave = self.diario.registrar_atualizacao(self.destino, id_publicacao, alteracoes, anterior)
+        self._registrada()
+        return chave
+
+    def alteracoes_pendentes(self, id_publicacao):
+        """
+        Alterações da publicação salvas no diário e ainda não aplicadas no banco
+        """
+        if self.destino is None:
+            return {}
+        return self.diario.alteracoes_pendentes(self.destino, id_publicacao)
+
+    def agendar(self, espera=None):
+        """
+        Agenda o próximo envio, sem adiar um envio já agendado para antes
+        """
+        if self.destino is None:
+            return
+        espera = self.espera_ms if espera is None else espera
+        if not self.timer.isActive() or self.timer.remainingTime() > espera:
+            self.timer.start(espera)
+
+    def enviar(self):
+        """
+        Envia em segundo plano o próximo lote de gravações pendentes
+        """
+        service = self.obter_service()
+        if self.destino is None or service is None or self._enviando:
+            return
+        self._enviando = True
+        self.executor.executar(
+            "diario",
+            self.diario.enviar_pendentes,
+            service,
+            self.destino,
+            self.tamanho_lote,
+            self.obter_revisao_service(),
+            ao_concluir=self.on_lote_enviado,
+            ao_falhar=self.on_envio_falhou)
+
+    def on_lote_enviado(self, resultado):
+        self._enviando = False
+        if resultado["aplicadas"]:
+            self._falhas = 0
+            self.gravacoes_aplicadas.emit(resultado["aplicadas"])
+        if resultado["rejeitadas"]:
+            self.gravacoes_rejeitadas.emit(resultado["rejeitadas"])
+        self.pendentes_alterado.emit(resultado["restantes"])
+        if not resultado["restantes"]:
+            return
+        if resultado["aplicadas"]:
+            self.agendar(0)
+        else:
+            # Nenhuma gravação do lote foi aceita: espera antes de tentar de novo
+            self._falhas += 1
+            self.agendar(self._espera_falha())
+
+    def on_envio_falhou(self, erro):
+        self._enviando = False
+        self._falhas += 1
+        print(f"Erro ao enviar gravações pendentes: {erro}")
+        self.envio_falhou.emit(erro)
+        self.agendar(self._espera_falha())
+
+    def _registrada(self):
+        self.pendentes_alterado.emit(self.diario.quantidade_pendentes(self.destino))
+        # Uma nova gravação indica que o usuário está ativo: tenta logo, sem esperar o fim da espera por falhas
+        self._falhas = 0
+        self.timer.stop()
+        self.agendar()
+
+    def _espera_falha(self):
+        return min(self.espera_inicial_falha_ms * 2 ** (self._falhas - 1), self.espera_maxima_ms)
@@ -0,0 +1,147 @@
+import time
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from services.metricas import metricas
+
+
+class SinaisTarefa(QObject):
+    """
+    Sinais emitidos pela tarefa ao terminar, entregues na thread da interface
+    """
+    concluida = pyqtSignal(object)
+    falhou = pyqtSignal(object)
+
+
+class Tarefa(QRunnable):
+    """
+    Executa uma função em uma thread do pool, fora da thread da interface
+    """
+    def __init__(self, funcao, args, kwargs):
+        super().__init__()
+        # O executor mantém a referência até o fim, evitando que o Qt destrua o objeto
+        self.setAutoDelete(False)
+        self.funcao = funcao
+        self.args = args
+        self.kwargs = kwargs
+        self.sinais = SinaisTarefa()
+        self.criada_em = time.perf_counter()
+
+    def run(self):
+        # Tempo na fila aguardando uma thread livre
+        metricas.registrar({"operacao": "executor.fila", "duracao_ms": (time.perf_counter() - self.criada_em) * 1000})
+        try:
+            resultado = self.funcao(*self.args, **self.kwargs)
+        except Exception as e:
+            self.sinais.falhou.emit(e)
+        else:
+            self.sinais.concluida.emit(resultado)
+
+
+class ExecutorTarefas(QObject):
+    """
+    Executa chamadas ao banco de dados em segundo plano e devolve o resultado à interface.
+
+    Tarefas enviadas com a mesma `chave` substituem as anteriores: uma tarefa ainda na fila
+    é descartada e o resultado de uma tarefa já iniciada é ignorado quando chega.
+    """
+    ocupado_alterado = pyqtSignal(bool)
+
+    def __init__(self, parent=None, ao_falhar_padrao=None, max_threads=3):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self.ao_falhar_padrao = ao_falhar_padrao
+        # Geração mais recente de cada chave, usada para descartar resultados obsoletos
+        self._geracoes = {}
+        # Última tarefa enviada de cada chave, candidata a ser retirada da fila
+        self._ultimas = {}
+        self._ativas = set()
+        # Tarefas de prioridade negativa: não indicam a interface como ocupada
+        self._segundo_plano = set()
+
+    def executar(self, chave, funcao, *args, ao_concluir=None, ao_falhar=None, prioridade=0, **kwargs):
+        """
+        Agenda funcao(*args, **kwargs) no pool de threads.
+
+        :param chave: Identifica requisições que se substituem (None para nunca cancelar, ex.: gravações).
+        :param ao_concluir: Chamado na thread da interface com o resultado.
+        :param ao_falhar: Chamado na thread da interface com a exceção (padrão: ao_falhar_padrao).
+        :param prioridade: Prioridade na fila do pool. Tarefas de prioridade negativa (ex.: busca antecipada) só
+            começam quando não há outras na fila e não contam como ocupado.
+        """
+        tarefa = Tarefa(funcao, args, kwargs)
+        geracao = None
+        if chave is not None:
+            self.cancelar(chave)
+            geracao = self._geracoes[chave]
+            self._ultimas[chave] = tarefa
+
+        tarefa.sinais.concluida.connect(
+            lambda resultado: self._finalizar(tarefa, chave, geracao, ao_concluir, resultado))
+        tarefa.sinais.falhou.connect(
+            lambda erro: self._finalizar(tarefa, chave, geracao, ao_falhar or self.ao_falhar_padrao, erro))
+
+        if prioridade < 0:
+            self._segundo_plano.add(tarefa)
+        else:
+            self._adicionar(tarefa)
+        self.pool.start(tarefa, prioridade)
+        return tarefa
+
+    def cancelar(self, chave):
+        """
+        Cancela a requisição pendente da chave: sai da fila se ainda não começou,
+        e seu resultado é ignorado se já estiver em execução.
+        """
+        self._geracoes[chave] = self._geracoes.get(chave, 0) + 1
+        anterior = self._ultimas.pop(chave, None)
+        if anterior is not None and self.pool.tryTake(anterior):
+            self._remover(anterior)
+
+    def cancelar_todas(self):
+        """
+        Cancela as requisições pendentes de todas as chaves; tarefas sem chave seguem até o fim
+        """
+        for chave in list(self._geracoes):
+            self.cancelar(chave)
+
+    def ocupado(self):
+        """
+        Indica se existe alguma tarefa na fila ou em execução
+        """
+        return bool(self._ativas)
+
+    def ativa(self, tarefa):
+        """
+        Indica se a tarefa ainda está na fila ou em execução, mesmo que o seu resultado vá ser ignorado
+        """
+        return tarefa in self._ativas or tarefa in self._segundo_plano
+
+    def encerrar(self):
+        """
+        Descarta as tarefas na fila e aguarda as que estão em execução
+        """
+        self.pool.clear()
+        self.pool.waitForDone()
+
+    def _finalizar(self, tarefa, chave, geracao, callback, valor):
+        self._remover(tarefa)
+        if chave is not None:
+            if self._geracoes.get(chave) != geracao:
+                return
+            self._ultimas.pop(chave, None)
+        if callback:
+            callback(valor)
+
+    def _adicionar(self, tarefa):
+        self._ativas.add(tarefa)
+        if len(self._ativas) == 1:
+            self.ocupado_alterado.emit(True)
+
+    def _remover(self, tarefa):
+        self._segundo_plano.discard(tarefa)
+        if tarefa in self._ativas:
+            self._ativas.discard(tarefa)
+            if not self._ativas:
+                self.ocupado_alterado.emit(False)
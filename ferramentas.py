@@ -0,0 +1,95 @@
+import argparse
+import sys
+
+from services.config_service import ConfigService
+from services.publicacao_service import PublicacaoService
+from services.importacao_service import ImportacaoService
+from services.exportacao_service import ExportacaoService
+from services.slug_service import SlugService
+
+
+def criar_publicacao_service():
+    """
+    Cria o serviço de publicação a partir da conexão default
+    """
+    config_service = ConfigService()
+    default_config = config_service.get_default_connection()
+    if not default_config:
+        raise SystemExit("Nenhuma conexão foi definida como padrão !")
+    conn = config_service.get_dados_conexao(default_config)
+    return PublicacaoService(conn['host'], conn['user'], conn['password'], conn['database'], conn['port'])
+
+
+def importar(args):
+    """
+    Importa publicações de um arquivo JSONL ou de um diretório de arquivos Markdown
+    """
+    publicacao_service = criar_publicacao_service()
+    importacao_service = ImportacaoService(publicacao_service, args.lote, SlugService(publicacao_service))
+    if args.formato == "jsonl":
+        registros = importacao_service.ler_jsonl(args.origem)
+    else:
+        registros = importacao_service.ler_markdown(args.origem)
+
+    def exibir_progresso(relatorio):
+        print(f"Processados: {relatorio['processados']}  Importados: {relatorio['importados']}  Erros: {len(relatorio['erros'])}")
+
+    relatorio = importacao_service.importar(registros, exibir_progresso)
+    for origem, erros in relatorio["erros"]:
+        print(f"{origem}: {' '.join(erros)}", file=sys.stderr)
+    return 1 if relatorio["erros"] else 0
+
+
+def exportar(args):
+    """
+    Exporta as publicações para JSONL, CSV ou arquivos Markdown
+    """
+    exportacao_service = ExportacaoService(criar_publicacao_service())
+
+    def exibir_progresso(quantidade, ultimo_id):
+        print(f"Exportados: {quantidade}  Último id: {ultimo_id}")
+
+    exportacao_service.exportar(args.destino, args.formato, args.gzip, args.retomar, exibir_progresso)
+    return 0
+
+
+def verificar_urls(args):
+    """
+    Verifica (ou gera novamente a partir dos títulos) as URLs de todas as publicações
+    """
+    slug_service = SlugService(criar_publicacao_service())
+    resultado = slug_service.verificar_todas(args.regenerar, args.gravar)
+    for alteracao in resultado["alteracoes"]:
+        print(f"{alteracao['id']}: {alteracao['url']!r} -> {alteracao['nova_url']!r} ({alteracao['motivo']})")
+    print(f"Verificadas: {resultado['verificadas']}  Alteradas: {len(resultado['alteracoes'])}  Gravadas: {resultado['gravadas']}")
+    return 1 if resultado["alteracoes"] and not args.gravar else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ferramentas de linha de comando do Blog Desktop")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    parser_importar = subparsers.add_parser("importar", help="Importa publicações em lote")
+    parser_importar.add_argument("formato", choices=["jsonl", "markdown"], help="Formato da origem")
+    parser_importar.add_argument("origem", help="Arquivo JSONL ou diretório com arquivos .md")
+    parser_importar.add_argument("--lote", type=int, default=500, help="Publicações por INSERT/commit (padrão 500)")
+    parser_importar.set_defaults(funcao=importar)
+
+    parser_exportar = subparsers.add_parser("exportar", help="Exporta as publicações")
+    parser_exportar.add_argument("formato", choices=ExportacaoService.FORMATOS, help="Formato da saída")
+    parser_exportar.add_argument("destino", help="Arquivo de saída (jsonl/csv) ou diretório (markdown)")
+    parser_exportar.add_argument("--gzip", action="store_true", help="Compacta a saída com gzip")
+    parser_exportar.add_argument("--retomar", action="store_true", help="Continua a partir do último id exportado")
+    parser_exportar.set_defaults(funcao=exportar)
+
+    parser_urls = subparsers.add_parser("urls", help="Verifica as URLs de todas as publicações")
+    parser_urls.add_argument("--regenerar", action="store_true", help="Gera novamente todas as URLs a partir dos títulos")
+    parser_urls.add_argument("--gravar", action="store_true", help="Grava as URLs corrigidas (sem ele apenas as lista)")
+    parser_urls.set_defaults(funcao=verificar_urls)
+
+    args = parser.parse_args()
+    sys.exit(args.funcao(args))
+
+
+if __name__ == "__main__":
+    main()
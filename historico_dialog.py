@@ -0,0 +1,122 @@
+from PyQt5.QtWidgets import QDialog, QMessageBox, QTableWidgetItem
+from PyQt5.QtCore import Qt
+from carregador_ui import carregar_ui
+
+COLUNAS = ["Revisão", "Data", "Tamanho do texto", "Armazenado (bytes)", "Tipo"]
+
+
+class HistoricoDialog(QDialog):
+    """
+    Janela de Histórico: lista as revisões de uma publicação, exibe as alterações de cada uma
+    e permite restaurar uma revisão
+    """
+    def __init__(self, revisao_service, id_publicacao, executor, parent=None, titulo_service=None,
+                 obter_alteracoes_pendentes=None):
+        """
+        :param revisao_service: RevisaoService da conexão atual.
+        :param executor: ExecutorTarefas da janela principal, para as consultas em segundo plano.
+        :param titulo_service: TituloService usado para verificar o título da revisão a restaurar.
+        :param obter_alteracoes_pendentes: Função que retorna as alterações da publicação ainda no diário de gravações.
+        """
+        super().__init__(parent)
+        carregar_ui(self, "historico.ui")
+        self.setFixedSize(self.width(), self.height())
+        self.revisao_service = revisao_service
+        self.id_publicacao = id_publicacao
+        self.executor = executor
+        self.titulo_service = titulo_service
+        self.obter_alteracoes_pendentes = obter_alteracoes_pendentes
+        # Restauração escolhida ({'titulo', 'anterior', 'alteracoes'}), salva pela janela principal após o fechamento
+        self.restauracao = None
+
+        self.tblRevisoes.setColumnCount(len(COLUNAS))
+        self.tblRevisoes.setHorizontalHeaderLabels(COLUNAS)
+        self.tblRevisoes.itemSelectionChanged.connect(self.on_tblRevisoes_selecao)
+        self.btnRestaurar.clicked.connect(self.on_btnRestaurar_Click)
+        self.btnFechar.clicked.connect(self.reject)
+        self.btnRestaurar.setEnabled(False)
+
+        self.executor.executar(
+            "historico",
+            self.revisao_service.listar_revisoes,
+            self.id_publicacao,
+            ao_concluir=self.preencher_revisoes)
+
+    def preencher_revisoes(self, revisoes):
+        """
+        Preenche a tabela com as revisões, da mais recente para a mais antiga
+        """
+        self.tblRevisoes.setRowCount(len(revisoes))
+        for linha, revisao in enumerate(revisoes):
+            valores = [
+                str(revisao['numero']),
+                revisao['criada_em'].strftime('%d/%m/%Y %H:%M:%S'),
+                str(revisao['tamanho_texto']),
+                str(revisao['bytes']),
+                "Completa" if revisao['snapshot'] else "Diferença"
+            ]
+            for coluna, valor in enumerate(valores):
+                item = QTableWidgetItem(valor)
+                item.setData(Qt.UserRole, revisao['numero'])
+                self.tblRevisoes.setItem(linha, coluna, item)
+        self.tblRevisoes.resizeColumnsToContents()
+        if not revisoes:
+            self.txtDiferencas.setPlainText("Nenhuma revisão registrada para esta publicação.")
+
+    def numero_selecionado(self):
+        itens = self.tblRevisoes.selectedItems()
+        return itens[0].data(Qt.UserRole) if itens else None
+
+    def on_tblRevisoes_selecao(self):
+        """
+        Exibe as alterações da revisão selecionada em relação à anterior
+        """
+        numero = self.numero_selecionado()
+        self.btnRestaurar.setEnabled(numero is not None)
+        if numero is None:
+            return
+        self.txtDiferencas.setPlainText("Carregando...")
+        self.executor.executar(
+            "historico",
+            self.revisao_service.comparar_revisoes,
+            self.id_publicacao,
+            numero - 1 if numero > 1 else None,
+            numero,
+            ao_concluir=lambda diferencas: self.txtDiferencas.setPlainText(diferencas or "Sem alterações."))
+
+    def on_btnRestaurar_Click(self):
+        """
+        Click botão btnRestaurar
+        """
+        numero = self.numero_selecionado()
+        if numero is None:
+            return
+        resposta = QMessageBox.question(
+            self,
+            "Restaurar Revisão",
+            f"Restaurar a revisão {numero}? A versão atual continuará disponível no histórico.")
+        if resposta != QMessageBox.Yes:
+            return
+        self.btnRestaurar.setEnabled(False)
+        pendentes = self.obter_alteracoes_pendentes(self.id_publicacao) if self.obter_alteracoes_pendentes else None
+        self.executor.executar(
+            None,
+            self.revisao_service.preparar_restauracao,
+            self.id_publicacao,
+            numero,
+            pendentes,
+            self.titulo_service,
+            ao_concluir=self.on_restauracao_preparada,
+            ao_falhar=self.on_restauracao_falhou)
+
+    def on_restauracao_preparada(self, restauracao):
+        self.restauracao = restauracao
+        self.accept()
+
+    def on_restauracao_falhou(self, erro):
+        self.btnRestaurar.setEnabled(True)
+        if isinstance(erro, ValueError):
+            # Revisão inexistente ou título já utilizado: não é uma falha de acesso ao banco
+            QMessageBox.warning(self, "Restaurar Revisão", str(erro))
+            return
+        self.executor.ao_falhar_padrao(erro)
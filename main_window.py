@@ -1,14 +1,100 @@
-from PyQt5.QtWidgets import QApplication, QMainWindow, QMessageBox
-from config_dialog import ConfigDialog
-from PyQt5.uic import loadUi
+import time
+# Marca o início da execução para medir o tempo até a primeira pintura da janela
+INICIO_EXECUCAO = time.perf_counter()
+
+from PyQt5.QtWidgets import QApplication, QMainWindow, QMessageBox, QProgressBar, QCompleter, QLabel, QShortcut
+from PyQt5.QtGui import QStandardItemModel, QStandardItem, QKeySequence
+from PyQt5.QtCore import Qt, QTimer, QModelIndex, QStringListModel
+import os
 import sys
-import re
-from datetime import datetime
-from unidecode import unidecode
+import sqlite3
+import zlib
+from collections import OrderedDict
+from datetime import date, datetime
 
+from carregador_ui import carregar_ui
 from enumScreenState import EnumScreenState
+from executor_tarefas import ExecutorTarefas
+from titulos_model import TitulosModel
+from prefetch_publicacoes import PrefetchPublicacoes
+from envio_gravacoes import EnvioGravacoes
 from services.config_service import ConfigService
-from services.publicacao_service import PublicacaoService
+from services.titulo_service import TituloService
+from services.tag_service import TagService, separar_tags, chave_tag
+from services.cache_publicacoes import CachePublicacoes
+from services.validacao_service import ValidacaoService
+from services.metricas import metricas, instrumentar
+from services.diario_gravacoes import DiarioGravacoes, obter_destino
+from services.rascunho_service import RascunhoService
+from services.slug_service import SlugService, gerar_slug
+
+# Número máximo de conexões simultâneas com o MySQL
+TAMANHO_POOL_CONEXOES = 3
+# Consultas frequentes com comandos preparados no servidor e a extensão C do mysql-connector
+CONSULTAS_PREPARADAS = True
+# Quantidade de títulos buscados por página na combo de títulos publicados
+TAMANHO_PAGINA_TITULOS = 200
+# Pesquisa: espera após a digitação e quantidade de resultados exibidos
+ESPERA_PESQUISA_MS = 300
+LIMITE_RESULTADOS_PESQUISA = 20
+# Prefixo da pesquisa que lista as publicações de uma tag (ex.: "tag:python")
+PREFIXO_PESQUISA_TAG = "tag:"
+# Quantidade de tags sugeridas ao digitar no campo de tags
+LIMITE_SUGESTOES_TAGS = 10
+# Espera após a digitação do título para gerar a URL da nova publicação
+ESPERA_URL_MS = 150
+# Espera após a digitação para validar o campo alterado
+ESPERA_VALIDACAO_MS = 250
+ESTILO_CAMPO_INVALIDO = "border: 1px solid #c0392b;"
+# Cache local das publicações lidas (memória e um arquivo SQLite por base, ver arquivo_cache_publicacoes)
+LIMITE_CACHE_MEMORIA = 32 * 1024 * 1024
+ARQUIVO_CACHE_PUBLICACOES = "database/cache_publicacoes.db"
+# Conexões (com os seus caches) mantidas abertas após a troca da conexão default, para voltar a elas sem reconectar
+CONEXOES_AQUECIDAS = 1
+# Conexão com o MySQL: espera pelo servidor e novas tentativas com espera crescente (1s, 2s, 4s, ...)
+TIMEOUT_CONEXAO_S = 10
+MAX_TENTATIVAS_CONEXAO = 5
+ESPERA_INICIAL_RECONEXAO_MS = 1000
+ESPERA_MAXIMA_RECONEXAO_MS = 30000
+# Diário local das gravações (SQLite), enviadas ao MySQL em segundo plano em lotes de até TAMANHO_LOTE_GRAVACOES
+ARQUIVO_DIARIO_GRAVACOES = "database/diario_gravacoes.db"
+TAMANHO_LOTE_GRAVACOES = 50
+ESPERA_ENVIO_GRAVACOES_MS = 200
+# Rascunho da publicação em edição, salvo localmente após uma pausa na edição
+ARQUIVO_RASCUNHOS = "database/rascunhos.db"
+ESPERA_RASCUNHO_MS = 2000
+# Histórico: quantidade de revisões entre duas cópias completas do texto
+INTERVALO_SNAPSHOT_REVISOES = 10
+# Texto das publicações: tamanho de cada parte buscada e inserida no editor, e limite da prévia em modo de
+# leitura (acima dele o restante só é carregado pelo botão "Texto completo"; None exibe sempre o texto inteiro)
+TAMANHO_BLOCO_TEXTO = 256 * 1024
+LIMITE_PREVIA_TEXTO = 1024 * 1024
+# Métricas de latência: atualização da barra de status e log opcional (JSON Lines) indicado pela variável de ambiente
+INTERVALO_METRICAS_MS = 2000
+ARQUIVO_LOG_METRICAS = os.environ.get("BLOG_DESKTOP_LOG_METRICAS")
+
+# Papel do item de resultado que guarda o título (texto inserido na caixa ao escolher um resultado)
+PAPEL_TITULO_PESQUISA = Qt.UserRole + 1
+
+def criar_publicacao_service(conn, cache):
+    """
+    Cria o serviço de publicação; executado fora da thread da interface, pois a conexão pode demorar
+    """
+    # Importado sob demanda: mysql.connector é o módulo mais pesado da inicialização
+    from services.publicacao_service import PublicacaoService
+
+    return PublicacaoService(conn['host'], conn['user'], conn['password'], conn['database'], conn['port'],
+                             TAMANHO_POOL_CONEXOES, cache, TIMEOUT_CONEXAO_S, CONSULTAS_PREPARADAS)
+
+def arquivo_cache_publicacoes(destino):
+    """
+    Arquivo do cache local das publicações de uma base (obter_destino): os ids só identificam
+    as publicações dentro da mesma base
+    """
+    if not ARQUIVO_CACHE_PUBLICACOES:
+        return None
+    raiz, extensao = os.path.splitext(ARQUIVO_CACHE_PUBLICACOES)
+    return f"{raiz}_{zlib.crc32(destino.encode('utf-8')):08x}{extensao}"
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -18,28 +104,175 @@ class MainWindow(QMainWindow):
         self.default_config = None
         # Classe de serviço de publicação
         self.publicacao_service = None
+        # Verificação de títulos já utilizados
+        self.titulo_service = None
+        # Sugestão de tags (índice de prefixos)
+        self.tag_service = None
+        # URLs únicas geradas a partir dos títulos
+        self.slug_service = None
+        # Histórico de revisões das publicações
+        self.revisao_service = None
+        # Cache local das publicações lidas da base atual, criado ao conectar
+        self.cache_publicacoes = None
+        # Conexões anteriores mantidas abertas: {tipo: (dados da conexão, PublicacaoService, TituloService, TagService)}
+        self.conexoes_aquecidas = OrderedDict()
+        # Gravações salvas localmente e ainda não enviadas ao MySQL
+        self.diario_gravacoes = DiarioGravacoes(ARQUIVO_DIARIO_GRAVACOES)
+        # Rascunho da publicação em edição; revisão do documento cujo texto já está no rascunho
+        self.rascunho_service = RascunhoService(ARQUIVO_RASCUNHOS)
+        self.revisao_texto_rascunho = None
+        # Rascunho aplicado quando o texto da publicação terminar de carregar
+        self.rascunho_a_restaurar = None
+        self.rascunho_oferecido = False
         self.current_state = None
+        self.tempo_primeira_pintura = None
+        # Publicação exibida ou em edição
+        self.id_publicacao_atual = None
+        # Tentativa atual de conexão com o MySQL
+        self.tentativa_conexao = 0
+        # Incrementada ao desconectar: identifica as tentativas de conexão que já não valem para a tela
+        self.geracao_conexao = 0
+        # Texto da publicação sendo carregado em partes no editor
+        self.carregamento_texto = None
+        # Valores da publicação em edição como foram carregados, para gravar apenas os campos alterados
+        self.publicacao_original = None
                 
         super().__init__()
-        loadUi("principal.ui", self)
+        carregar_ui(self, "principal.ui")
         self.setFixedSize(self.width(), self.height())  
 
+        # Execução das consultas ao banco fora da thread da interface
+        self.executor = ExecutorTarefas(self, ao_falhar_padrao=self.on_tarefa_falhou)
+        self.executor.ocupado_alterado.connect(self.on_executor_ocupado)
+        self.prgOcupado = QProgressBar()
+        self.prgOcupado.setRange(0, 0)
+        self.prgOcupado.setMaximumWidth(120)
+        self.prgOcupado.setVisible(False)
+        self.statusbar.addPermanentWidget(self.prgOcupado)
+
+        # Latência das consultas na barra de status; F12 abre o diagnóstico completo
+        if ARQUIVO_LOG_METRICAS:
+            metricas.configurar_log(ARQUIVO_LOG_METRICAS)
+        self.lblMetricas = QLabel()
+        self.lblMetricas.setToolTip("Latência recente: consultas ao banco, espera por conexão e preenchimento da tela (F12: diagnóstico)")
+        self.statusbar.addPermanentWidget(self.lblMetricas)
+        self.chamadas_exibidas = 0
+        self.timer_metricas = QTimer(self)
+        self.timer_metricas.timeout.connect(self.exibir_metricas)
+        self.timer_metricas.start(INTERVALO_METRICAS_MS)
+        self.atalho_diagnostico = QShortcut(QKeySequence("F12"), self)
+        self.atalho_diagnostico.activated.connect(self.on_atalho_diagnostico)
+
+        # Envio das gravações do diário ao MySQL, com a quantidade pendente na barra de status
+        self.envio_gravacoes = EnvioGravacoes(
+            self.diario_gravacoes,
+            self.executor,
+            lambda: self.publicacao_service,
+            lambda: self.revisao_service,
+            TAMANHO_LOTE_GRAVACOES,
+            ESPERA_ENVIO_GRAVACOES_MS,
+            ESPERA_INICIAL_RECONEXAO_MS,
+            ESPERA_MAXIMA_RECONEXAO_MS,
+            self)
+        self.envio_gravacoes.gravacoes_aplicadas.connect(self.on_gravacoes_aplicadas)
+        self.envio_gravacoes.gravacoes_rejeitadas.connect(self.on_gravacoes_rejeitadas)
+        self.envio_gravacoes.pendentes_alterado.connect(self.on_gravacoes_pendentes_alterado)
+        self.envio_gravacoes.envio_falhou.connect(self.on_envio_gravacoes_falhou)
+        self.lblGravacoes = QLabel()
+        self.lblGravacoes.setToolTip("Gravações salvas neste computador e ainda não enviadas ao banco de dados")
+        self.lblGravacoes.setVisible(False)
+        self.statusbar.addPermanentWidget(self.lblGravacoes)
+
+        # Títulos publicados carregados em páginas, conforme a lista é rolada
+        self.titulos_model = TitulosModel(
+            self.executor,
+            lambda: self.publicacao_service,
+            TAMANHO_PAGINA_TITULOS,
+            self)
+        self.titulos_model.pagina_carregada.connect(self.on_titulos_pagina_carregada)
+        self.titulos_model.titulos_alterados.connect(self.on_titulos_alterados)
+        self.cboTitulosPublicados.setModel(self.titulos_model)
+
+        # Busca antecipada da publicação destacada na combo e de suas vizinhas
+        self.prefetch = PrefetchPublicacoes(self.executor, lambda: self.publicacao_service, parent=self)
+        self.cboTitulosPublicados.highlighted[int].connect(self.on_cboTitulosPublicados_destacado)
+        self.cboTitulosPublicados.currentIndexChanged[int].connect(self.on_cboTitulosPublicados_destacado)
+
+        # Pesquisa no índice FULLTEXT, com os resultados em uma lista suspensa
+        self.resultados_pesquisa = QStandardItemModel(self)
+        self.completer_pesquisa = QCompleter(self.resultados_pesquisa, self)
+        self.completer_pesquisa.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.completer_pesquisa.setCompletionRole(PAPEL_TITULO_PESQUISA)
+        self.completer_pesquisa.activated[QModelIndex].connect(self.on_resultado_pesquisa_activated)
+        self.txtPesquisa.setCompleter(self.completer_pesquisa)
+        self.timer_pesquisa = QTimer(self)
+        self.timer_pesquisa.setSingleShot(True)
+        self.timer_pesquisa.setInterval(ESPERA_PESQUISA_MS)
+        self.timer_pesquisa.timeout.connect(self.pesquisar_publicacoes)
+        self.txtPesquisa.textEdited.connect(self.on_txtPesquisa_editado)
+
+        # Sugestão das tags já usadas, a partir da parte digitada após a última vírgula
+        self.sugestoes_tags = QStringListModel(self)
+        self.completer_tags = QCompleter(self.sugestoes_tags, self)
+        self.completer_tags.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.txtTagsPublicacao.setCompleter(self.completer_tags)
+        self.txtTagsPublicacao.textEdited.connect(self.on_txtTagsPublicacao_editado)
+
+        # Validação incremental: apenas os campos alterados são validados, após uma pausa na digitação
+        self.campos_validacao = {
+            "titulo": self.txtTituloPublicacao,
+            "id_tipopublicacao": self.cboTipoPublicacao,
+            "tags": self.txtTagsPublicacao,
+            "texto": self.txtTextoPublicacao,
+            "image_link": self.txtLinkImagem
+        }
+        self.campos_pendentes_validacao = set()
+        self.timer_validacao = QTimer(self)
+        self.timer_validacao.setSingleShot(True)
+        self.timer_validacao.setInterval(ESPERA_VALIDACAO_MS)
+        self.timer_validacao.timeout.connect(self.validar_campos_pendentes)
+        self.txtTituloPublicacao.textEdited.connect(lambda: self.agendar_validacao("titulo"))
+        self.cboTipoPublicacao.activated.connect(lambda: self.agendar_validacao("id_tipopublicacao"))
+        self.txtTagsPublicacao.textEdited.connect(lambda: self.agendar_validacao("tags"))
+        self.txtTextoPublicacao.textChanged.connect(lambda: self.agendar_validacao("texto"))
+        self.txtLinkImagem.textEdited.connect(lambda: self.agendar_validacao("image_link"))
+
+        # Rascunho: salvo após ESPERA_RASCUNHO_MS sem edições
+        self.timer_rascunho = QTimer(self)
+        self.timer_rascunho.setSingleShot(True)
+        self.timer_rascunho.setInterval(ESPERA_RASCUNHO_MS)
+        self.timer_rascunho.timeout.connect(self.salvar_rascunho)
+        for sinal in (self.txtTituloPublicacao.textEdited, self.cboTipoPublicacao.activated, self.txtTagsPublicacao.textEdited,
+                      self.txtTextoPublicacao.textChanged, self.txtLinkImagem.textEdited, self.chkPublicacaoAtiva.clicked):
+            sinal.connect(self.agendar_rascunho)
+
         self.btnLerPublicacao.clicked.connect(self.on_btnLerPublicacao_Click)
         self.btnEditarPublicacao.clicked.connect(self.on_btnEditarPublicacao_Click)
         self.btnNovaPublicacao.clicked.connect(self.on_btnNovaPublicacao_Click)
         self.btnConfiguracoes.clicked.connect(self.on_btnConfiguracoes_Click)
         self.btnSalvarPublicacao.clicked.connect(self.on_btnSalvarPublicacao_Click)
         self.btnCancelar.clicked.connect(self.on_btnCancelar_Click)
+        self.btnTextoCompleto.clicked.connect(self.on_btnTextoCompleto_Click)
+        self.btnHistorico.clicked.connect(self.on_btnHistorico_Click)
         self.cboTipoPublicacao.currentIndexChanged.connect(self.on_cboTipoPublicacao_changed)
         self.txtTituloPublicacao.textChanged.connect(self.on_txtTituloPublicacao_textChanged)
+
+        # URL da nova publicação: gerada a partir do título após uma pausa na digitação
+        self.timer_url = QTimer(self)
+        self.timer_url.setSingleShot(True)
+        self.timer_url.setInterval(ESPERA_URL_MS)
+        self.timer_url.timeout.connect(self.atualizar_url)
+
+        # Nova tentativa de conexão após uma falha
+        self.timer_reconexao = QTimer(self)
+        self.timer_reconexao.setSingleShot(True)
+        self.timer_reconexao.timeout.connect(self.conectar_publicacao_service)
         
+        # A janela é exibida imediatamente; a conexão com o MySQL é feita em segundo plano
+        self.mudar_estado_tela(EnumScreenState.DESCONECTADO)
         self.default_config = self.config_service.get_default_connection()
         if self.default_config:
-            self.exibir_status_conexao(f"Conectado em {self.default_config['url']} como {self.default_config['username']}")
-            self.obter_dados_conexao()
-            self.obter_titulos_publicados()
-            self.obter_tipos_publicacao()
-            self.mudar_estado_tela(EnumScreenState.INICIAL)
+            self.conectar_publicacao_service()
         else:
             self.exibir_mensagem_alerta("Nenhuma conexão foi definida como padrão !")
             
@@ -47,6 +280,7 @@ class MainWindow(QMainWindow):
         """
         Limpa os campos da tela
         """
+        self.id_publicacao_atual = None
         self.cboTitulosPublicados.setCurrentIndex(-1)
         self.cboTipoPublicacao.setCurrentIndex(-1)
         self.txtTituloPublicacao.setText("")
@@ -63,10 +297,14 @@ class MainWindow(QMainWindow):
         Habilita ou desabilita controles de acordo com o parâmetro state
         """
         self.current_state = state
+        if state in (EnumScreenState.INICIAL, EnumScreenState.NOVO, EnumScreenState.DESCONECTADO):
+            self.cancelar_carregamento_texto()
         match state:
             case EnumScreenState.INICIAL:
+                self.id_publicacao_atual = None
                 self.cboTitulosPublicados.setCurrentIndex(-1)
                 self.cboTitulosPublicados.setEnabled(True)
+                self.txtPesquisa.setEnabled(True)
                 self.cboTipoPublicacao.setCurrentIndex(-1)
                 self.cboTipoPublicacao.setEnabled(False)
                 
@@ -89,6 +327,7 @@ class MainWindow(QMainWindow):
                 self.btnNovaPublicacao.setEnabled(True)
                 self.btnSalvarPublicacao.setEnabled(False)
                 self.btnConfiguracoes.setEnabled(True)
+                self.btnHistorico.setEnabled(False)
                 self.btnCancelar.setEnabled(False)
                 
                 self.btnLerPublicacao.setEnabled(True)
@@ -116,6 +355,7 @@ class MainWindow(QMainWindow):
                 self.btnSalvarPublicacao.setEnabled(True)
                 self.btnCancelar.setEnabled(True)
                 self.btnConfiguracoes.setEnabled(False)
+                self.btnHistorico.setEnabled(False)
                 
                 self.btnLerPublicacao.setEnabled(False)
                 self.btnEditarPublicacao.setEnabled(False)
@@ -143,11 +383,32 @@ class MainWindow(QMainWindow):
                 self.btnNovaPublicacao.setEnabled(False)
                 self.btnSalvarPublicacao.setEnabled(True)
                 self.btnConfiguracoes.setEnabled(False)
+                self.btnHistorico.setEnabled(False)
                 self.btnCancelar.setEnabled(True)
                 
                 self.btnLerPublicacao.setEnabled(False)
                 self.btnEditarPublicacao.setEnabled(False)
                 
+            case EnumScreenState.DESCONECTADO:
+                self.cboTitulosPublicados.setEnabled(False)
+                self.cboTipoPublicacao.setEnabled(False)
+                self.txtPesquisa.setEnabled(False)
+                
+                self.txtTituloPublicacao.setEnabled(False)
+                self.txtTagsPublicacao.setEnabled(False)
+                self.chkPublicacaoAtiva.setEnabled(False)
+                self.txtLinkImagem.setEnabled(False)
+                self.txtTextoPublicacao.setEnabled(False)
+                
+                self.btnNovaPublicacao.setEnabled(False)
+                self.btnSalvarPublicacao.setEnabled(False)
+                self.btnCancelar.setEnabled(False)
+                self.btnConfiguracoes.setEnabled(True)
+                self.btnHistorico.setEnabled(False)
+                
+                self.btnLerPublicacao.setEnabled(False)
+                self.btnEditarPublicacao.setEnabled(False)
+                
             case EnumScreenState.VISUALIZAR:
                 self.cboTitulosPublicados.setEnabled(True)
                 self.cboTipoPublicacao.setEnabled(False)
@@ -170,112 +431,373 @@ class MainWindow(QMainWindow):
                 self.btnSalvarPublicacao.setEnabled(False)
                 self.btnCancelar.setEnabled(False)
                 self.btnConfiguracoes.setEnabled(True)
+                self.btnHistorico.setEnabled(True)
                 
                 self.btnLerPublicacao.setEnabled(True)
                 self.btnEditarPublicacao.setEnabled(True)
+
+        # Alterações feitas pelo próprio programa ao trocar de estado não são validadas
+        self.limpar_validacao()
         
     def obter_dados_conexao(self):
         """
         Retorna um dicionário com os dados da conexão default
         """
-        url = self.default_config["url"]
-        url = url.replace("jdbc:mysql://", "")
-        
-        # Dividindo a URL em servidor/porta e banco de dados
-        server, rest = url.split(':', 1)
-        port, database = rest.split('/', 1)
-        port = int(port)
-        
-        return {
-            "host": server,
-            "port": port,
-            "database": database,
-            "user": self.default_config['username'],
-            "password": self.default_config['password']
-        }
+        return self.config_service.get_dados_conexao(self.default_config)
         
     def exibir_publicacao(self, id_publicacao):
         """
         Apenas exibe valores para os campos dado o parâmetro id_publicacao
         """
-        result = self.publicacao_service.get_publicacao_by_id(id_publicacao)
+        self.rascunho_a_restaurar = None
+        self.cancelar_carregamento_texto()
+        self.executor.executar(
+            "publicacao",
+            self.publicacao_service.get_metadados_publicacao,
+            id_publicacao,
+            ao_concluir=self.on_publicacao_exibir_carregada)
+
+    def on_publicacao_exibir_carregada(self, result):
+        """
+        Preenche os campos em modo de leitura após a consulta em segundo plano
+        """
         if result:
-            index = self.cboTipoPublicacao.findData(result['id_tipopublicacao'])
-            if index != -1:
-                self.cboTipoPublicacao.setCurrentIndex(index)
-            self.txtTituloPublicacao.setText(result['titulo'])
-            self.txtTagsPublicacao.setText(result['tags'])
-            self.txtURLPublicacao.setText(result['url'])
-            self.txtPublicadoEm.setText(result['data_publicacao'].strftime('%d/%m/%Y'))
-            if not result['data_revisao'] is None:
-                self.txtRevisadoEm.setText(result['data_revisao'].strftime('%d/%m/%Y'))
-            self.chkPublicacaoAtiva.setChecked(result['ativo'] == 1)
-            if not result['image_link'] is None:
-                self.txtLinkImagem.setText(result['image_link'])
-            self.txtTextoPublicacao.setPlainText(result['texto'])
+            result = self.aplicar_gravacoes_pendentes(result)
+            self.preencher_campos(result)
             self.mudar_estado_tela(EnumScreenState.VISUALIZAR)
+            self.carregar_texto(result, LIMITE_PREVIA_TEXTO)
         
     def editar_publicacao(self, id_publicacao):
         """
         Após selecionado um item da combo de títulos publicados, recebe o id_publicacao como parâmetro e carrega os campos para edição
         """
-        result = self.publicacao_service.get_publicacao_by_id(id_publicacao)
-        if result:
-            index = self.cboTipoPublicacao.findData(result['id_tipopublicacao'])
-            if index != -1:
-                self.cboTipoPublicacao.setCurrentIndex(index)
-            self.txtTituloPublicacao.setText(result['titulo'])
-            self.txtTagsPublicacao.setText(result['tags'])
-            self.txtURLPublicacao.setText(result['url'])
-            self.txtPublicadoEm.setText(result['data_publicacao'].strftime('%d/%m/%Y'))
-            if not result['data_revisao'] is None:
-                self.txtRevisadoEm.setText(result['data_revisao'].strftime('%d/%m/%Y'))
-            self.chkPublicacaoAtiva.setChecked(result['ativo'] == 1)
-            if not result['image_link'] is None:
-                self.txtLinkImagem.setText(result['image_link'])
-            self.txtTextoPublicacao.setPlainText(result['texto'])
-            self.mudar_estado_tela(EnumScreenState.SELECIONADO)
-            self.cboTipoPublicacao.setFocus()
+        self.cancelar_carregamento_texto()
+        self.executor.executar(
+            "publicacao",
+            self.publicacao_service.get_metadados_publicacao,
+            id_publicacao,
+            ao_concluir=self.on_publicacao_editar_carregada,
+            ao_falhar=self.on_publicacao_editar_falhou)
+
+    def on_publicacao_editar_carregada(self, result):
+        """
+        Preenche os campos para edição após a consulta em segundo plano
+        """
+        if not result:
+            # Publicação excluída: o rascunho dela não tem onde ser aplicado
+            self.rascunho_a_restaurar = None
+            return
+        result = self.aplicar_gravacoes_pendentes(result)
+        self.revisao_texto_rascunho = None
+        self.preencher_campos(result)
+        self.publicacao_original = {
+            "titulo": result['titulo'],
+            "id_tipopublicacao": result['id_tipopublicacao'],
+            "tags": result['tags'],
+            "ativo": result['ativo'],
+            "image_link": result['image_link'] or "",
+            "texto": None
+        }
+        self.mudar_estado_tela(EnumScreenState.SELECIONADO)
+        # Na edição o texto é sempre carregado por inteiro, para não salvar uma prévia
+        self.carregar_texto(result, None)
+        self.cboTipoPublicacao.setFocus()
+
+    def on_publicacao_editar_falhou(self, erro):
+        """
+        Falha ao carregar a publicação para edição: o rascunho a restaurar nela é abandonado
+        """
+        self.rascunho_a_restaurar = None
+        self.on_tarefa_falhou(erro)
+
+    def aplicar_gravacoes_pendentes(self, publicacao):
+        """
+        Sobrepõe aos dados lidos do banco as alterações já salvas no diário e ainda não enviadas
+        """
+        alteracoes = self.envio_gravacoes.alteracoes_pendentes(publicacao['id'])
+        if not alteracoes:
+            return publicacao
+        publicacao = dict(publicacao, **alteracoes)
+        if "texto" in alteracoes:
+            publicacao['tamanho_texto'] = len(alteracoes['texto'])
+        return publicacao
+
+    @instrumentar
+    def preencher_campos(self, result):
+        """
+        Preenche os campos da tela com os dados de uma publicação; o texto é carregado depois, por carregar_texto
+        """
+        self.id_publicacao_atual = result['id']
+        index = self.cboTipoPublicacao.findData(result['id_tipopublicacao'])
+        if index != -1:
+            self.cboTipoPublicacao.setCurrentIndex(index)
+        self.txtTituloPublicacao.setText(result['titulo'])
+        self.txtTagsPublicacao.setText(result['tags'])
+        self.txtURLPublicacao.setText(result['url'])
+        self.txtPublicadoEm.setText(result['data_publicacao'].strftime('%d/%m/%Y'))
+        # Campos opcionais são limpos para não manter o valor da publicação exibida anteriormente
+        self.txtRevisadoEm.setText("" if result['data_revisao'] is None else result['data_revisao'].strftime('%d/%m/%Y'))
+        self.chkPublicacaoAtiva.setChecked(result['ativo'] == 1)
+        self.txtLinkImagem.setText(result['image_link'] or "")
+        self.txtTextoPublicacao.setPlainText("")
+
+    def carregar_texto(self, publicacao, limite):
+        """
+        Carrega o texto da publicação no editor em partes de TAMANHO_BLOCO_TEXTO, buscadas uma a uma no banco
+        (ou recortadas do texto já em cache), sem travar a interface com textos de vários megabytes.
+
+        :param publicacao: Metadados retornados por get_metadados_publicacao.
+        :param limite: Quantidade máxima de caracteres exibidos (None para o texto inteiro).
+        """
+        self.carregamento_texto = {
+            "publicacao": publicacao,
+            "texto": publicacao.get('texto'),
+            "partes": [],
+            "carregados": 0,
+            "limite": limite
+        }
+        self.btnTextoCompleto.setVisible(False)
+        # Enquanto o texto não estiver completo ele não pode ser editado nem salvo
+        self.txtTextoPublicacao.setReadOnly(True)
+        self.txtTextoPublicacao.document().setUndoRedoEnabled(False)
+        self.btnSalvarPublicacao.setEnabled(False)
+        self.carregar_proximo_bloco_texto()
+
+    def carregar_proximo_bloco_texto(self):
+        """
+        Solicita a próxima parte do texto ou conclui o carregamento
+        """
+        carregamento = self.carregamento_texto
+        total = carregamento["publicacao"]['tamanho_texto'] or 0
+        fim = total if carregamento["limite"] is None else min(total, carregamento["limite"])
+        if carregamento["carregados"] >= fim:
+            self.concluir_carregamento_texto()
+            return
+
+        inicio = carregamento["carregados"]
+        tamanho = min(TAMANHO_BLOCO_TEXTO, fim - inicio)
+        if carregamento["texto"] is not None:
+            # Texto já em memória: inserido em partes, devolvendo o controle à interface entre elas
+            bloco = carregamento["texto"][inicio:inicio + tamanho]
+            QTimer.singleShot(0, lambda: carregamento is self.carregamento_texto and self.on_bloco_texto_carregado(bloco))
+        else:
+            self.executor.executar(
+                "texto_publicacao",
+                self.publicacao_service.get_trecho_texto,
+                carregamento["publicacao"]['id'],
+                inicio,
+                tamanho,
+                ao_concluir=self.on_bloco_texto_carregado,
+                ao_falhar=self.on_bloco_texto_falhou)
+
+    def on_bloco_texto_carregado(self, bloco):
+        """
+        Acrescenta ao final do editor uma parte do texto
+        """
+        carregamento = self.carregamento_texto
+        if carregamento is None:
+            return
+        if not bloco:
+            # O texto diminuiu desde a leitura dos metadados: termina no que foi lido
+            carregamento["publicacao"]['tamanho_texto'] = carregamento["carregados"]
+        else:
+            cursor = self.txtTextoPublicacao.textCursor()
+            cursor.movePosition(cursor.End)
+            # Sem textChanged: o texto carregado não é uma alteração do usuário
+            self.txtTextoPublicacao.blockSignals(True)
+            cursor.insertText(bloco)
+            self.txtTextoPublicacao.blockSignals(False)
+            carregamento["partes"].append(bloco)
+            carregamento["carregados"] += len(bloco)
+        self.carregar_proximo_bloco_texto()
+
+    def on_bloco_texto_falhou(self, erro):
+        """
+        Falha ao buscar uma parte do texto: o carregamento é interrompido, sem restaurar o rascunho no texto incompleto
+        """
+        self.rascunho_a_restaurar = None
+        self.cancelar_carregamento_texto()
+        self.on_tarefa_falhou(erro)
+
+    def concluir_carregamento_texto(self):
+        """
+        Texto carregado até o limite: libera a edição ou, se for uma prévia, oferece o texto completo
+        """
+        carregamento = self.carregamento_texto
+        publicacao = carregamento["publicacao"]
+        total = publicacao['tamanho_texto'] or 0
+        self.txtTextoPublicacao.moveCursor(self.txtTextoPublicacao.textCursor().Start)
+        if carregamento["carregados"] < total:
+            self.btnTextoCompleto.setVisible(True)
+            self.exibir_status_conexao(f"Prévia do texto: {carregamento['carregados']} de {total} caracteres")
+            return
+
+        self.carregamento_texto = None
+        self.txtTextoPublicacao.document().setUndoRedoEnabled(True)
+        texto = carregamento["texto"]
+        if texto is None:
+            texto = "".join(carregamento["partes"])
+            self.publicacao_service.guardar_em_cache(dict(publicacao, texto=texto))
+        if self.current_state == EnumScreenState.SELECIONADO:
+            # A partir daqui qualquer digitação marca o documento como modificado
+            self.publicacao_original["texto"] = texto
+            self.txtTextoPublicacao.document().setModified(False)
+            self.txtTextoPublicacao.setReadOnly(False)
+            self.btnSalvarPublicacao.setEnabled(True)
+            rascunho, self.rascunho_a_restaurar = self.rascunho_a_restaurar, None
+            # A seleção pode ter mudado desde que a restauração foi pedida
+            if rascunho is not None and rascunho["campos"]["id_publicacao"] == publicacao['id']:
+                self.aplicar_rascunho(rascunho)
+
+    def cancelar_carregamento_texto(self):
+        """
+        Interrompe o carregamento do texto em andamento
+        """
+        if self.carregamento_texto is None:
+            return
+        self.carregamento_texto = None
+        self.executor.cancelar("texto_publicacao")
+        self.btnTextoCompleto.setVisible(False)
+        self.txtTextoPublicacao.document().setUndoRedoEnabled(True)
+
+    def on_btnTextoCompleto_Click(self):
+        """
+        Click botão btnTextoCompleto: carrega o restante do texto exibido como prévia
+        """
+        if self.carregamento_texto is None:
+            return
+        self.btnTextoCompleto.setVisible(False)
+        self.carregamento_texto["limite"] = None
+        self.carregar_proximo_bloco_texto()
         
+    def conectar_publicacao_service(self):
+        """
+        Cria, em segundo plano, o serviço de publicação a partir da conexão default. As conexões ficam
+        em um pool compartilhado, reaproveitado pelas consultas seguintes.
+        Em caso de falha uma nova tentativa é agendada, até MAX_TENTATIVAS_CONEXAO.
+        """
+        self.tentativa_conexao += 1
+        self.exibir_status_conexao(f"Conectando em {self.default_config['url']} (tentativa {self.tentativa_conexao} de {MAX_TENTATIVAS_CONEXAO})...")
+        dados_conexao = self.obter_dados_conexao()
+        if self.cache_publicacoes is None:
+            self.cache_publicacoes = CachePublicacoes(
+                LIMITE_CACHE_MEMORIA, arquivo_cache_publicacoes(obter_destino(dados_conexao)))
+        # Sem chave: o executor descartaria em silêncio o resultado de uma tentativa cancelada, e o pool
+        # criado por ela ficaria aberto. Tentativas obsoletas são tratadas em on_conexao_concluida.
+        geracao = self.geracao_conexao
+        self.executor.executar(
+            None,
+            criar_publicacao_service,
+            dados_conexao,
+            self.cache_publicacoes,
+            ao_concluir=lambda publicacao_service: self.on_conexao_concluida(geracao, publicacao_service),
+            ao_falhar=lambda erro: self.on_conexao_falhou(erro) if geracao == self.geracao_conexao else None)
+
+    def on_conexao_concluida(self, geracao, publicacao_service):
+        """
+        Resultado de uma tentativa de conexão: se a tela foi desconectada (ou trocou de base) enquanto ela
+        estava em andamento, as conexões abertas por ela são encerradas em vez de usadas
+        """
+        if geracao != self.geracao_conexao:
+            publicacao_service.disconnect()
+            return
+        self.on_conexao_estabelecida(publicacao_service)
+
+    def on_conexao_estabelecida(self, publicacao_service, titulo_service=None, tag_service=None):
+        """
+        Conexão pronta: carrega as combos e libera a tela.
+        Uma conexão aquecida traz os índices de títulos e de tags já carregados.
+        """
+        # Importado sob demanda, como PublicacaoService: depende do mysql.connector, já carregado pela conexão
+        from services.revisao_service import RevisaoService
+
+        self.tentativa_conexao = 0
+        self.publicacao_service = publicacao_service
+        self.cache_publicacoes = publicacao_service.cache
+        self.revisao_service = RevisaoService(self.publicacao_service, INTERVALO_SNAPSHOT_REVISOES)
+        self.slug_service = SlugService(self.publicacao_service)
+        self.titulo_service = titulo_service or TituloService(self.publicacao_service)
+        if tag_service is not None:
+            self.tag_service = tag_service
+        else:
+            self.tag_service = TagService(self.publicacao_service, LIMITE_SUGESTOES_TAGS)
+            self.executor.executar(
+                "tags",
+                self.tag_service.carregar,
+                ao_falhar=lambda erro: print(f"Erro ao carregar o índice de tags: {erro}"))
+        self.exibir_status_conexao(f"Conectado em {self.default_config['url']} como {self.default_config['username']}")
+        # O diário precisa do destino antes da primeira gravação, que a tela já permite a partir daqui; as gravações
+        # aplicadas antes de a lista carregar são refletidas nela pela própria página ou pela sincronização
+        self.envio_gravacoes.iniciar(obter_destino(self.obter_dados_conexao()))
+        self.obter_titulos_publicados()
+        self.obter_tipos_publicacao()
+        self.mudar_estado_tela(EnumScreenState.INICIAL)
+
+    def on_conexao_falhou(self, erro):
+        """
+        Agenda uma nova tentativa de conexão ou, esgotadas as tentativas, avisa o usuário
+        """
+        if self.tentativa_conexao >= MAX_TENTATIVAS_CONEXAO:
+            self.tentativa_conexao = 0
+            self.exibir_status_conexao(f"Sem conexão com {self.default_config['url']}")
+            self.exibir_mensagem_alerta(f"Não foi possível conectar ao banco de dados: {erro}")
+            return
+        espera = min(ESPERA_INICIAL_RECONEXAO_MS * 2 ** (self.tentativa_conexao - 1), ESPERA_MAXIMA_RECONEXAO_MS)
+        self.exibir_status_conexao(f"Falha ao conectar em {self.default_config['url']}: nova tentativa em {espera // 1000}s")
+        self.timer_reconexao.start(espera)
+
     def obter_titulos_publicados(self):
         """
-        Carrega a combo de títulos publicados
+        Carrega a primeira página da combo de títulos publicados; as demais são buscadas ao rolar a lista
         """
-        conn = self.obter_dados_conexao()
-        self.publicacao_service = PublicacaoService(conn['host'], conn['user'], conn['password'], conn['database'], conn['port'])
-        tipos_publicacao = self.publicacao_service.get_titulos_publicados()
-        
-        self.cboTitulosPublicados.clear()
-        for tipo in tipos_publicacao:
-            self.cboTitulosPublicados.addItem(tipo['titulo'], tipo['id'])
-            
-        self.cboTitulosPublicados.setCurrentIndex(-1)
+        self.titulos_model.recarregar()
+
+    def on_titulos_pagina_carregada(self, linhas):
+        """
+        Registra os títulos recebidos no índice de títulos e mantém a combo sem seleção após carregar a primeira página
+        """
+        self.titulo_service.registrar_varios(linhas)
+        if len(linhas) == self.titulos_model.rowCount():
+            self.cboTitulosPublicados.setCurrentIndex(-1)
+
+    def on_titulos_alterados(self, linhas):
+        """
+        Registra no índice de títulos as alterações recebidas na sincronização incremental
+        """
+        self.titulo_service.registrar_varios(linhas)
         
     def obter_tipos_publicacao(self):
         """
         Carrega a combo de tipos de publicação
         """
-        conn = self.obter_dados_conexao()
-        self.publicacao_service = PublicacaoService(conn['host'], conn['user'], conn['password'], conn['database'], conn['port'])
-        tipos_publicacao = self.publicacao_service.get_tipos_publicacao()
-        
+        self.executor.executar(
+            "tipos",
+            self.publicacao_service.get_tipos_publicacao,
+            ao_concluir=self.preencher_tipos_publicacao)
+
+    @instrumentar
+    def preencher_tipos_publicacao(self, tipos_publicacao):
+        """
+        Preenche a combo de tipos de publicação com o resultado da consulta
+        """
         self.cboTipoPublicacao.clear()
         for tipo in tipos_publicacao:
             self.cboTipoPublicacao.addItem(tipo['nome'], tipo['id'])
             
         self.cboTipoPublicacao.setCurrentIndex(-1)
+        if not self.rascunho_oferecido:
+            self.oferecer_restauracao_rascunho()
 
     def on_btnSalvarPublicacao_Click(self):
         """
         Click botão btnSalvarPublicacao 
         """
+        if self.timer_url.isActive():
+            # Título editado há pouco: a URL ainda não foi gerada
+            self.atualizar_url()
         index = self.cboTipoPublicacao.currentIndex()
         id_tipo_publicacao = self.cboTipoPublicacao.itemData(index)
         
-        if self.encontrar_titulo_combobox(self.txtTituloPublicacao.text()) != -1:
-            self.exibir_mensagem_alerta("Esse título já foi utilizado em outra publicação.")
-            return
-        
         erros = self.publicacao_service.validar_publicacao(
             self.txtTituloPublicacao.text(),
             id_tipo_publicacao,
@@ -288,47 +810,262 @@ class MainWindow(QMainWindow):
             erro_message = "\n".join(erros)
             self.exibir_mensagem_alerta(erro_message)
             return
-            
-        match self.current_state:
-            case EnumScreenState.NOVO:
-                self.publicacao_service.incluir_publicacao(
-                    self.txtTituloPublicacao.text(),
-                    id_tipo_publicacao,
-                    self.txtTagsPublicacao.text(),
-                    self.txtURLPublicacao.text(),
-                    datetime.now().strftime("%Y-%m-%d"),
-                    1 if self.chkPublicacaoAtiva.isChecked() else 0,
-                    self.txtTextoPublicacao.toPlainText(),
-                    self.txtLinkImagem.text()
-                )
-                
-                self.obter_titulos_publicados()
-                self.exibir_mensagem_alerta("Publicação salva.")
-            case EnumScreenState.SELECIONADO:
-                index = self.cboTitulosPublicados.currentIndex()
-                id_publicacao = self.cboTitulosPublicados.itemData(index)
-                
-                self.publicacao_service.atualizar_publicacao(
-                    id_publicacao,
-                    self.txtTituloPublicacao.text(),
-                    id_tipo_publicacao,
-                    self.txtTagsPublicacao.text(),
-                    datetime.now().strftime("%Y-%m-%d"),
-                    1 if self.chkPublicacaoAtiva.isChecked() else 0,
-                    self.txtTextoPublicacao.toPlainText(),
-                    self.txtLinkImagem.text()
-                )
-                
-                self.obter_titulos_publicados()
-                self.exibir_mensagem_alerta("Publicação salva.")
-                
+
+        id_publicacao = None
+        if self.current_state == EnumScreenState.SELECIONADO:
+            id_publicacao = self.id_publicacao_atual
+            alteracoes = self.obter_alteracoes()
+            if not alteracoes:
+                self.exibir_mensagem_alerta("Nenhuma alteração para salvar.")
+                self.mudar_estado_tela(EnumScreenState.INICIAL)
+                return
+            if "titulo" not in alteracoes:
+                # Título mantido: não há o que verificar
+                self.on_titulo_verificado(False, id_tipo_publicacao, id_publicacao)
+                return
+
+        self.btnSalvarPublicacao.setEnabled(False)
+        self.executor.executar(
+            None,
+            self.titulo_service.existe,
+            self.txtTituloPublicacao.text(),
+            id_publicacao,
+            ao_concluir=lambda existe: self.on_titulo_verificado(existe, id_tipo_publicacao, id_publicacao),
+            ao_falhar=lambda erro: self.on_verificacao_titulo_falhou(erro, id_tipo_publicacao, id_publicacao))
+
+    def on_verificacao_titulo_falhou(self, erro, id_tipo_publicacao, id_publicacao):
+        """
+        Sem acesso ao banco para verificar o título: a publicação é salva no diário mesmo assim,
+        para não perder o trabalho, e o usuário é avisado
+        """
+        print(f"Erro ao verificar o título: {erro}")
+        if self.on_titulo_verificado(False, id_tipo_publicacao, id_publicacao):
+            self.exibir_mensagem_alerta(
+                "Não foi possível verificar se o título já foi utilizado, pois o banco de dados não respondeu.\n"
+                "A publicação foi salva neste computador e será enviada quando a conexão voltar.")
+
+    def on_titulo_verificado(self, existe, id_tipo_publicacao, id_publicacao):
+        """
+        Após a verificação do título em segundo plano, grava a publicação se o título estiver livre.
+        Retorna True se a publicação foi salva.
+        """
+        if existe:
+            self.btnSalvarPublicacao.setEnabled(True)
+            self.exibir_mensagem_alerta("Esse título já foi utilizado em outra publicação.")
+            return False
+
+        titulo = self.txtTituloPublicacao.text()
+        tags_anteriores = None
+        # A gravação é salva no diário local e enviada ao banco em segundo plano
+        try:
+            match self.current_state:
+                case EnumScreenState.NOVO:
+                    tags = self.txtTagsPublicacao.text()
+                    self.envio_gravacoes.registrar_inclusao({
+                        "titulo": titulo,
+                        "id_tipopublicacao": id_tipo_publicacao,
+                        "tags": tags,
+                        "url": self.txtURLPublicacao.text(),
+                        "data_publicacao": datetime.now().strftime("%Y-%m-%d"),
+                        "ativo": 1 if self.chkPublicacaoAtiva.isChecked() else 0,
+                        "texto": self.txtTextoPublicacao.toPlainText(),
+                        "image_link": self.txtLinkImagem.text()
+                    })
+                case EnumScreenState.SELECIONADO:
+                    alteracoes = self.obter_alteracoes()
+                    alteracoes["data_revisao"] = date.today()
+                    self.envio_gravacoes.registrar_atualizacao(id_publicacao, alteracoes, self.publicacao_original)
+                    tags = alteracoes.get("tags")
+                    tags_anteriores = self.publicacao_original["tags"]
+                case _:
+                    return False
+        except sqlite3.Error as e:
+            self.on_publicacao_falha_salvar(e)
+            return False
+        if tags is not None:
+            self.tag_service.registrar(tags, tags_anteriores)
+        self.on_publicacao_salva(id_publicacao, titulo)
+        return True
+
+    def obter_alteracoes(self):
+        """
+        Compara os campos da tela com os valores carregados e retorna {coluna: valor} apenas dos alterados
+        """
+        original = self.publicacao_original
+        atuais = {
+            "titulo": self.txtTituloPublicacao.text(),
+            "id_tipopublicacao": self.cboTipoPublicacao.currentData(),
+            "tags": self.txtTagsPublicacao.text(),
+            "ativo": 1 if self.chkPublicacaoAtiva.isChecked() else 0,
+            "image_link": self.txtLinkImagem.text()
+        }
+        alteracoes = {campo: valor for campo, valor in atuais.items() if valor != original[campo]}
+        # O texto só é lido e comparado se o editor foi modificado desde o carregamento
+        if self.txtTextoPublicacao.document().isModified():
+            texto = self.txtTextoPublicacao.toPlainText()
+            if texto != original["texto"]:
+                alteracoes["texto"] = texto
+        return alteracoes
+
+    def on_publicacao_salva(self, id_publicacao, titulo):
+        """
+        Publicação salva no diário: uma publicação já existente é atualizada na lista imediatamente;
+        uma nova entra na lista quando o banco devolver o seu id (on_gravacoes_aplicadas)
+        """
+        if id_publicacao is not None:
+            self.titulo_service.registrar(id_publicacao, titulo)
+            self.titulos_model.aplicar_linha(id_publicacao, titulo)
+        self.descartar_rascunho()
+        self.exibir_mensagem_alerta("Publicação salva.")
         self.mudar_estado_tela(EnumScreenState.INICIAL)
-        
+
+    def on_publicacao_falha_salvar(self, erro):
+        """
+        Falha na gravação: mantém os dados na tela para nova tentativa
+        """
+        self.btnSalvarPublicacao.setEnabled(True)
+        self.exibir_mensagem_alerta(f"Erro ao salvar a publicação: {erro}")
+
+    def on_gravacoes_aplicadas(self, aplicadas):
+        """
+        Gravações do diário aplicadas no banco: atualiza os títulos e busca o que mudou desde a última sincronização
+        """
+        for gravacao, id_publicacao in aplicadas:
+            titulo = gravacao["dados"].get("titulo")
+            if titulo is not None:
+                self.titulo_service.registrar(id_publicacao, titulo)
+                self.titulos_model.aplicar_linha(id_publicacao, titulo)
+        self.titulos_model.sincronizar()
+
+    def on_gravacoes_rejeitadas(self, rejeitadas):
+        """
+        Gravações recusadas pelo banco em todas as tentativas: permanecem no diário, mas não são mais enviadas
+        """
+        linhas = [f"{gravacao['dados'].get('titulo') or gravacao['id_publicacao']}: {gravacao['erro']}" for gravacao in rejeitadas]
+        self.exibir_mensagem_alerta("O banco de dados recusou as gravações abaixo:\n" + "\n".join(linhas))
+
+    def on_gravacoes_pendentes_alterado(self, quantidade):
+        """
+        Exibe na barra de status a quantidade de gravações aguardando envio
+        """
+        self.lblGravacoes.setText(f"Gravações pendentes: {quantidade}")
+        self.lblGravacoes.setVisible(quantidade > 0)
+
+    def on_envio_gravacoes_falhou(self, erro):
+        """
+        Falha de conexão ao enviar as gravações: elas continuam no diário e o envio é repetido mais tarde
+        """
+        self.exibir_status_conexao(f"Gravações pendentes não enviadas (nova tentativa em instantes): {erro}")
+
     def on_btnConfiguracoes_Click(self):
         """
         Click botão Configurações
         """
+        from config_dialog import ConfigDialog
+
         dialog = ConfigDialog(self)
+        dialog.conexao_alterada.connect(self.trocar_conexao)
+        dialog.exec_()
+
+    def trocar_conexao(self):
+        """
+        Passa a usar a conexão default atual, após uma alteração nas configurações, sem reiniciar o aplicativo.
+        A conexão anterior é mantida aberta (até CONEXOES_AQUECIDAS) para uma volta imediata, e as combos
+        são recarregadas com os dados da nova base.
+        """
+        nova_config = self.config_service.get_default_connection()
+        if nova_config is None:
+            return
+        dados_conexao = self.config_service.get_dados_conexao(nova_config)
+        if self.publicacao_service is not None and dados_conexao == self.obter_dados_conexao():
+            # A conexão em uso não mudou (ex.: alteração de outra configuração)
+            self.default_config = nova_config
+            return
+        # Retirada antes de desconectar, para não ser descartada ao dar lugar à conexão atual
+        aquecida = self.conexoes_aquecidas.pop(nova_config['type'], None)
+        self.desconectar()
+        self.default_config = nova_config
+        if aquecida is not None:
+            dados_aquecida, publicacao_service, titulo_service, tag_service = aquecida
+            if dados_aquecida == dados_conexao:
+                self.exibir_status_conexao(f"Conectado em {self.default_config['url']} como {self.default_config['username']}")
+                self.on_conexao_estabelecida(publicacao_service, titulo_service, tag_service)
+                return
+            # A configuração foi alterada desde que a conexão foi aquecida
+            publicacao_service.disconnect()
+        self.conectar_publicacao_service()
+
+    def desconectar(self):
+        """
+        Interrompe as consultas e os envios da conexão atual e limpa a tela. A conexão é mantida entre as
+        aquecidas, com os seus caches, ou encerrada; as gravações pendentes continuam no diário.
+        """
+        self.timer_reconexao.stop()
+        self.tentativa_conexao = 0
+        self.geracao_conexao += 1
+        self.salvar_rascunho()
+        self.envio_gravacoes.parar()
+        self.prefetch.cancelar()
+        self.executor.cancelar_todas()
+        self.titulos_model.limpar()
+        self.resultados_pesquisa.clear()
+        self.sugestoes_tags.setStringList([])
+        self.limpar_campos()
+        self.cboTipoPublicacao.clear()
+        self.lblGravacoes.setVisible(False)
+        self.mudar_estado_tela(EnumScreenState.DESCONECTADO)
+        # O rascunho da nova base é oferecido quando as combos forem carregadas
+        self.rascunho_oferecido = False
+        if self.publicacao_service is not None:
+            if CONEXOES_AQUECIDAS > 0:
+                self.conexoes_aquecidas[self.default_config['type']] = (
+                    self.obter_dados_conexao(), self.publicacao_service, self.titulo_service, self.tag_service)
+                while len(self.conexoes_aquecidas) > CONEXOES_AQUECIDAS:
+                    _, (_, publicacao_service, _, _) = self.conexoes_aquecidas.popitem(last=False)
+                    publicacao_service.disconnect()
+            else:
+                self.publicacao_service.disconnect()
+        self.publicacao_service = None
+        self.titulo_service = None
+        self.tag_service = None
+        self.slug_service = None
+        self.revisao_service = None
+        self.cache_publicacoes = None
+
+    def on_btnHistorico_Click(self):
+        """
+        Click botão Histórico: revisões da publicação exibida
+        """
+        if self.id_publicacao_atual is None:
+            self.exibir_mensagem_alerta("Primeiro abra uma publicação para leitura")
+            return
+        from historico_dialog import HistoricoDialog
+
+        id_publicacao = self.id_publicacao_atual
+        dialog = HistoricoDialog(self.revisao_service, id_publicacao, self.executor, self,
+                                 self.titulo_service, self.envio_gravacoes.alteracoes_pendentes)
+        if not dialog.exec_() or dialog.restauracao is None:
+            return
+        restauracao = dialog.restauracao
+        # Salva no diário, como as demais gravações: aplicada depois de uma atualização pendente da publicação, e não antes
+        try:
+            self.envio_gravacoes.registrar_atualizacao(id_publicacao, restauracao["alteracoes"], restauracao["anterior"])
+        except sqlite3.Error as e:
+            self.exibir_mensagem_alerta(f"Erro ao restaurar a revisão: {e}")
+            return
+        if "tags" in restauracao["alteracoes"]:
+            self.tag_service.registrar(restauracao["alteracoes"]["tags"], restauracao["anterior"]["tags"])
+        self.titulo_service.registrar(id_publicacao, restauracao["titulo"])
+        self.titulos_model.aplicar_linha(id_publicacao, restauracao["titulo"])
+        self.exibir_publicacao(id_publicacao)
+
+    def on_atalho_diagnostico(self):
+        """
+        Tecla F12: abre a janela de diagnóstico
+        """
+        from diagnostico_dialog import DiagnosticoDialog
+
+        dialog = DiagnosticoDialog(self)
         dialog.exec_()
       
     def on_btnLerPublicacao_Click(self):
@@ -347,27 +1084,269 @@ class MainWindow(QMainWindow):
         """
         Click botão btnEditarPublicacao
         """
+        # Publicação escolhida pelo usuário: um rascunho ainda aguardando a sua publicação não é mais aplicado
+        self.rascunho_a_restaurar = None
         index = self.cboTitulosPublicados.currentIndex()
         if index == -1:
+            # Publicação aberta pela pesquisa, fora da lista de títulos
+            if self.current_state == EnumScreenState.VISUALIZAR and self.id_publicacao_atual:
+                self.editar_publicacao(self.id_publicacao_atual)
+                return
             self.exibir_mensagem_alerta("Primeiro selecione uma publicação na lista")      
             return
         
         selected_id = self.cboTitulosPublicados.itemData(index)
         self.editar_publicacao(selected_id)
       
+    def on_txtPesquisa_editado(self, texto):
+        """
+        Reinicia a espera da pesquisa a cada tecla digitada
+        """
+        if len(texto.strip()) < 3:
+            self.timer_pesquisa.stop()
+            self.executor.cancelar("pesquisa")
+            return
+        self.timer_pesquisa.start()
+
+    def pesquisar_publicacoes(self):
+        """
+        Pesquisa as publicações em segundo plano com o texto digitado; "tag:nome" lista as publicações da tag
+        """
+        texto = self.txtPesquisa.text()
+        if texto.lower().startswith(PREFIXO_PESQUISA_TAG):
+            self.executor.executar(
+                "pesquisa",
+                self.tag_service.publicacoes_com_tag,
+                texto[len(PREFIXO_PESQUISA_TAG):],
+                LIMITE_RESULTADOS_PESQUISA,
+                ao_concluir=self.exibir_resultados_pesquisa)
+            return
+        self.executor.executar(
+            "pesquisa",
+            self.publicacao_service.pesquisar_publicacoes,
+            self.txtPesquisa.text(),
+            LIMITE_RESULTADOS_PESQUISA,
+            ao_concluir=self.exibir_resultados_pesquisa)
+
+    @instrumentar
+    def exibir_resultados_pesquisa(self, resultados):
+        """
+        Exibe os resultados da pesquisa (título e trecho) na lista suspensa
+        """
+        self.resultados_pesquisa.clear()
+        for resultado in resultados:
+            trecho = " ".join((resultado['trecho'] or "").split())
+            item = QStandardItem(f"{resultado['titulo']} — {trecho}")
+            item.setData(resultado['id'], Qt.UserRole)
+            item.setData(resultado['titulo'], PAPEL_TITULO_PESQUISA)
+            item.setToolTip(trecho)
+            self.resultados_pesquisa.appendRow(item)
+        if resultados:
+            self.completer_pesquisa.complete()
+
+    def on_txtTagsPublicacao_editado(self, texto):
+        """
+        Sugere as tags mais usadas que começam com a parte digitada após a última vírgula
+        """
+        anteriores, _, parcial = texto.rpartition(",")
+        parcial = parcial.strip()
+        if not parcial or self.tag_service is None:
+            self.sugestoes_tags.setStringList([])
+            self.completer_tags.popup().hide()
+            return
+        usadas = {chave_tag(tag) for tag in separar_tags(anteriores)}
+        inicio = f"{anteriores.strip()}, " if anteriores.strip() else ""
+        sugestoes = [
+            inicio + tag
+            for tag in self.tag_service.sugerir(parcial, LIMITE_SUGESTOES_TAGS)
+            if chave_tag(tag) not in usadas and tag != parcial
+        ]
+        self.sugestoes_tags.setStringList(sugestoes)
+        if sugestoes:
+            self.completer_tags.complete()
+        else:
+            self.completer_tags.popup().hide()
+
+    def on_resultado_pesquisa_activated(self, index):
+        """
+        Abre para leitura a publicação escolhida nos resultados da pesquisa
+        """
+        if self.current_state in (EnumScreenState.NOVO, EnumScreenState.SELECIONADO):
+            self.exibir_mensagem_alerta("Salve ou cancele a publicação em edição antes de abrir outra.")
+            return
+        id_publicacao = index.data(Qt.UserRole)
+        index_combo = self.cboTitulosPublicados.findData(id_publicacao)
+        self.cboTitulosPublicados.setCurrentIndex(index_combo)
+        self.exibir_publicacao(id_publicacao)
+
     def on_btnNovaPublicacao_Click(self):
         """
         Click botão btnNovaPublicacao
         """
+        self.revisao_texto_rascunho = None
         self.mudar_estado_tela(EnumScreenState.NOVO)      
       
     def on_btnCancelar_Click(self):
         """
         Click botão Cancelar
         """
+        self.descartar_rascunho()
         self.limpar_campos()
         self.mudar_estado_tela(EnumScreenState.INICIAL)      
         
+    def agendar_rascunho(self):
+        """
+        Reinicia a espera para salvar o rascunho a cada edição
+        """
+        if self.current_state in (EnumScreenState.NOVO, EnumScreenState.SELECIONADO):
+            self.timer_rascunho.start()
+
+    def salvar_rascunho(self):
+        """
+        Salva localmente o estado da publicação em edição; o texto só é relido se o documento mudou
+        desde o último salvamento, e apenas os seus blocos alterados são gravados
+        """
+        self.timer_rascunho.stop()
+        if self.current_state not in (EnumScreenState.NOVO, EnumScreenState.SELECIONADO) or self.carregamento_texto is not None:
+            return
+        campos = {
+            "estado": self.current_state.name,
+            "id_publicacao": self.id_publicacao_atual,
+            "titulo": self.txtTituloPublicacao.text(),
+            "id_tipopublicacao": self.cboTipoPublicacao.currentData(),
+            "tags": self.txtTagsPublicacao.text(),
+            "ativo": 1 if self.chkPublicacaoAtiva.isChecked() else 0,
+            "image_link": self.txtLinkImagem.text()
+        }
+        documento = self.txtTextoPublicacao.document()
+        if self.current_state == EnumScreenState.SELECIONADO:
+            sem_alteracoes = not self.obter_alteracoes()
+        else:
+            sem_alteracoes = not any((campos["titulo"], campos["tags"], campos["image_link"], documento.characterCount() > 1))
+        if sem_alteracoes:
+            self.descartar_rascunho()
+            return
+
+        revisao = documento.revision()
+        texto = None if revisao == self.revisao_texto_rascunho else self.txtTextoPublicacao.toPlainText()
+        try:
+            self.rascunho_service.salvar(obter_destino(self.obter_dados_conexao()), campos, texto)
+        except sqlite3.Error:
+            return
+        self.revisao_texto_rascunho = revisao
+
+    def descartar_rascunho(self):
+        """
+        Remove o rascunho local: a publicação foi salva ou a edição cancelada
+        """
+        self.timer_rascunho.stop()
+        self.revisao_texto_rascunho = None
+        self.rascunho_a_restaurar = None
+        if self.default_config:
+            self.rascunho_service.descartar(obter_destino(self.obter_dados_conexao()))
+
+    def oferecer_restauracao_rascunho(self):
+        """
+        Na inicialização, oferece restaurar o rascunho deixado por uma execução anterior
+        """
+        self.rascunho_oferecido = True
+        rascunho = self.rascunho_service.obter(obter_destino(self.obter_dados_conexao()))
+        if rascunho is None:
+            return
+        campos = rascunho["campos"]
+        atualizado_em = datetime.fromtimestamp(rascunho["atualizado_em"]).strftime('%d/%m/%Y %H:%M:%S')
+        resposta = QMessageBox.question(
+            self,
+            "Rascunho não salvo",
+            f"Existe um rascunho não salvo de \"{campos['titulo'] or 'publicação sem título'}\", de {atualizado_em}.\n"
+            "Deseja restaurá-lo?")
+        if resposta != QMessageBox.Yes:
+            self.descartar_rascunho()
+            return
+        if campos["estado"] == EnumScreenState.SELECIONADO.name:
+            # Os campos do rascunho são aplicados sobre a publicação quando o texto terminar de carregar
+            self.rascunho_a_restaurar = rascunho
+            self.editar_publicacao(campos["id_publicacao"])
+        else:
+            self.on_btnNovaPublicacao_Click()
+            self.aplicar_rascunho(rascunho)
+
+    def aplicar_rascunho(self, rascunho):
+        """
+        Preenche os campos em edição com os valores do rascunho
+        """
+        campos = rascunho["campos"]
+        index = self.cboTipoPublicacao.findData(campos["id_tipopublicacao"])
+        self.cboTipoPublicacao.setCurrentIndex(index)
+        self.txtTituloPublicacao.setText(campos["titulo"])
+        self.txtTagsPublicacao.setText(campos["tags"])
+        self.chkPublicacaoAtiva.setChecked(campos["ativo"] == 1)
+        self.txtLinkImagem.setText(campos["image_link"])
+        if rascunho["texto"] != self.txtTextoPublicacao.toPlainText():
+            self.txtTextoPublicacao.setPlainText(rascunho["texto"])
+            self.txtTextoPublicacao.document().setModified(True)
+        self.exibir_status_conexao("Rascunho restaurado")
+
+    def paintEvent(self, event):
+        """
+        Registra o tempo decorrido do início da execução até a primeira pintura da janela
+        """
+        super().paintEvent(event)
+        if self.tempo_primeira_pintura is None:
+            self.tempo_primeira_pintura = time.perf_counter() - INICIO_EXECUCAO
+            print(f"Tempo até a primeira pintura: {self.tempo_primeira_pintura * 1000:.0f} ms")
+
+    def closeEvent(self, event):
+        """
+        Encerra as conexões do pool e do arquivo de configurações ao fechar a janela
+        """
+        self.timer_reconexao.stop()
+        self.timer_metricas.stop()
+        # Uma edição em andamento fica no rascunho, oferecido na próxima execução
+        self.salvar_rascunho()
+        self.rascunho_service.close()
+        self.envio_gravacoes.parar()
+        self.prefetch.cancelar()
+        self.executor.encerrar()
+        # As gravações ainda não enviadas continuam no diário e são enviadas na próxima execução
+        self.diario_gravacoes.close()
+        if self.publicacao_service:
+            self.publicacao_service.disconnect()
+        for _, publicacao_service, _, _ in self.conexoes_aquecidas.values():
+            publicacao_service.disconnect()
+        self.config_service.close()
+        super().closeEvent(event)
+
+    def exibir_metricas(self):
+        """
+        Exibe na barra de status os percentis recentes de latência, quando houver novas medições
+        """
+        chamadas = metricas.total_chamadas()
+        if chamadas == self.chamadas_exibidas:
+            return
+        self.chamadas_exibidas = chamadas
+
+        def formatar(valor):
+            return "-" if valor is None else f"{valor:.0f}"
+        p50, p95, p99 = metricas.percentis("PublicacaoService.")
+        _, conexao_p95, _ = metricas.percentis("conexao.")
+        _, tela_p95, _ = metricas.percentis("MainWindow.")
+        self.lblMetricas.setText(
+            f"BD p50/p95/p99: {formatar(p50)}/{formatar(p95)}/{formatar(p99)} ms | "
+            f"conexão p95: {formatar(conexao_p95)} ms | tela p95: {formatar(tela_p95)} ms")
+
+    def on_executor_ocupado(self, ocupado):
+        """
+        Exibe o indicador de atividade enquanto houver consultas em segundo plano
+        """
+        self.prgOcupado.setVisible(ocupado)
+
+    def on_tarefa_falhou(self, erro):
+        """
+        Erro em uma tarefa de segundo plano
+        """
+        self.exibir_mensagem_alerta(f"Erro ao acessar o banco de dados: {erro}")
+
     def exibir_status_conexao(self, texto):
         """
         Exibe texto na barra de status da janela
@@ -384,29 +1363,6 @@ class MainWindow(QMainWindow):
         alert.setIcon(QMessageBox.Warning)
         alert.exec_()      
         
-    def encontrar_titulo_combobox(self, texto):
-        """
-        Percorre os textos de um QComboBox para encontrar um texto específico.
-        """
-        for i in range(self.cboTitulosPublicados.count()):
-            if self.cboTitulosPublicados.itemText(i) == texto:
-                return i
-            
-        return -1  
-        
-    def formatar_para_url(self, texto):
-        """
-        Converte o texto para um valor amigável de URL
-        """
-        texto = unidecode(texto)    # Remove os acentos com unidecode
-        texto = texto.lower()
-        texto = texto.replace(" ", "_")
-    
-        # Remove caracteres especiais
-        texto = re.sub(r'[^a-z0-9_]', '', texto)
-    
-        return texto   
-        
     def on_cboTitulosPublicados_changed(self, index):
         """
         Mudança de seleção em cboTitulosPublicados
@@ -415,6 +1371,64 @@ class MainWindow(QMainWindow):
             selected_id = self.cboTitulosPublicados.itemData(index)
             self.editar_publicacao(selected_id)
         
+    def agendar_validacao(self, campo):
+        """
+        Marca o campo para validação e reinicia a espera
+        """
+        if self.current_state not in (EnumScreenState.NOVO, EnumScreenState.SELECIONADO):
+            return
+        self.campos_pendentes_validacao.add(campo)
+        self.timer_validacao.start()
+
+    def validar_campos_pendentes(self):
+        """
+        Valida apenas os campos alterados desde a última validação e exibe o resultado junto a cada campo
+        """
+        for campo in self.campos_pendentes_validacao:
+            self.exibir_validacao_campo(campo, ValidacaoService.validar_campo(campo, self.obter_valor_campo(campo)))
+        self.campos_pendentes_validacao.clear()
+
+    def obter_valor_campo(self, campo):
+        """
+        Retorna o valor atual de um campo validável
+        """
+        match campo:
+            case "id_tipopublicacao":
+                return self.cboTipoPublicacao.currentData()
+            case "texto":
+                return self.txtTextoPublicacao.toPlainText()
+            case _:
+                return self.campos_validacao[campo].text()
+
+    def exibir_validacao_campo(self, campo, erros):
+        """
+        Destaca o campo com erro e exibe as mensagens na dica do campo
+        """
+        widget = self.campos_validacao[campo]
+        widget.setStyleSheet(ESTILO_CAMPO_INVALIDO if erros else "")
+        widget.setToolTip("\n".join(erros))
+
+    def limpar_validacao(self):
+        """
+        Descarta as validações pendentes e remove os destaques de erro
+        """
+        self.timer_validacao.stop()
+        self.campos_pendentes_validacao.clear()
+        for campo in self.campos_validacao:
+            self.exibir_validacao_campo(campo, [])
+
+    def on_cboTitulosPublicados_destacado(self, index):
+        """
+        Item destacado ou selecionado em cboTitulosPublicados: busca antecipadamente a publicação e as vizinhas
+        """
+        if index < 0:
+            return
+        self.prefetch.solicitar([
+            self.cboTitulosPublicados.itemData(index),
+            self.cboTitulosPublicados.itemData(index + 1),
+            self.cboTitulosPublicados.itemData(index - 1) if index > 0 else None
+        ])
+
     def on_cboTipoPublicacao_changed(self, index):
         """
         Mudança de seleção em cboTipoPublicacao
@@ -425,10 +1439,38 @@ class MainWindow(QMainWindow):
 
     def on_txtTituloPublicacao_textChanged(self):
         """
-        Copia o texto do titulo para a url
+        Agenda a geração da URL a partir do título; apenas uma nova publicação recebe a URL do título,
+        pois a URL de uma publicação existente não é alterada ao salvar
+        """
+        if self.current_state == EnumScreenState.NOVO:
+            self.timer_url.start()
+        elif not self.txtTituloPublicacao.text():
+            self.timer_url.stop()
+            self.txtURLPublicacao.setText("")
+
+    def atualizar_url(self):
+        """
+        Exibe a URL gerada a partir do título e, em segundo plano, a substitui por uma URL livre
+        caso outra publicação já use a mesma
+        """
+        self.timer_url.stop()
+        titulo = self.txtTituloPublicacao.text()
+        self.txtURLPublicacao.setText(gerar_slug(titulo))
+        if self.slug_service is None or not self.txtURLPublicacao.text():
+            return
+        self.executor.executar(
+            "url",
+            self.slug_service.gerar_unica,
+            titulo,
+            ao_concluir=lambda url: self.on_url_gerada(titulo, url),
+            ao_falhar=lambda erro: print(f"Erro ao verificar a URL: {erro}"))
+
+    def on_url_gerada(self, titulo, url):
+        """
+        Exibe a URL livre, se o título não mudou durante a verificação
         """
-        text = self.txtTituloPublicacao.text()
-        self.txtURLPublicacao.setText(self.formatar_para_url(text))
+        if self.current_state == EnumScreenState.NOVO and self.txtTituloPublicacao.text() == titulo:
+            self.txtURLPublicacao.setText(url)
 
 def main():
     app = QApplication(sys.argv)
@@ -0,0 +1,76 @@
+from collections import deque
+from PyQt5.QtCore import QObject
+
+
+class PrefetchPublicacoes(QObject):
+    """
+    Busca antecipadamente, em segundo plano, as publicações próximas da seleção na combo de títulos,
+    deixando-as no cache local antes que "Ler" ou "Editar" seja pressionado.
+
+    As buscas são tarefas do ExecutorTarefas da janela, uma de cada vez e com prioridade menor que as
+    consultas da interface: ocupam no máximo uma conexão do pool e só começam com a fila livre. Pedidos
+    ainda não iniciados são descartados quando a seleção muda, e publicações já em memória não são buscadas novamente.
+    """
+    # Chave das buscas no executor, cancelada junto com as demais ao desconectar
+    CHAVE = "prefetch"
+    PRIORIDADE = -1
+
+    def __init__(self, executor, obter_service, max_pendentes=4, parent=None):
+        """
+        :param executor: ExecutorTarefas que executa as buscas.
+        :param obter_service: Função que retorna o PublicacaoService atual.
+        :param max_pendentes: Quantidade máxima de ids aguardando na fila.
+        """
+        super().__init__(parent)
+        self.executor = executor
+        self.obter_service = obter_service
+        self._pendentes = deque(maxlen=max_pendentes)
+        # (id, tarefa) da última busca enviada ao executor
+        self._em_andamento = None
+
+    def solicitar(self, ids_publicacao):
+        """
+        Substitui a fila de busca antecipada pelos ids informados (o primeiro tem prioridade)
+        """
+        service = self.obter_service()
+        if service is None or service.cache is None:
+            return
+        self._pendentes.clear()
+        for id_publicacao in ids_publicacao:
+            if id_publicacao is None or id_publicacao == self._id_em_andamento() or id_publicacao in self._pendentes:
+                continue
+            if service.cache.contem(id_publicacao):
+                continue
+            self._pendentes.append(id_publicacao)
+        self._despachar()
+
+    def cancelar(self):
+        """
+        Descarta os pedidos que ainda não começaram
+        """
+        self._pendentes.clear()
+        self.executor.cancelar(self.CHAVE)
+
+    def _id_em_andamento(self):
+        if self._em_andamento is None or not self.executor.ativa(self._em_andamento[1]):
+            return None
+        return self._em_andamento[0]
+
+    def _despachar(self):
+        service = self.obter_service()
+        if not self._pendentes or service is None or self._id_em_andamento() is not None:
+            return
+        id_publicacao = self._pendentes.popleft()
+        tarefa = self.executor.executar(
+            self.CHAVE,
+            service.get_publicacao_by_id,
+            id_publicacao,
+            prioridade=self.PRIORIDADE,
+            ao_concluir=lambda _: self._despachar(),
+            ao_falhar=lambda erro: self._falhar(id_publicacao, erro))
+        self._em_andamento = (id_publicacao, tarefa)
+
+    def _falhar(self, id_publicacao, erro):
+        # Busca antecipada é apenas uma otimização: a falha não é exibida ao usuário
+        print(f"Erro na busca antecipada da publicação {id_publicacao}: {erro}")
+        self._despachar()
@@ -0,0 +1,168 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+
+
+class CachePublicacoes:
+    """
+    Cache local das publicações lidas por PublicacaoService.get_publicacao_by_id.
+
+    Mantém as publicações em memória com política LRU limitada pelo tamanho em bytes e,
+    opcionalmente, em um arquivo SQLite local que sobrevive entre execuções (também limitado em bytes).
+    A validação de cada entrada contra o banco (atualizado_em) fica a cargo de PublicacaoService;
+    entradas validadas (ou buscadas) há menos de `validade` segundos podem ser usadas sem nova consulta.
+    """
+    CAMPOS_DATA = ("data_publicacao", "data_revisao", "atualizado_em")
+
+    def __init__(self, limite_bytes=32 * 1024 * 1024, caminho_db=None, limite_bytes_disco=256 * 1024 * 1024, validade=10):
+        """
+        :param limite_bytes: Tamanho máximo das publicações mantidas em memória.
+        :param caminho_db: Arquivo SQLite do cache em disco (None para usar apenas memória).
+        :param limite_bytes_disco: Tamanho máximo das publicações mantidas no arquivo.
+        :param validade: Segundos em que uma entrada validada é considerada atual sem consultar o banco.
+        """
+        self.limite_bytes = limite_bytes
+        self.validade = validade
+        self.limite_bytes_disco = limite_bytes_disco
+        self._entradas = OrderedDict()
+        self._total_bytes = 0
+        # Usado pela thread da interface e pelas threads do executor
+        self._lock = threading.Lock()
+        self._db = None
+        if caminho_db:
+            self._db = sqlite3.connect(caminho_db, check_same_thread=False)
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS publicacoes (
+                    id INTEGER PRIMARY KEY,
+                    dados TEXT NOT NULL,
+                    tamanho INTEGER NOT NULL,
+                    ultimo_acesso REAL NOT NULL
+                )
+            """)
+            self._db.commit()
+
+    def obter(self, id_publicacao):
+        """
+        Retorna uma cópia da publicação em cache ou None
+        """
+        with self._lock:
+            entrada = self._entradas.get(id_publicacao)
+            if entrada is not None:
+                self._entradas.move_to_end(id_publicacao)
+                return dict(entrada[0])
+            if self._db is None:
+                return None
+            try:
+                linha = self._db.execute("SELECT dados, tamanho FROM publicacoes WHERE id = ?;", (id_publicacao,)).fetchone()
+                if linha is None:
+                    return None
+                self._db.execute("UPDATE publicacoes SET ultimo_acesso = ? WHERE id = ?;", (datetime.now().timestamp(), id_publicacao))
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"Erro ao acessar o cache de publicações: {e}")
+                return None
+            publicacao = self._decodificar(linha[0])
+            self._guardar_memoria(id_publicacao, publicacao, linha[1], None)
+            return dict(publicacao)
+
+    def contem(self, id_publicacao):
+        """
+        Indica se a publicação está no cache em memória
+        """
+        with self._lock:
+            return id_publicacao in self._entradas
+
+    def validado_recentemente(self, id_publicacao):
+        """
+        Indica se a entrada em memória foi buscada ou validada no banco há menos de `validade` segundos
+        """
+        with self._lock:
+            entrada = self._entradas.get(id_publicacao)
+            return entrada is not None and entrada[2] is not None and time.monotonic() - entrada[2] < self.validade
+
+    def marcar_validado(self, id_publicacao):
+        """
+        Registra que a entrada acabou de ser conferida com o banco
+        """
+        with self._lock:
+            entrada = self._entradas.get(id_publicacao)
+            if entrada is not None:
+                self._entradas[id_publicacao] = (entrada[0], entrada[1], time.monotonic())
+
+    def guardar(self, publicacao):
+        """
+        Inclui ou substitui a publicação no cache
+        """
+        dados = self._codificar(publicacao)
+        tamanho = len(dados.encode("utf-8"))
+        with self._lock:
+            self._guardar_memoria(publicacao["id"], dict(publicacao), tamanho, time.monotonic())
+            if self._db is None or tamanho > self.limite_bytes_disco:
+                return
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO publicacoes (id, dados, tamanho, ultimo_acesso) VALUES (?, ?, ?, ?);",
+                    (publicacao["id"], dados, tamanho, datetime.now().timestamp()))
+                self._despejar_disco()
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"Erro ao gravar no cache de publicações: {e}")
+
+    def invalidar(self, id_publicacao):
+        """
+        Remove a publicação do cache
+        """
+        with self._lock:
+            entrada = self._entradas.pop(id_publicacao, None)
+            if entrada is not None:
+                self._total_bytes -= entrada[1]
+            if self._db is not None:
+                try:
+                    self._db.execute("DELETE FROM publicacoes WHERE id = ?;", (id_publicacao,))
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    print(f"Erro ao remover do cache de publicações: {e}")
+
+    def _guardar_memoria(self, id_publicacao, publicacao, tamanho, validado_em):
+        anterior = self._entradas.pop(id_publicacao, None)
+        if anterior is not None:
+            self._total_bytes -= anterior[1]
+        if tamanho > self.limite_bytes:
+            return
+        self._entradas[id_publicacao] = (publicacao, tamanho, validado_em)
+        self._total_bytes += tamanho
+        # Descarta as publicações usadas há mais tempo até respeitar o limite
+        while self._total_bytes > self.limite_bytes:
+            _, (_, tamanho_removido, _) = self._entradas.popitem(last=False)
+            self._total_bytes -= tamanho_removido
+
+    def _despejar_disco(self):
+        total = self._db.execute("SELECT COALESCE(SUM(tamanho), 0) FROM publicacoes;").fetchone()[0]
+        if total <= self.limite_bytes_disco:
+            return
+        excedente = total - self.limite_bytes_disco
+        removidos = []
+        for id_publicacao, tamanho in self._db.execute("SELECT id, tamanho FROM publicacoes ORDER BY ultimo_acesso;"):
+            removidos.append((id_publicacao,))
+            excedente -= tamanho
+            if excedente <= 0:
+                break
+        self._db.executemany("DELETE FROM publicacoes WHERE id = ?;", removidos)
+
+    def _codificar(self, publicacao):
+        dados = dict(publicacao)
+        for campo in self.CAMPOS_DATA:
+            if isinstance(dados.get(campo), (date, datetime)):
+                dados[campo] = dados[campo].isoformat()
+        return json.dumps(dados)
+
+    def _decodificar(self, texto):
+        dados = json.loads(texto)
+        for campo in self.CAMPOS_DATA:
+            valor = dados.get(campo)
+            if valor:
+                dados[campo] = datetime.fromisoformat(valor) if "T" in valor else date.fromisoformat(valor)
+        return dados
@@ -0,0 +1,187 @@
+import queue
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import mysql.connector
+from mysql.connector import Error, HAVE_CEXT
+from mysql.connector.errors import PoolError
+
+from services.metricas import metricas
+
+
+class ConexaoPool:
+    """
+    Pool de conexões MySQL compartilhado pelas instâncias de PublicacaoService.
+
+    As conexões são criadas sob demanda até o limite de `tamanho` e devolvidas ao pool
+    ao final de cada operação, evitando um novo handshake TCP + autenticação a cada consulta.
+    Para cada conexão o pool mantém também os cursores preparados das consultas mais frequentes
+    (executar_preparada), de forma que o servidor analisa cada comando apenas uma vez por conexão.
+    """
+    _pools = {}
+    _pools_lock = threading.Lock()
+    # Quantidade máxima de comandos preparados mantidos em cada conexão (os menos usados são descartados)
+    MAX_CONSULTAS_PREPARADAS = 32
+
+    def __init__(self, host, user, password, database, port=3306, tamanho=3, tempo_ocioso_max=60, timeout_espera=30,
+                 timeout_conexao=10, extensao_c=True):
+        """
+        :param tamanho: Número máximo de conexões abertas simultaneamente.
+        :param tempo_ocioso_max: Segundos de ociosidade após os quais a conexão é verificada (ping) antes do uso.
+        :param timeout_espera: Segundos de espera por uma conexão livre quando o pool está esgotado.
+        :param timeout_conexao: Segundos de espera pelo servidor ao abrir uma conexão. Na implementação
+            em Python puro do mysql-connector o mesmo limite vale para cada leitura do socket,
+            por isso não deve ser menor que a consulta mais demorada.
+        :param extensao_c: Usa a extensão C do mysql-connector, quando instalada; sem ela, a implementação em Python puro.
+        """
+        self.parametros = {
+            "host": host,
+            "user": user,
+            "password": password,
+            "database": database,
+            "port": port,
+            "connection_timeout": timeout_conexao,
+            "use_pure": not (extensao_c and HAVE_CEXT)
+        }
+        self.tamanho = tamanho
+        self.tempo_ocioso_max = tempo_ocioso_max
+        self.timeout_espera = timeout_espera
+        # Pilha (LIFO) para reaproveitar primeiro as conexões usadas mais recentemente
+        self._livres = queue.LifoQueue()
+        self._vagas = threading.BoundedSemaphore(tamanho)
+        # {conexão: OrderedDict {comando: (comando, cursor preparado)}}; cada conexão é usada por uma thread de cada vez
+        self._preparadas = {}
+
+    @classmethod
+    def obter(cls, host, user, password, database, port=3306, tamanho=3, timeout_conexao=10, extensao_c=True):
+        """
+        Retorna o pool associado aos parâmetros de conexão, criando-o na primeira chamada.
+        """
+        chave = (host, user, password, database, port, extensao_c)
+        with cls._pools_lock:
+            pool = cls._pools.get(chave)
+            if pool is None:
+                pool = cls(host, user, password, database, port, tamanho, timeout_conexao=timeout_conexao, extensao_c=extensao_c)
+                cls._pools[chave] = pool
+            return pool
+
+    def adquirir(self):
+        """
+        Retira uma conexão do pool, verificando se ela ainda está ativa.
+        """
+        if not self._vagas.acquire(timeout=self.timeout_espera):
+            raise PoolError("Nenhuma conexão disponível no pool.")
+        try:
+            try:
+                conexao, ultimo_uso = self._livres.get_nowait()
+            except queue.Empty:
+                return mysql.connector.connect(**self.parametros)
+
+            self._verificar(conexao, ultimo_uso)
+            return conexao
+        except Exception:
+            self._vagas.release()
+            raise
+
+    def devolver(self, conexao, verificar=False):
+        """
+        Devolve a conexão ao pool para ser reutilizada.
+
+        :param verificar: Força o health-check na próxima retirada (ex.: após um erro).
+        """
+        self._livres.put((conexao, None if verificar else time.monotonic()))
+        self._vagas.release()
+
+    @contextmanager
+    def conexao(self):
+        """
+        Empresta uma conexão do pool durante o bloco `with`.
+        """
+        inicio = time.perf_counter()
+        conexao = self.adquirir()
+        # Inclui a espera por vaga, o health-check e, para conexões novas, o handshake com o servidor
+        metricas.registrar_espera_conexao((time.perf_counter() - inicio) * 1000)
+        falhou = False
+        try:
+            yield conexao
+        except Error:
+            falhou = True
+            # O estado dos comandos preparados é incerto após um erro: serão preparados novamente
+            self._descartar_preparadas(conexao, fechar=True)
+            raise
+        finally:
+            self.devolver(conexao, verificar=falhou)
+
+    def executar_preparada(self, conexao, comando, params=()):
+        """
+        Executa o comando em um cursor preparado (prepared=True) reaproveitado pela conexão e retorna o cursor,
+        que não deve ser fechado por quem chamou. O comando é enviado e analisado pelo servidor apenas na
+        primeira execução; nas seguintes seguem apenas os parâmetros, e as linhas chegam como tuplas.
+        Todas as linhas devem ser lidas (fetchall) antes de a conexão ser usada novamente.
+        """
+        preparadas = self._preparadas.setdefault(conexao, OrderedDict())
+        item = preparadas.get(comando)
+        if item is None:
+            # O cursor só reaproveita o comando preparado se receber o mesmo objeto str a cada execução
+            item = (comando, conexao.cursor(prepared=True))
+            preparadas[comando] = item
+            if len(preparadas) > self.MAX_CONSULTAS_PREPARADAS:
+                _, (_, cursor) = preparadas.popitem(last=False)
+                self._fechar_cursor(cursor)
+        else:
+            preparadas.move_to_end(comando)
+        comando, cursor = item
+        cursor.execute(comando, tuple(params))
+        return cursor
+
+    def _verificar(self, conexao, ultimo_uso):
+        """
+        Health-check na retirada: conexões ociosas há mais de `tempo_ocioso_max` segundos
+        podem ter sido encerradas pelo servidor (wait_timeout), então são verificadas com ping
+        e reconectadas automaticamente.
+        """
+        if ultimo_uso is not None and time.monotonic() - ultimo_uso < self.tempo_ocioso_max:
+            return
+        sessao = conexao.connection_id
+        try:
+            conexao.ping(reconnect=True, attempts=3, delay=1)
+        except Error:
+            # A conexão não será devolvida ao pool: os seus comandos preparados são apenas esquecidos
+            self._descartar_preparadas(conexao)
+            raise
+        if conexao.connection_id == sessao:
+            # Mesma sessão: os comandos preparados são fechados no servidor, para não se acumularem nela
+            self._descartar_preparadas(conexao, fechar=True)
+        else:
+            # Reconectada: o servidor já descartou os comandos preparados da sessão anterior
+            self._descartar_preparadas(conexao)
+
+    def _descartar_preparadas(self, conexao, fechar=False):
+        preparadas = self._preparadas.pop(conexao, None)
+        if preparadas and fechar:
+            for _, cursor in preparadas.values():
+                self._fechar_cursor(cursor)
+
+    def _fechar_cursor(self, cursor):
+        try:
+            cursor.close()
+        except Error as e:
+            print(f"Erro ao fechar cursor preparado: {e}")
+
+    def encerrar(self):
+        """
+        Fecha todas as conexões livres do pool.
+        """
+        while True:
+            try:
+                conexao, _ = self._livres.get_nowait()
+            except queue.Empty:
+                break
+            # Os comandos preparados são liberados pelo servidor ao fechar a conexão
+            self._preparadas.pop(conexao, None)
+            try:
+                conexao.close()
+            except Error as e:
+                print(f"Erro ao encerrar conexão: {e}")
@@ -1,82 +1,132 @@
 import sqlite3
 import os
 
+from services.metricas import instrumentar
+
 class ConfigService:
     def __init__(self, db_path='database/infoconexao.db'):
         self.db_path = db_path
-        
+        # Conexão única mantida aberta durante toda a execução
+        self._conn = None
+        # Cópia em memória da tabela info, recarregada apenas após gravações
+        self._snapshot = None
+
     def _connect(self):
-        if not os.path.exists(self.db_path):
-            raise FileNotFoundError(f"Arquivo de banco de dados não encontrado: {self.db_path}")
-        
-        return sqlite3.connect(self.db_path)
-    
+        if self._conn is None:
+            if not os.path.exists(self.db_path):
+                raise FileNotFoundError(f"Arquivo de banco de dados não encontrado: {self.db_path}")
+
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.execute("PRAGMA journal_mode=WAL;")
+        return self._conn
+
+    def _get_snapshot(self):
+        """
+        Retorna as linhas da tabela info, lendo o arquivo apenas na primeira chamada ou após uma gravação.
+        """
+        if self._snapshot is None:
+            query = "SELECT url, username, password, driverclassname, type, isdefault FROM info;"
+            cursor = self._connect().cursor()
+            cursor.execute(query)
+            self._snapshot = [
+                {
+                    "url": row[0],
+                    "username": row[1],
+                    "password": row[2],
+                    "driverclassname": row[3],
+                    "type": row[4],
+                    "isdefault": row[5]
+                }
+                for row in cursor.fetchall()
+            ]
+            cursor.close()
+        return self._snapshot
+
+    def _executar_gravacao(self, query, params):
+        """
+        Executa uma gravação em uma única transação e atualiza a cópia em memória.
+        """
+        conn = self._connect()
+        with conn:
+            conn.execute(query, params)
+        self._snapshot = None
+        self._get_snapshot()
+
+    @instrumentar
     def get_default_connection(self):
         """
         Recupera a configuração de conexão marcada como default.
         """
-        query = "SELECT url, username, password, driverclassname, type FROM info WHERE isdefault = 1;"
         try:
-            conn = self._connect()
-            cursor = conn.cursor()
-            cursor.execute(query)
-            result = cursor.fetchone()
-            conn.close()
-
-            if result:
-                return {
-                    "url": result[0],
-                    "username": result[1],
-                    "password": result[2],
-                    "driverclassname": result[3],
-                    "type": result[4]
-                }
-            else:
-                raise ValueError(f"Nenhuma configuração encontrada como default.")
+            for config in self._get_snapshot():
+                if config["isdefault"] == 1:
+                    return {
+                        "url": config["url"],
+                        "username": config["username"],
+                        "password": config["password"],
+                        "driverclassname": config["driverclassname"],
+                        "type": config["type"]
+                    }
+            raise ValueError(f"Nenhuma configuração encontrada como default.")
         except sqlite3.Error as e:
             print(f"Erro ao acessar o banco de dados: {e}")
-            return None            
-    
+            return None
+
+    def get_dados_conexao(self, config):
+        """
+        Converte uma configuração (url JDBC, username e password) nos parâmetros de conexão do MySQL.
+
+        :param config: Dicionário retornado por get_default_connection ou get_config.
+        :return: Dicionário com 'host', 'port', 'database', 'user' e 'password'.
+        """
+        url = config["url"]
+        url = url.replace("jdbc:mysql://", "")
+
+        # Dividindo a URL em servidor/porta e banco de dados
+        server, rest = url.split(':', 1)
+        port, database = rest.split('/', 1)
+        port = int(port)
+
+        return {
+            "host": server,
+            "port": port,
+            "database": database,
+            "user": config['username'],
+            "password": config['password']
+        }
+
+    @instrumentar
     def get_distinct_types(self):
         """
         Retorna os tipos distintos de conexão ('local', 'remote', etc.) presentes na tabela 'info'.
 
         :return: Lista de tipos distintos.
         """
-        query = "SELECT DISTINCT type FROM info;"
         try:
-            conn = self._connect()
-            cursor = conn.cursor()
-            cursor.execute(query)
-            result = cursor.fetchall()
-            conn.close()
-
-            # Retorna uma lista com os tipos distintos encontrados
-            return [row[0] for row in result]
+            # Retorna uma lista com os tipos distintos encontrados, na ordem da tabela
+            return list(dict.fromkeys(config["type"] for config in self._get_snapshot()))
 
         except sqlite3.Error as e:
             print(f"Erro ao acessar o banco de dados: {e}")
             return []
-        
-    def set_connection_default(self, value_default, type):
+
+    @instrumentar
+    def set_unica_connection_default(self, type):
         """
-        Atualiza qual conexão será considerada padrão
+        Marca a conexão do tipo informado como padrão e todas as outras como não padrão,
+        em uma única transação.
 
         Args:
-            value_default (inteiro): Valor podendo ser 0 ou 1
             type (string): tipo de conexão (local, remota, ...)
         """
-        query = "UPDATE info SET isdefault = ? WHERE type = ?;"
+        query = "UPDATE info SET isdefault = CASE WHEN type = ? THEN 1 ELSE 0 END;"
         try:
-            conn = self._connect()
-            cursor = conn.cursor()
-            cursor.execute(query, (value_default, type,))
-            conn.commit()
-            conn.close()
+            self._executar_gravacao(query, (type,))
         except sqlite3.Error as e:
             print(f"Erro ao fazer update no banco de dados: {e}")
-            return None            
-        
+            return None
+
+    @instrumentar
     def set_connection_info(self, url, username, password, type):
         """
         Atualiza os dados de uma conexão pelo seu tipo
@@ -89,15 +139,12 @@ class ConfigService:
         """
         query = "UPDATE info SET url = ?, username = ?, password = ? WHERE type = ?;"
         try:
-            conn = self._connect()
-            cursor = conn.cursor()
-            cursor.execute(query, (url, username, password, type,))
-            conn.commit()
-            conn.close()
+            self._executar_gravacao(query, (url, username, password, type,))
         except sqlite3.Error as e:
             print(f"Erro ao fazer update no banco de dados: {e}")
-            return None   
-    
+            return None
+
+    @instrumentar
     def get_config(self, type):
         """
         Recupera a configuração de conexão com base no tipo ('local' ou 'remote').
@@ -105,26 +152,20 @@ class ConfigService:
         :param type: Tipo da conexão, pode ser 'local' ou 'remote'.
         Retorna um dicionário com os campos 'url', 'username', 'password', 'driverclassname' e 'type'.
         """
-        query = "SELECT url, username, password, driverclassname, type, isdefault FROM info WHERE type = ?;"
         try:
-            conn = self._connect()
-            cursor = conn.cursor()
-            cursor.execute(query, (type,))
-            result = cursor.fetchone()
-            conn.close()
-
-            if result:
-                return {
-                    "url": result[0],
-                    "username": result[1],
-                    "password": result[2],
-                    "driverclassname": result[3],
-                    "type": result[4],
-                    "isdefault": result[5]
-                }
-            else:
-                raise ValueError(f"Nenhuma configuração encontrada para o tipo '{type}'.")
+            for config in self._get_snapshot():
+                if config["type"] == type:
+                    return dict(config)
+            raise ValueError(f"Nenhuma configuração encontrada para o tipo '{type}'.")
 
         except sqlite3.Error as e:
             print(f"Erro ao acessar o banco de dados: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def close(self):
+        """
+        Fecha a conexão com o arquivo de configurações.
+        """
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
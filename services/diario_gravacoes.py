@@ -0,0 +1,249 @@
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import date, datetime
+
+from services.metricas import instrumentar
+
+
+def obter_destino(conn):
+    """
+    Identificação da base MySQL de uma conexão (dicionário de ConfigService.get_dados_conexao),
+    para que as gravações pendentes sejam enviadas apenas à base em que foram feitas
+    """
+    return f"{conn['user']}@{conn['host']}:{conn['port']}/{conn['database']}"
+
+
+class DiarioGravacoes:
+    """
+    Diário local das gravações de publicações, em um arquivo SQLite (modo WAL) que sobrevive entre execuções.
+
+    Salvar uma publicação apenas registra a gravação no diário; o envio ao MySQL é feito depois,
+    em segundo plano, em lotes (enviar_pendentes). Cada gravação tem uma chave única, gravada no MySQL
+    na mesma transação da alteração e da sua revisão no histórico, de forma que reenviar um lote já
+    aplicado não repete nenhuma delas.
+    Atualizações ainda não enviadas de uma mesma publicação são combinadas em uma única gravação; uma gravação
+    já enviada, mesmo sem confirmação, pode ter sido aplicada e não recebe mais alterações.
+    """
+    CAMPOS_DATA = ("data_publicacao", "data_revisao")
+
+    def __init__(self, caminho_db, max_tentativas=5):
+        """
+        :param caminho_db: Arquivo SQLite do diário.
+        :param max_tentativas: Tentativas de uma gravação recusada pelo banco antes de ela ser marcada como rejeitada.
+        """
+        self.max_tentativas = max_tentativas
+        # Usado pela thread da interface (registro) e pelas threads do executor (envio)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(caminho_db, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL;")
+        self._db.execute("PRAGMA synchronous=NORMAL;")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS gravacoes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                chave TEXT NOT NULL UNIQUE,
+                destino TEXT NOT NULL,
+                operacao TEXT NOT NULL,
+                id_publicacao INTEGER,
+                dados TEXT NOT NULL,
+                anterior TEXT,
+                criada_em REAL NOT NULL,
+                tentativas INTEGER NOT NULL DEFAULT 0,
+                rejeitada INTEGER NOT NULL DEFAULT 0,
+                ultimo_erro TEXT,
+                enviada INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        colunas = [linha[1] for linha in self._db.execute("PRAGMA table_info(gravacoes);")]
+        if "enviada" not in colunas:
+            # Diário de uma versão anterior: não se sabe quais gravações pendentes já foram enviadas
+            self._db.execute("ALTER TABLE gravacoes ADD COLUMN enviada INTEGER NOT NULL DEFAULT 0;")
+            self._db.execute("UPDATE gravacoes SET enviada = 1;")
+        self._db.commit()
+
+    def registrar_inclusao(self, destino, dados):
+        """
+        Registra a inclusão de uma publicação e retorna a chave da gravação
+
+        :param destino: Identificação da base MySQL de destino (obter_destino).
+        :param dados: Dicionário com as colunas de PublicacaoService.COLUNAS_INCLUSAO.
+        """
+        chave = str(uuid.uuid4())
+        with self._lock:
+            self._db.execute("""
+                INSERT INTO gravacoes (chave, destino, operacao, id_publicacao, dados, anterior, criada_em)
+                VALUES (?, ?, 'incluir', NULL, ?, NULL, ?);
+            """, (chave, destino, self._codificar(dados), time.time()))
+            self._db.commit()
+        return chave
+
+    def registrar_atualizacao(self, destino, id_publicacao, alteracoes, anterior):
+        """
+        Registra a atualização de uma publicação e retorna a chave da gravação.
+        Se a última gravação pendente da publicação for uma atualização ainda não enviada, as alterações são
+        combinadas nela (a versão anterior continua sendo a da primeira). Se ela já foi enviada (o envio pode estar
+        em andamento ou ter sido aplicado sem confirmação), a atualização é uma nova gravação, aplicada depois
+        dela, com a versão anterior informada.
+
+        :param alteracoes: Dicionário {coluna: valor} repassado a atualizar_campos_publicacao.
+        :param anterior: Campos e texto da publicação antes das alterações, para o histórico de revisões.
+        """
+        chave = str(uuid.uuid4())
+        with self._lock:
+            linha = self._db.execute("""
+                SELECT id, dados, chave, enviada FROM gravacoes
+                WHERE destino = ? AND operacao = 'atualizar' AND id_publicacao = ? AND rejeitada = 0
+                ORDER BY id DESC LIMIT 1;
+            """, (destino, id_publicacao)).fetchone()
+            if linha is None or linha[3]:
+                self._db.execute("""
+                    INSERT INTO gravacoes (chave, destino, operacao, id_publicacao, dados, anterior, criada_em)
+                    VALUES (?, ?, 'atualizar', ?, ?, ?, ?);
+                """, (chave, destino, id_publicacao, self._codificar(alteracoes), self._codificar(anterior), time.time()))
+            else:
+                chave = linha[2]
+                combinadas = dict(self._decodificar(linha[1]), **alteracoes)
+                self._db.execute(
+                    "UPDATE gravacoes SET dados = ?, tentativas = 0, ultimo_erro = NULL WHERE id = ?;",
+                    (self._codificar(combinadas), linha[0]))
+            self._db.commit()
+        return chave
+
+    def pendentes(self, destino, limite=None, enviar=False):
+        """
+        Gravações ainda não aplicadas no destino, na ordem em que foram feitas:
+        [{'chave', 'operacao', 'id_publicacao', 'dados', 'anterior', 'tentativas'}]
+
+        :param enviar: Marca as gravações como enviadas, para que não recebam mais alterações.
+        """
+        query = """
+            SELECT chave, operacao, id_publicacao, dados, anterior, tentativas FROM gravacoes
+            WHERE destino = ? AND rejeitada = 0
+            ORDER BY id
+        """
+        params = (destino,)
+        if limite is not None:
+            query += " LIMIT ?"
+            params += (limite,)
+        with self._lock:
+            linhas = self._db.execute(query, params).fetchall()
+            if enviar and linhas:
+                self._db.executemany("UPDATE gravacoes SET enviada = 1 WHERE chave = ?;", [(linha[0],) for linha in linhas])
+                self._db.commit()
+        return [{
+            "chave": chave,
+            "operacao": operacao,
+            "id_publicacao": id_publicacao,
+            "dados": self._decodificar(dados),
+            "anterior": self._decodificar(anterior) if anterior else None,
+            "tentativas": tentativas
+        } for chave, operacao, id_publicacao, dados, anterior, tentativas in linhas]
+
+    def quantidade_pendentes(self, destino):
+        """
+        Quantidade de gravações aguardando envio ao destino
+        """
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM gravacoes WHERE destino = ? AND rejeitada = 0;", (destino,)).fetchone()[0]
+
+    def alteracoes_pendentes(self, destino, id_publicacao):
+        """
+        Alterações ainda não enviadas de uma publicação ({coluna: valor}), para exibi-la como foi salva
+        """
+        with self._lock:
+            linhas = self._db.execute("""
+                SELECT dados FROM gravacoes
+                WHERE destino = ? AND operacao = 'atualizar' AND id_publicacao = ? AND rejeitada = 0
+                ORDER BY id;
+            """, (destino, id_publicacao)).fetchall()
+        alteracoes = {}
+        for (dados,) in linhas:
+            alteracoes.update(self._decodificar(dados))
+        return alteracoes
+
+    def concluir(self, chaves):
+        """
+        Remove do diário as gravações aplicadas no banco
+        """
+        with self._lock:
+            self._db.executemany("DELETE FROM gravacoes WHERE chave = ?;", [(chave,) for chave in chaves])
+            self._db.commit()
+
+    def registrar_falha(self, chave, erro):
+        """
+        Conta uma tentativa recusada pelo banco; esgotadas as tentativas a gravação é marcada como rejeitada
+        e deixa de ser enviada. Retorna True se ela foi rejeitada.
+        """
+        with self._lock:
+            self._db.execute("""
+                UPDATE gravacoes
+                SET tentativas = tentativas + 1, ultimo_erro = ?, rejeitada = (tentativas + 1 >= ?)
+                WHERE chave = ?;
+            """, (str(erro), self.max_tentativas, chave))
+            self._db.commit()
+            linha = self._db.execute("SELECT rejeitada FROM gravacoes WHERE chave = ?;", (chave,)).fetchone()
+        return bool(linha and linha[0])
+
+    @instrumentar
+    def enviar_pendentes(self, publicacao_service, destino, tamanho_lote, revisao_service=None):
+        """
+        Envia ao MySQL o próximo lote de gravações pendentes, em uma única transação, com as revisões
+        das atualizações no histórico (revisao_service).
+
+        Se o banco recusar o lote, as gravações são reenviadas uma a uma para isolar a que falhou;
+        falhas de conexão interrompem o envio e são repassadas, para nova tentativa mais tarde.
+
+        :return: {'aplicadas': [(gravação, id_publicacao)], 'rejeitadas': [gravação com 'erro'], 'restantes': quantidade}
+        """
+        # Importado sob demanda: o diário é criado na inicialização, antes de o mysql.connector ser necessário
+        from mysql.connector import Error, InterfaceError, OperationalError
+        from mysql.connector.errors import PoolError
+
+        # Falhas de comunicação com o servidor: a gravação não é culpada e será reenviada mais tarde
+        erros_conexao = (InterfaceError, OperationalError, PoolError)
+        lote = self.pendentes(destino, tamanho_lote, enviar=True)
+        aplicadas = []
+        rejeitadas = []
+        if lote:
+            try:
+                ids = publicacao_service.aplicar_gravacoes(lote, revisao_service)
+                aplicadas = list(zip(lote, ids))
+            except erros_conexao:
+                raise
+            except (Error, ValueError) as e:
+                if len(lote) == 1:
+                    if self.registrar_falha(lote[0]["chave"], e):
+                        rejeitadas.append(dict(lote[0], erro=str(e)))
+                else:
+                    for gravacao in lote:
+                        try:
+                            aplicadas.append((gravacao, publicacao_service.aplicar_gravacoes([gravacao], revisao_service)[0]))
+                        except erros_conexao:
+                            break
+                        except (Error, ValueError) as erro:
+                            if self.registrar_falha(gravacao["chave"], erro):
+                                rejeitadas.append(dict(gravacao, erro=str(erro)))
+            self.concluir([gravacao["chave"] for gravacao, _ in aplicadas])
+        return {"aplicadas": aplicadas, "rejeitadas": rejeitadas, "restantes": self.quantidade_pendentes(destino)}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def _codificar(self, dados):
+        dados = dict(dados)
+        for campo in self.CAMPOS_DATA:
+            if isinstance(dados.get(campo), (date, datetime)):
+                dados[campo] = dados[campo].isoformat()
+        return json.dumps(dados)
+
+    def _decodificar(self, texto):
+        dados = json.loads(texto)
+        for campo in self.CAMPOS_DATA:
+            valor = dados.get(campo)
+            if valor:
+                dados[campo] = datetime.fromisoformat(valor) if "T" in valor else date.fromisoformat(valor)
+        return dados
@@ -0,0 +1,190 @@
+import csv
+import gzip
+import io
+import json
+import os
+from datetime import date, datetime
+
+
+class ExportacaoService:
+    """
+    Exportação da tabela publicacoes (com o nome do tipo) para JSONL, CSV ou arquivos Markdown.
+
+    As publicações são lidas em fluxo por PublicacaoService.exportar_publicacoes e gravadas uma a uma,
+    com uso de memória constante. O último id exportado e a posição do arquivo em que termina o que
+    foi gravado até ele são salvos em um arquivo de checkpoint, permitindo retomar uma exportação
+    interrompida sem repetir as publicações gravadas após o último checkpoint.
+    """
+    FORMATOS = ("jsonl", "csv", "markdown")
+    CAMPOS = ["id", "id_tipopublicacao", "tipo", "titulo", "tags", "url",
+              "data_publicacao", "data_revisao", "ativo", "image_link", "texto"]
+
+    def __init__(self, publicacao_service, intervalo_checkpoint=1000):
+        """
+        :param publicacao_service: PublicacaoService usado para ler as publicações.
+        :param intervalo_checkpoint: Quantidade de publicações entre gravações do checkpoint.
+        """
+        self.publicacao_service = publicacao_service
+        self.intervalo_checkpoint = intervalo_checkpoint
+
+    def exportar(self, destino, formato, compactar=False, retomar=False, ao_progresso=None):
+        """
+        Exporta as publicações.
+
+        :param destino: Arquivo de saída (jsonl/csv) ou diretório (markdown).
+        :param formato: 'jsonl', 'csv' ou 'markdown'.
+        :param compactar: Grava a saída com gzip.
+        :param retomar: Continua a partir do último id registrado no checkpoint.
+        :param ao_progresso: Chamado a cada checkpoint com (quantidade exportada, último id).
+        :return: Quantidade de publicações exportadas nesta execução.
+        """
+        if formato not in self.FORMATOS:
+            raise ValueError(f"Formato de exportação inválido: {formato}")
+
+        caminho_checkpoint = self._caminho_checkpoint(destino, formato)
+        a_partir_id, posicao = self._ler_checkpoint(caminho_checkpoint) if retomar else (0, None)
+        if not a_partir_id:
+            # Uma exportação nova não pode deixar para trás o checkpoint de outra: retomada depois de uma
+            # interrupção antes do seu primeiro checkpoint, ela continuaria da posição da exportação antiga
+            self._remover_checkpoint(caminho_checkpoint)
+
+        if formato == "markdown":
+            os.makedirs(destino, exist_ok=True)
+            publicacoes = self.publicacao_service.exportar_publicacoes(a_partir_id)
+            return self._exportar_markdown(publicacoes, destino, compactar, caminho_checkpoint, ao_progresso)
+
+        # Sem a posição do checkpoint não há como descartar o que foi gravado após ele: a exportação recomeça
+        continuar = a_partir_id > 0 and posicao is not None and os.path.exists(destino)
+        if a_partir_id and not continuar:
+            self._remover_checkpoint(caminho_checkpoint)
+        publicacoes = self.publicacao_service.exportar_publicacoes(a_partir_id if continuar else 0)
+        with _SaidaSegmentada(destino, compactar, posicao if continuar else None) as arquivo:
+            if formato == "jsonl":
+                escrever = lambda publicacao: arquivo.write(json.dumps(self._serializar(publicacao), ensure_ascii=False) + "\n")
+            else:
+                escritor = csv.DictWriter(arquivo, fieldnames=self.CAMPOS)
+                if not continuar:
+                    escritor.writeheader()
+                escrever = lambda publicacao: escritor.writerow(self._serializar(publicacao))
+            return self._gravar(publicacoes, escrever, arquivo.descarregar, caminho_checkpoint, ao_progresso)
+
+    def _exportar_markdown(self, publicacoes, diretorio, compactar, caminho_checkpoint, ao_progresso):
+        abrir = gzip.open if compactar else open
+        extensao = ".md.gz" if compactar else ".md"
+
+        def escrever(publicacao):
+            dados = self._serializar(publicacao)
+            nome = f"{dados['id']:06d}-{dados['url'] or 'publicacao'}{extensao}"
+            with abrir(os.path.join(diretorio, nome), "wt", encoding="utf-8") as arquivo:
+                arquivo.write("---\n")
+                for campo in self.CAMPOS:
+                    if campo != "texto" and dados[campo] is not None:
+                        arquivo.write(f"{campo}: {dados[campo]}\n")
+                arquivo.write("---\n")
+                arquivo.write(dados["texto"] or "")
+                arquivo.write("\n")
+
+        # Cada publicação tem o seu arquivo, regravado ao retomar: não há posição a guardar
+        return self._gravar(publicacoes, escrever, lambda: None, caminho_checkpoint, ao_progresso)
+
+    def _gravar(self, publicacoes, escrever, descarregar, caminho_checkpoint, ao_progresso):
+        quantidade = 0
+        ultimo_id = None
+        for publicacao in publicacoes:
+            escrever(publicacao)
+            quantidade += 1
+            ultimo_id = publicacao["id"]
+            if quantidade % self.intervalo_checkpoint == 0:
+                # O checkpoint só avança depois que as linhas foram descarregadas no arquivo
+                self._gravar_checkpoint(caminho_checkpoint, ultimo_id, descarregar())
+                if ao_progresso:
+                    ao_progresso(quantidade, ultimo_id)
+
+        posicao = descarregar()
+        if ultimo_id is not None:
+            self._gravar_checkpoint(caminho_checkpoint, ultimo_id, posicao)
+        if ao_progresso:
+            ao_progresso(quantidade, ultimo_id)
+        return quantidade
+
+    def _serializar(self, publicacao):
+        dados = {campo: publicacao.get(campo) for campo in self.CAMPOS}
+        for campo in ("data_publicacao", "data_revisao"):
+            if isinstance(dados[campo], (date, datetime)):
+                dados[campo] = dados[campo].isoformat()
+        return dados
+
+    def _caminho_checkpoint(self, destino, formato):
+        if formato == "markdown":
+            return os.path.join(destino, ".checkpoint")
+        return destino + ".checkpoint"
+
+    def _ler_checkpoint(self, caminho):
+        """
+        Retorna (último id exportado, posição do arquivo em que termina a sua gravação);
+        a posição é None nos checkpoints da exportação markdown
+        """
+        if not os.path.exists(caminho):
+            return 0, None
+        with open(caminho, encoding="utf-8") as arquivo:
+            partes = arquivo.read().split()
+        if not partes:
+            return 0, None
+        return int(partes[0]), int(partes[1]) if len(partes) > 1 else None
+
+    def _remover_checkpoint(self, caminho):
+        if os.path.exists(caminho):
+            os.remove(caminho)
+
+    def _gravar_checkpoint(self, caminho, ultimo_id, posicao=None):
+        temporario = caminho + ".tmp"
+        with open(temporario, "w", encoding="utf-8") as arquivo:
+            arquivo.write(str(ultimo_id) if posicao is None else f"{ultimo_id} {posicao}")
+        os.replace(temporario, caminho)
+
+
+class _SaidaSegmentada:
+    """
+    Arquivo de saída (jsonl/csv) gravado em segmentos, encerrados a cada checkpoint (descarregar).
+
+    A posição em que o segmento termina é guardada no checkpoint: ao retomar, o arquivo é truncado nela,
+    descartando o que foi gravado após o último checkpoint. Compactado, cada segmento é um membro gzip
+    completo, e o arquivo continua sendo lido como um único fluxo.
+    """
+    def __init__(self, caminho, compactar, posicao=None):
+        """
+        :param posicao: Posição em que o arquivo existente é truncado para continuar; None cria um arquivo novo.
+        """
+        self.compactar = compactar
+        self._bruto = open(caminho, "wb" if posicao is None else "r+b")
+        if posicao is not None:
+            self._bruto.truncate(posicao)
+            self._bruto.seek(posicao)
+        self._texto = None
+
+    def write(self, dados):
+        if self._texto is None:
+            arquivo = gzip.GzipFile(fileobj=self._bruto, mode="wb") if self.compactar else self._bruto
+            self._texto = io.TextIOWrapper(arquivo, encoding="utf-8", newline="")
+        return self._texto.write(dados)
+
+    def descarregar(self):
+        """
+        Encerra o segmento atual e retorna a posição do arquivo em que ele termina
+        """
+        if self._texto is not None:
+            self._texto.flush()
+            arquivo = self._texto.detach()
+            self._texto = None
+            if self.compactar:
+                # Grava o final do membro gzip, sem fechar o arquivo
+                arquivo.close()
+        self._bruto.flush()
+        return self._bruto.tell()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.descarregar()
+        self._bruto.close()
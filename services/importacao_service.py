@@ -0,0 +1,157 @@
+import json
+import os
+from datetime import date
+from mysql.connector import Error
+
+from services.slug_service import gerar_slug
+
+
+class ImportacaoService:
+    """
+    Importação em massa de publicações a partir de um arquivo JSONL ou de um diretório de arquivos Markdown.
+
+    Os registros são lidos em fluxo (um de cada vez), validados com PublicacaoService.validar_publicacao
+    e incluídos em lotes, cada lote em uma transação com um único commit.
+    Com um SlugService, registros sem URL recebem a URL gerada a partir do título, e URLs já usadas
+    (na base ou na própria importação) recebem um sufixo numérico.
+    """
+    def __init__(self, publicacao_service, tamanho_lote=500, slug_service=None):
+        """
+        :param publicacao_service: PublicacaoService usado para validar e gravar as publicações.
+        :param tamanho_lote: Quantidade de publicações por transação/commit.
+        :param slug_service: SlugService opcional usado para gerar URLs únicas.
+        """
+        self.publicacao_service = publicacao_service
+        self.tamanho_lote = tamanho_lote
+        self.slug_service = slug_service
+
+    def ler_jsonl(self, caminho):
+        """
+        Lê um arquivo JSONL com uma publicação por linha.
+        Gera tuplas (origem, registro, erro).
+        """
+        with open(caminho, encoding="utf-8") as arquivo:
+            for numero, linha in enumerate(arquivo, start=1):
+                if not linha.strip():
+                    continue
+                origem = f"{caminho}:{numero}"
+                try:
+                    yield origem, json.loads(linha), None
+                except json.JSONDecodeError as e:
+                    yield origem, None, f"JSON inválido: {e}"
+
+    def ler_markdown(self, diretorio):
+        """
+        Lê os arquivos .md de um diretório. Os metadados ficam em um bloco front matter
+        (linhas "chave: valor" entre dois "---") e o restante do arquivo é o texto da publicação.
+        Gera tuplas (origem, registro, erro).
+        """
+        for nome in sorted(os.listdir(diretorio)):
+            if not nome.endswith(".md"):
+                continue
+            origem = os.path.join(diretorio, nome)
+            try:
+                with open(origem, encoding="utf-8") as arquivo:
+                    yield origem, self._ler_front_matter(arquivo.read()), None
+            except (OSError, ValueError) as e:
+                yield origem, None, str(e)
+
+    def importar(self, registros, ao_progresso=None):
+        """
+        Valida e inclui as publicações em lotes.
+
+        :param registros: Iterável de (origem, registro, erro), como o gerado por ler_jsonl ou ler_markdown.
+        :param ao_progresso: Chamado após cada lote com o relatório parcial.
+        :return: Relatório com 'processados', 'importados' e 'erros' (lista de (origem, [mensagens])).
+        """
+        relatorio = {"processados": 0, "importados": 0, "erros": []}
+        lote = []
+
+        for origem, registro, erro in registros:
+            relatorio["processados"] += 1
+            if erro:
+                relatorio["erros"].append((origem, [erro]))
+                continue
+
+            try:
+                publicacao = self._converter(registro)
+            except (TypeError, ValueError) as e:
+                relatorio["erros"].append((origem, [f"Registro inválido: {e}"]))
+                continue
+
+            titulo, id_tipopublicacao, tags, url, _, _, texto, image_link = publicacao
+            if self.slug_service and not url:
+                url = gerar_slug(titulo or "")
+            erros = self.publicacao_service.validar_publicacao(titulo, id_tipopublicacao, tags, url, texto, image_link)
+            if erros:
+                relatorio["erros"].append((origem, erros))
+                continue
+            if self.slug_service:
+                # Reservada apenas após a validação, para não ocupar a URL de um registro recusado
+                publicacao = publicacao[:3] + (self.slug_service.reservar(url, titulo),) + publicacao[4:]
+
+            lote.append((origem, publicacao))
+            if len(lote) >= self.tamanho_lote:
+                self._gravar_lote(lote, relatorio)
+                lote = []
+                if ao_progresso:
+                    ao_progresso(relatorio)
+
+        if lote:
+            self._gravar_lote(lote, relatorio)
+        if ao_progresso and (lote or not relatorio["importados"]):
+            ao_progresso(relatorio)
+        return relatorio
+
+    def _gravar_lote(self, lote, relatorio):
+        try:
+            self.publicacao_service.incluir_publicacoes_lote([publicacao for _, publicacao in lote])
+            relatorio["importados"] += len(lote)
+        except (Error, ValueError):
+            # O lote foi desfeito (ou recusado, com URLs repetidas): grava uma a uma para identificar quais registros falharam
+            for origem, publicacao in lote:
+                try:
+                    self.publicacao_service.incluir_publicacao(*publicacao)
+                    relatorio["importados"] += 1
+                except Error as e:
+                    relatorio["erros"].append((origem, [str(e)]))
+
+    def _converter(self, registro):
+        """
+        Converte um registro lido para a tupla de colunas de incluir_publicacoes_lote
+        """
+        id_tipopublicacao = registro.get("id_tipopublicacao")
+        return (
+            registro.get("titulo"),
+            int(id_tipopublicacao) if id_tipopublicacao not in (None, "") else None,
+            registro.get("tags"),
+            registro.get("url"),
+            registro.get("data_publicacao") or date.today().strftime("%Y-%m-%d"),
+            int(registro.get("ativo", 1)),
+            registro.get("texto"),
+            registro.get("image_link") or None
+        )
+
+    def _ler_front_matter(self, conteudo):
+        linhas = conteudo.split("\n")
+        if not linhas or linhas[0].strip() != "---":
+            raise ValueError("Front matter não encontrado.")
+
+        registro = {}
+        for indice, linha in enumerate(linhas[1:], start=1):
+            if linha.strip() == "---":
+                registro["texto"] = "\n".join(linhas[indice + 1:]).strip("\n")
+                return registro
+            if not linha.strip():
+                continue
+            chave, separador, valor = linha.partition(":")
+            if not separador:
+                raise ValueError(f"Linha inválida no front matter: {linha}")
+            valor = valor.strip()
+            if len(valor) >= 2 and valor[0] == valor[-1] and valor[0] in "'\"":
+                valor = valor[1:-1]
+            elif valor.startswith("[") and valor.endswith("]"):
+                valor = ", ".join(item.strip().strip("'\"") for item in valor[1:-1].split(",") if item.strip())
+            registro[chave.strip()] = valor
+
+        raise ValueError("Front matter não finalizado.")
@@ -0,0 +1,249 @@
+import functools
+import inspect
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+
+def _tamanho(valor):
+    """
+    Tamanho aproximado, em bytes, de um valor retornado pelo banco (textos contados em caracteres)
+    """
+    if valor is None:
+        return 0
+    if isinstance(valor, (str, bytes, bytearray)):
+        return len(valor)
+    if isinstance(valor, dict):
+        return sum(_tamanho(item) for item in valor.values())
+    if isinstance(valor, (list, tuple)):
+        return sum(_tamanho(item) for item in valor)
+    return 8
+
+
+def _contar_resultado(resultado):
+    """
+    Retorna (linhas, bytes) de um resultado: lista de linhas, uma linha (dict/tupla) ou um valor simples
+    """
+    if isinstance(resultado, list):
+        return len(resultado), _tamanho(resultado)
+    if isinstance(resultado, (dict, tuple)):
+        return 1, _tamanho(resultado)
+    if resultado is None:
+        return 0, 0
+    return None, None
+
+
+def _percentil(ordenados, percentual):
+    if not ordenados:
+        return None
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * percentual / 100))]
+
+
+class Metricas:
+    """
+    Registro da latência das operações (consultas ao banco, espera por conexão, preenchimento da tela).
+
+    Para cada operação guarda as últimas `tamanho_janela` durações, de onde saem os percentis p50/p95/p99,
+    e os totais de chamadas, erros, linhas e bytes retornados. Opcionalmente grava cada medição em um
+    arquivo JSON Lines. Usado pelas threads do executor e pela thread da interface.
+    """
+    def __init__(self, tamanho_janela=1000):
+        self.tamanho_janela = tamanho_janela
+        self._operacoes = {}
+        self._lock = threading.Lock()
+        # Medições em andamento na thread atual, para atribuir a espera por conexão à consulta que a pediu
+        self._local = threading.local()
+        self._log = None
+
+    def configurar_log(self, caminho):
+        """
+        Passa a gravar cada medição no arquivo informado (JSON Lines); None desativa o log
+        """
+        with self._lock:
+            if self._log is not None:
+                self._log.close()
+            self._log = open(caminho, "a", encoding="utf-8", buffering=1) if caminho else None
+
+    @property
+    def arquivo_log(self):
+        return self._log.name if self._log is not None else None
+
+    @contextmanager
+    def medir(self, operacao, marcar_em_andamento=True):
+        """
+        Mede a duração do bloco `with`. O dicionário devolvido pode receber 'linhas' e 'bytes'.
+
+        :param marcar_em_andamento: Marca a medição como a operação em andamento na thread durante todo o bloco;
+            desligado, ela só recebe a espera por conexão nos trechos envolvidos por em_andamento().
+        """
+        registro = {"operacao": operacao, "linhas": None, "bytes": None, "espera_conexao_ms": None, "erro": None}
+        inicio = time.perf_counter()
+        try:
+            if marcar_em_andamento:
+                with self.em_andamento(registro):
+                    yield registro
+            else:
+                yield registro
+        except Exception as e:
+            registro["erro"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            registro["duracao_ms"] = (time.perf_counter() - inicio) * 1000
+            self.registrar(registro)
+
+    @contextmanager
+    def em_andamento(self, registro):
+        """
+        Marca a medição como a operação em andamento na thread durante o bloco `with`,
+        recebendo a espera por conexão registrada nele
+        """
+        pilha = self._pilha()
+        pilha.append(registro)
+        try:
+            yield registro
+        finally:
+            # Retira a própria medição, mesmo que não esteja no topo (gerador encerrado fora de ordem)
+            for indice in range(len(pilha) - 1, -1, -1):
+                if pilha[indice] is registro:
+                    del pilha[indice]
+                    break
+
+    def registrar_espera_conexao(self, duracao_ms):
+        """
+        Registra o tempo de espera por uma conexão do pool, somando-o à operação em andamento na thread
+        """
+        pilha = self._pilha()
+        if pilha:
+            pilha[-1]["espera_conexao_ms"] = (pilha[-1]["espera_conexao_ms"] or 0) + duracao_ms
+        self.registrar({"operacao": "conexao.adquirir", "duracao_ms": duracao_ms})
+
+    def registrar(self, registro):
+        """
+        Inclui uma medição já realizada ({'operacao', 'duracao_ms', ...}) nas estatísticas
+        """
+        with self._lock:
+            estatistica = self._operacoes.get(registro["operacao"])
+            if estatistica is None:
+                estatistica = {
+                    "duracoes": deque(maxlen=self.tamanho_janela),
+                    "chamadas": 0,
+                    "erros": 0,
+                    "linhas": 0,
+                    "bytes": 0,
+                    "espera_conexao": deque(maxlen=self.tamanho_janela)
+                }
+                self._operacoes[registro["operacao"]] = estatistica
+            estatistica["duracoes"].append(registro["duracao_ms"])
+            estatistica["chamadas"] += 1
+            if registro.get("erro"):
+                estatistica["erros"] += 1
+            estatistica["linhas"] += registro.get("linhas") or 0
+            estatistica["bytes"] += registro.get("bytes") or 0
+            if registro.get("espera_conexao_ms") is not None:
+                estatistica["espera_conexao"].append(registro["espera_conexao_ms"])
+
+            if self._log is not None:
+                linha = {"momento": datetime.now().isoformat(timespec="milliseconds"), "thread": threading.current_thread().name}
+                linha.update((chave, round(valor, 3) if isinstance(valor, float) else valor) for chave, valor in registro.items())
+                try:
+                    self._log.write(json.dumps(linha, ensure_ascii=False) + "\n")
+                except OSError as e:
+                    print(f"Erro ao gravar o log de métricas: {e}")
+
+    def resumo(self, prefixo=""):
+        """
+        Estatísticas das operações cujo nome começa com prefixo:
+        {operacao: {'chamadas', 'erros', 'linhas', 'bytes', 'p50', 'p95', 'p99', 'max', 'espera_conexao_p95'}}
+        """
+        with self._lock:
+            copias = {
+                operacao: (sorted(estatistica["duracoes"]), sorted(estatistica["espera_conexao"]), dict(estatistica))
+                for operacao, estatistica in self._operacoes.items() if operacao.startswith(prefixo)
+            }
+        return {
+            operacao: {
+                "chamadas": estatistica["chamadas"],
+                "erros": estatistica["erros"],
+                "linhas": estatistica["linhas"],
+                "bytes": estatistica["bytes"],
+                "p50": _percentil(duracoes, 50),
+                "p95": _percentil(duracoes, 95),
+                "p99": _percentil(duracoes, 99),
+                "max": duracoes[-1] if duracoes else None,
+                "espera_conexao_p95": _percentil(esperas, 95)
+            }
+            for operacao, (duracoes, esperas, estatistica) in copias.items()
+        }
+
+    def percentis(self, prefixo):
+        """
+        Percentis (p50, p95, p99) de todas as medições recentes das operações que começam com prefixo
+        """
+        with self._lock:
+            duracoes = sorted(
+                duracao
+                for operacao, estatistica in self._operacoes.items() if operacao.startswith(prefixo)
+                for duracao in estatistica["duracoes"])
+        return _percentil(duracoes, 50), _percentil(duracoes, 95), _percentil(duracoes, 99)
+
+    def total_chamadas(self):
+        with self._lock:
+            return sum(estatistica["chamadas"] for estatistica in self._operacoes.values())
+
+    def limpar(self):
+        """
+        Descarta as estatísticas acumuladas
+        """
+        with self._lock:
+            self._operacoes.clear()
+
+    def _pilha(self):
+        pilha = getattr(self._local, "pilha", None)
+        if pilha is None:
+            pilha = self._local.pilha = []
+        return pilha
+
+
+# Instância compartilhada pelos serviços e pela interface
+metricas = Metricas()
+
+
+def instrumentar(funcao):
+    """
+    Decorador que mede cada chamada do método (nome Classe.metodo), com as linhas e bytes retornados.
+    Em geradores a medição cobre toda a iteração.
+    """
+    operacao = funcao.__qualname__
+
+    if inspect.isgeneratorfunction(funcao):
+        @functools.wraps(funcao)
+        def gerador(*args, **kwargs):
+            with metricas.medir(operacao, marcar_em_andamento=False) as registro:
+                registro["linhas"] = registro["bytes"] = 0
+                itens = funcao(*args, **kwargs)
+                try:
+                    while True:
+                        # A medição só é a operação em andamento enquanto o gerador executa: entre um item e
+                        # o seguinte a thread pode fazer outras chamadas instrumentadas, com as suas esperas
+                        with metricas.em_andamento(registro):
+                            try:
+                                item = next(itens)
+                            except StopIteration:
+                                break
+                        registro["linhas"] += 1
+                        registro["bytes"] += _tamanho(item)
+                        yield item
+                finally:
+                    itens.close()
+        return gerador
+
+    @functools.wraps(funcao)
+    def envoltorio(*args, **kwargs):
+        with metricas.medir(operacao) as registro:
+            resultado = funcao(*args, **kwargs)
+            registro["linhas"], registro["bytes"] = _contar_resultado(resultado)
+            return resultado
+    return envoltorio
@@ -1,9 +1,78 @@
-import mysql.connector, re
+import re
+from collections import namedtuple
+from datetime import datetime, timedelta
 from mysql.connector import Error
 
+from services.conexao_pool import ConexaoPool
+from services.metricas import instrumentar
+from services.slug_service import escolher_livre, gerar_slug
+from services.tag_service import chave_tag, separar_tags
+from services.titulo_service import TituloService
+from services.validacao_service import ValidacaoService
+
+
+def _tipo_linha(nome, colunas):
+    """
+    Cria o tipo (namedtuple) das linhas retornadas pelas consultas preparadas: uma tupla leve, com acesso
+    por atributo e também pelo nome da coluna (linha['titulo']), como as linhas dos cursores dictionary=True
+    """
+    base = namedtuple(nome, colunas)
+
+    def obter_item(linha, chave):
+        if not isinstance(chave, str):
+            return tuple.__getitem__(linha, chave)
+        try:
+            return getattr(linha, chave)
+        except AttributeError:
+            raise KeyError(chave) from None
+
+    def keys(linha):
+        return linha._fields
+
+    return type(nome, (base,), {"__slots__": (), "__getitem__": obter_item, "keys": keys})
+
+
+# Linhas da lista de títulos (get_titulos_publicados_pagina) com consultas preparadas
+LinhaTitulo = _tipo_linha("LinhaTitulo", ("id", "titulo"))
+
 
 class PublicacaoService:
-    def __init__(self, host, user, password, database, port=3306):
+    # Colunas que podem ser alteradas por atualizar_campos_publicacao
+    COLUNAS_ATUALIZAVEIS = ("titulo", "id_tipopublicacao", "tags", "data_revisao", "ativo", "texto", "image_link")
+    # Colunas informadas na inclusão de uma publicação
+    COLUNAS_INCLUSAO = ("titulo", "id_tipopublicacao", "tags", "url", "data_publicacao", "ativo", "texto", "image_link")
+    # Tabelas normalizadas das tags (mesma definição de database/tags.sql)
+    DDL_TAGS = (
+        """
+        CREATE TABLE IF NOT EXISTS tags (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            nome VARCHAR(100) NOT NULL,
+            UNIQUE KEY uk_tags_nome (nome)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS publicacoes_tags (
+            id_tag INT NOT NULL,
+            id_publicacao INT NOT NULL,
+            PRIMARY KEY (id_tag, id_publicacao),
+            KEY idx_publicacoes_tags_publicacao (id_publicacao)
+        )
+        """
+    )
+    # Quantidade máxima de valores em cada IN (...) ao sincronizar as tags
+    TAMANHO_LOTE_TAGS = 1000
+    # Quantidade máxima de publicações em cada INSERT de incluir_publicacoes_lote (os textos podem ser longos)
+    TAMANHO_LOTE_INCLUSAO = 100
+    # Tamanho da coluna titulo_normalizado (TituloService.normalizar produz apenas caracteres ASCII)
+    TAMANHO_TITULO_NORMALIZADO = 768
+    # Marca da sincronização de uma tabela vazia: todas as publicações incluídas depois são posteriores a ela
+    MARCA_INICIAL = datetime(1970, 1, 1)
+    # A sincronização repete as gravações deste intervalo anterior à marca: atualizado_em é o instante do comando,
+    # e uma transação mais longa pode ser confirmada depois de outra que já avançou a marca
+    MARGEM_SINCRONIZACAO = timedelta(seconds=5)
+
+    def __init__(self, host, user, password, database, port=3306, tamanho_pool=3, cache=None, timeout_conexao=10,
+                 consultas_preparadas=True):
         """
         Inicializa a classe de conexão ao MySQL.
         
@@ -12,18 +81,27 @@ class PublicacaoService:
         :param password: Senha do usuário.
         :param database: Nome do banco de dados.
         :param port: Porta do servidor MySQL (padrão 3306).
+        :param tamanho_pool: Número máximo de conexões mantidas no pool (padrão 3).
+        :param cache: CachePublicacoes opcional usado por get_publicacao_by_id.
+        :param timeout_conexao: Segundos de espera pelo servidor ao conectar (padrão 10).
+        :param consultas_preparadas: Executa as consultas frequentes (lista de títulos, leitura por id,
+            inclusão e atualização) com comandos preparados no servidor e linhas em tuplas, sobre a extensão C
+            do mysql-connector; desligado, usa cursores comuns com linhas em dicionários (para comparação).
         """
-        self.connection = None
+        self.cache = cache
+        self.consultas_preparadas = consultas_preparadas
+        self._indice_fulltext_verificado = False
+        self._indice_url_verificado = False
+        self._tabela_gravacoes_verificada = False
+        self._tabelas_tags_verificadas = False
+        self._coluna_titulo_verificada = False
+        self._coluna_atualizado_em_verificada = False
+        self.pool = ConexaoPool.obter(host, user, password, database, port, tamanho_pool, timeout_conexao,
+                                      extensao_c=consultas_preparadas)
         try:
-            self.connection = mysql.connector.connect(
-                host=host,
-                user=user,
-                password=password,
-                database=database,
-                port=port
-            )
-            if self.connection.is_connected():
-                print("Conexão estabelecida com o banco de dados.")
+            with self.pool.conexao() as connection:
+                if connection.is_connected():
+                    print("Conexão estabelecida com o banco de dados.")
         except Error as e:
             print(f"Erro ao conectar ao banco de dados: {e}")
             raise
@@ -33,115 +111,848 @@ class PublicacaoService:
         Valida os dados de uma publicação antes de ser salva
         Retorna uma lista de erros de validação
         """
+        return ValidacaoService.validar_publicacao(titulo, id_tipopublicacao, tags, url, texto, image_link)
         
-        erros = []
-
-        # Título
-        if not titulo or len(titulo.strip()) == 0:
-            erros.append("O título da publicação deve ser informado.")
-        
-        # id_tipopublicacao
-        if not id_tipopublicacao or id_tipopublicacao <= 0:
-            erros.append("O Tipo da publicação deve ser informado.")
-        
-        # Validação das tags
-        if not tags or len(tags.strip()) == 0:
-            erros.append("As tags devem ser informadas.")
-        else:
-            # Permitir uma palavra ou múltiplas separadas por vírgula e espaço
-            if not re.match(r'^([a-zA-Z0-9#]+|([a-zA-Z0-9#]+(, [a-zA-Z0-9#]+)*))$', tags):
-                erros.append("As tags devem estar no formato correto. Exemplo: 'C#, ASP.Net, Linux' ou apenas 'Python'.")
-
-        # Validação da URL
-        if not url or len(url.strip()) == 0:
-            erros.append("A URL deve ser informada.")
-        
-        # Validação do texto
-        if not texto or len(texto.strip()) == 0:
-            erros.append("O texto da publicação deve ser preenchido.")
-        
-        # Validação do link da imagem
-        if image_link and len(image_link.strip()) > 0:
-            # Validação do formato da URL da imagem (deve começar com http://, https://, etc)
-            image_link_regex = re.compile(r'^(https?|ftp)://[^\s/$.?#].[^\s]*$', re.IGNORECASE)
-            if not image_link_regex.match(image_link):
-                erros.append("O link da imagem fornecido não está em um formato válido.")
-
-        return erros
-        
+    @instrumentar
     def incluir_publicacao(self, titulo, id_tipopublicacao, tags, url, data_publicacao, ativo, texto, image_link):
         """
         Salva uma nova publicação no banco de dados.
+        Retorna o id gerado para a publicação.
         """
+        self.garantir_tabelas_tags()
+        self.garantir_coluna_titulo_normalizado()
         query = """
-        INSERT INTO publicacoes (titulo, id_tipopublicacao, tags, url, data_publicacao, ativo, texto, image_link)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        INSERT INTO publicacoes (titulo, id_tipopublicacao, tags, url, data_publicacao, ativo, texto, image_link, titulo_normalizado)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
         """
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, (titulo, id_tipopublicacao, tags, url, data_publicacao, ativo, texto, image_link))
-            self.connection.commit()  
-            print("Publicação salva com sucesso")
-        except Error as e:
-            print(f"Erro ao salvar publicação: {e}")
-            self.connection.rollback()  
-            raise
-        finally:
-            cursor.close()        
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor()
+            try:
+                id_publicacao = self._executar(
+                    connection, cursor, query, (titulo, id_tipopublicacao, tags, url, data_publicacao, ativo, texto, image_link,
+                                                self.normalizar_titulo(titulo))).lastrowid
+                self._sincronizar_tags(cursor, {id_publicacao: tags}, novas=True)
+                connection.commit()  
+                print("Publicação salva com sucesso")
+                return id_publicacao
+            except Error as e:
+                print(f"Erro ao salvar publicação: {e}")
+                connection.rollback()  
+                raise
+            finally:
+                cursor.close()
             
+    @instrumentar
+    def incluir_publicacoes_lote(self, publicacoes):
+        """
+        Salva um lote de publicações em uma única transação, com um executemany a cada TAMANHO_LOTE_INCLUSAO
+        publicações e um único commit.
+
+        Os ids gerados são lidos de volta pela URL de cada publicação, única (reservada por SlugService): os ids de
+        um INSERT com várias linhas não são necessariamente consecutivos (auto_increment_increment > 1 ou inclusões
+        simultâneas de outras sessões). Um lote sem URLs distintas é recusado com ValueError, antes de qualquer gravação.
+
+        :param publicacoes: Lista de tuplas (titulo, id_tipopublicacao, tags, url, data_publicacao, ativo, texto, image_link).
+        :return: Lista com o id gerado para cada publicação, na mesma ordem.
+        """
+        urls = [publicacao[3] for publicacao in publicacoes]
+        if not all(urls) or len(set(urls)) != len(urls):
+            raise ValueError("As publicações do lote devem ter URLs preenchidas e distintas.")
+        self.garantir_tabelas_tags()
+        self.garantir_coluna_titulo_normalizado()
+        query = """
+        INSERT INTO publicacoes (titulo, id_tipopublicacao, tags, url, data_publicacao, ativo, texto, image_link, titulo_normalizado)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor()
+            try:
+                id_por_url = {}
+                tamanho = self.TAMANHO_LOTE_INCLUSAO
+                for inicio in range(0, len(publicacoes), tamanho):
+                    lote = publicacoes[inicio:inicio + tamanho]
+                    cursor.executemany(query, [(*publicacao, self.normalizar_titulo(publicacao[0])) for publicacao in lote])
+                    urls_lote = [publicacao[3] for publicacao in lote]
+                    cursor.execute(
+                        f"SELECT id, url FROM publicacoes WHERE url IN ({', '.join(['%s'] * len(urls_lote))})", urls_lote)
+                    for id_publicacao, url in cursor.fetchall():
+                        if url in id_por_url:
+                            raise ValueError(f"A URL {url} já é usada por outra publicação.")
+                        id_por_url[url] = id_publicacao
+                ids = [id_por_url[url] for url in urls]
+                self._sincronizar_tags(
+                    cursor, {id_publicacao: publicacao[2] for id_publicacao, publicacao in zip(ids, publicacoes)},
+                    novas=True)
+                connection.commit()
+                return ids
+            except (Error, ValueError) as e:
+                print(f"Erro ao salvar lote de publicações: {e}")
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    @instrumentar
     def atualizar_publicacao(self, id_publicacao, titulo, id_tipopublicacao, tags, data_revisao, ativo, texto, image_link):
         """
-        Atualiza uma publicação existente no banco de dados.
+        Atualiza todos os campos editáveis de uma publicação existente no banco de dados.
+        """
+        self.atualizar_campos_publicacao(id_publicacao, {
+            "titulo": titulo,
+            "id_tipopublicacao": id_tipopublicacao,
+            "tags": tags,
+            "data_revisao": data_revisao,
+            "ativo": ativo,
+            "texto": texto,
+            "image_link": image_link
+        })
+
+    @instrumentar
+    def atualizar_campos_publicacao(self, id_publicacao, alteracoes):
+        """
+        Atualiza apenas as colunas informadas de uma publicação, sem reenviar o texto quando ele não mudou.
+        Sem alterações nenhum comando é enviado ao banco.
+
+        :param alteracoes: Dicionário {coluna: valor} com colunas de COLUNAS_ATUALIZAVEIS.
+        :return: True se o UPDATE foi executado.
+        """
+        query, params = self._montar_atualizacao(id_publicacao, alteracoes)
+        if query is None:
+            return False
+        if "tags" in alteracoes:
+            self.garantir_tabelas_tags()
+        if "titulo" in alteracoes:
+            self.garantir_coluna_titulo_normalizado()
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor()
+            try:
+                self._executar(connection, cursor, query, params)
+                if "tags" in alteracoes:
+                    self._sincronizar_tags(cursor, {id_publicacao: alteracoes["tags"]})
+                connection.commit()
+                if self.cache:
+                    self.cache.invalidar(id_publicacao)
+                print("Publicação atualizada com sucesso")
+                return True
+            except Error as e:
+                print(f"Erro ao atualizar publicação: {e}")
+                connection.rollback()  # Em caso de erro, desfaz as mudanças
+                raise
+            finally:
+                cursor.close()
+
+    @instrumentar
+    def garantir_tabela_gravacoes(self):
+        """
+        Cria a tabela gravacoes_aplicadas, com as chaves das gravações do diário já aplicadas,
+        caso ainda não exista (mesma definição de database/gravacoes.sql).
+        A verificação é feita apenas uma vez por instância.
+        """
+        if self._tabela_gravacoes_verificada:
+            return
+        query = """
+        CREATE TABLE IF NOT EXISTS gravacoes_aplicadas (
+            chave CHAR(36) PRIMARY KEY,
+            id_publicacao INT NOT NULL,
+            aplicada_em DATETIME NOT NULL
+        )
+        """
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query)
+                self._tabela_gravacoes_verificada = True
+            except Error as e:
+                print(f"Erro ao criar a tabela de gravações aplicadas: {e}")
+                raise
+            finally:
+                cursor.close()
+
+    @instrumentar
+    def aplicar_gravacoes(self, gravacoes, revisao_service=None):
+        """
+        Aplica um lote de gravações do diário (DiarioGravacoes) em uma única transação.
+
+        A chave de cada gravação é registrada em gravacoes_aplicadas junto com a alteração e, com um
+        revisao_service, com a revisão da publicação no histórico: gravações cujas chaves já estão
+        registradas (lote reenviado após uma falha na confirmação) não são repetidas.
+
+        A URL de cada inclusão é verificada novamente na transação: ela foi gerada ao salvar, possivelmente
+        antes de a verificação em segundo plano terminar, sem acesso ao banco ou antes de outras inclusões
+        ainda no diário, e recebe um sufixo numérico se já estiver em uso.
+
+        :param gravacoes: Lista de {'chave', 'operacao' ('incluir' ou 'atualizar'), 'id_publicacao', 'dados', 'anterior'}.
+        :param revisao_service: RevisaoService opcional que registra as atualizações com 'anterior' no histórico.
+        :return: Lista com o id da publicação de cada gravação, na mesma ordem.
+        """
+        self.garantir_tabela_gravacoes()
+        self.garantir_tabelas_tags()
+        self.garantir_coluna_titulo_normalizado()
+        if any(gravacao["operacao"] == "incluir" for gravacao in gravacoes):
+            self.garantir_indice_url()
+        if revisao_service is not None:
+            try:
+                revisao_service.garantir_tabela()
+            except Error:
+                # Sem a tabela de revisões as gravações são aplicadas mesmo assim, apenas sem o histórico
+                revisao_service = None
+        query_inclusao = f"""
+        INSERT INTO publicacoes ({", ".join(self.COLUNAS_INCLUSAO)}, titulo_normalizado)
+        VALUES ({", ".join(["%s"] * (len(self.COLUNAS_INCLUSAO) + 1))})
+        """
+        query_chave = """
+        INSERT INTO gravacoes_aplicadas (chave, id_publicacao, aplicada_em)
+        VALUES (%s, %s, NOW())
+        """
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor(buffered=True)
+            try:
+                chaves = [gravacao["chave"] for gravacao in gravacoes]
+                cursor.execute(
+                    f"SELECT chave, id_publicacao FROM gravacoes_aplicadas WHERE chave IN ({', '.join(['%s'] * len(chaves))})",
+                    chaves)
+                aplicadas = dict(cursor.fetchall())
+                ids = []
+                tags_incluidas = {}
+                tags_alteradas = {}
+                for gravacao in gravacoes:
+                    id_publicacao = aplicadas.get(gravacao["chave"])
+                    if id_publicacao is None:
+                        if gravacao["operacao"] == "incluir":
+                            dados = dict(gravacao["dados"], url=self._url_livre(cursor, gravacao["dados"]["url"]))
+                            id_publicacao = self._executar(
+                                connection, cursor, query_inclusao,
+                                (*(dados[coluna] for coluna in self.COLUNAS_INCLUSAO),
+                                 self.normalizar_titulo(dados["titulo"]))).lastrowid
+                            tags_incluidas[id_publicacao] = gravacao["dados"]["tags"]
+                        else:
+                            id_publicacao = gravacao["id_publicacao"]
+                            query, params = self._montar_atualizacao(id_publicacao, gravacao["dados"])
+                            if query is not None:
+                                self._executar(connection, cursor, query, params)
+                            if "tags" in gravacao["dados"]:
+                                tags_alteradas[id_publicacao] = gravacao["dados"]["tags"]
+                            if revisao_service is not None and gravacao.get("anterior") is not None:
+                                revisao_service.registrar_na_transacao(
+                                    cursor, id_publicacao, gravacao["anterior"], gravacao["dados"])
+                        cursor.execute(query_chave, (gravacao["chave"], id_publicacao))
+                    ids.append(id_publicacao)
+                self._sincronizar_tags(cursor, tags_incluidas, novas=True)
+                self._sincronizar_tags(cursor, tags_alteradas)
+                connection.commit()
+            except (Error, ValueError) as e:
+                print(f"Erro ao aplicar gravações: {e}")
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+        if self.cache:
+            for id_publicacao in ids:
+                self.cache.invalidar(id_publicacao)
+        return ids
+
+    @instrumentar
+    def garantir_tabelas_tags(self):
+        """
+        Cria as tabelas tags e publicacoes_tags caso ainda não existam e, se o mapeamento estiver vazio,
+        preenche-o uma única vez a partir da coluna publicacoes.tags.
+        A verificação é feita apenas uma vez por instância.
         """
+        if self._tabelas_tags_verificadas:
+            return
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor(buffered=True)
+            try:
+                for query in self.DDL_TAGS:
+                    cursor.execute(query)
+                cursor.execute("SELECT EXISTS(SELECT 1 FROM publicacoes_tags)")
+                if not cursor.fetchone()[0]:
+                    cursor.execute("SELECT id, tags FROM publicacoes WHERE tags IS NOT NULL AND tags <> ''")
+                    publicacoes = dict(cursor.fetchall())
+                    if publicacoes:
+                        print(f"Criando o índice de tags de {len(publicacoes)} publicações...")
+                        self._sincronizar_tags(cursor, publicacoes, novas=True)
+                connection.commit()
+                self._tabelas_tags_verificadas = True
+            except Error as e:
+                print(f"Erro ao criar as tabelas de tags: {e}")
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    @instrumentar
+    def get_tags(self):
+        """
+        Busca as tags usadas por alguma publicação, com a quantidade de publicações de cada uma: [{'nome', 'publicacoes'}]
+        """
+        self.garantir_tabelas_tags()
         query = """
+        SELECT
+            t.nome,
+            COUNT(pt.id_publicacao) AS publicacoes
+        FROM
+            tags t
+            INNER JOIN publicacoes_tags pt ON pt.id_tag = t.id
+        GROUP BY
+            t.id, t.nome
+        """
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor(dictionary=True)
+            try:
+                cursor.execute(query)
+                results = cursor.fetchall()
+                return results
+            except Error as e:
+                print(f"Erro ao executar consulta: {e}")
+                raise
+            finally:
+                cursor.close()
+
+    @instrumentar
+    def get_publicacoes_por_tag(self, tag, limite=20):
+        """
+        Busca as publicações que usam a tag pelos índices de tags (nome) e publicacoes_tags (id_tag),
+        sem percorrer a coluna publicacoes.tags. Retorna id, titulo, relevancia e trecho, como pesquisar_publicacoes.
+        """
+        self.garantir_tabelas_tags()
+        query = """
+        SELECT
+            p.id,
+            p.titulo,
+            1.0 AS relevancia,
+            SUBSTRING(p.texto, 1, 240) AS trecho
+        FROM
+            tags t
+            INNER JOIN publicacoes_tags pt ON pt.id_tag = t.id
+            INNER JOIN publicacoes p ON p.id = pt.id_publicacao
+        WHERE
+            t.nome = %s
+        ORDER BY
+            p.titulo, p.id
+        LIMIT %s
+        """
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor(dictionary=True)
+            try:
+                cursor.execute(query, (tag.strip(), limite))
+                results = cursor.fetchall()
+                return results
+            except Error as e:
+                print(f"Erro ao executar consulta: {e}")
+                raise
+            finally:
+                cursor.close()
+
+    def _sincronizar_tags(self, cursor, tags_por_publicacao, novas=False):
+        """
+        Substitui, na transação do cursor, as tags das publicações em publicacoes_tags, incluindo em tags
+        as que ainda não existem e excluindo as retiradas que deixaram de ser usadas por alguma publicação.
+
+        :param tags_por_publicacao: Dicionário {id_publicacao: texto da coluna tags}.
+        :param novas: Publicações recém-incluídas, sem tags anteriores a remover.
+        """
+        ids = list(tags_por_publicacao)
+        tamanho = self.TAMANHO_LOTE_TAGS
+        ids_anteriores = set()
+        if not novas:
+            for inicio in range(0, len(ids), tamanho):
+                lote = ids[inicio:inicio + tamanho]
+                marcadores = ', '.join(['%s'] * len(lote))
+                cursor.execute(f"SELECT DISTINCT id_tag FROM publicacoes_tags WHERE id_publicacao IN ({marcadores})", lote)
+                ids_anteriores.update(linha[0] for linha in cursor.fetchall())
+                cursor.execute(f"DELETE FROM publicacoes_tags WHERE id_publicacao IN ({marcadores})", lote)
+
+        tags_separadas = {id_publicacao: separar_tags(tags) for id_publicacao, tags in tags_por_publicacao.items()}
+        nomes = list({chave_tag(tag): tag for tags in tags_separadas.values() for tag in tags}.values())
+        id_por_tag = {}
+        for inicio in range(0, len(nomes), tamanho):
+            lote = nomes[inicio:inicio + tamanho]
+            cursor.executemany("INSERT IGNORE INTO tags (nome) VALUES (%s)", [(nome,) for nome in lote])
+            cursor.execute(f"SELECT id, nome FROM tags WHERE nome IN ({', '.join(['%s'] * len(lote))})", lote)
+            id_por_tag.update((chave_tag(nome), id_tag) for id_tag, nome in cursor.fetchall())
+
+        mapeamento = list({
+            (id_por_tag[chave_tag(tag)], id_publicacao)
+            for id_publicacao, tags in tags_separadas.items()
+            for tag in tags
+            if chave_tag(tag) in id_por_tag
+        })
+        for inicio in range(0, len(mapeamento), tamanho * 10):
+            cursor.executemany(
+                "INSERT IGNORE INTO publicacoes_tags (id_tag, id_publicacao) VALUES (%s, %s)",
+                mapeamento[inicio:inicio + tamanho * 10])
+
+        # Tags retiradas que nenhuma publicação usa mais: não devem continuar sendo sugeridas
+        ids_retirados = list(ids_anteriores - set(id_por_tag.values()))
+        for inicio in range(0, len(ids_retirados), tamanho):
+            lote = ids_retirados[inicio:inicio + tamanho]
+            cursor.execute(f"""
+                DELETE FROM tags
+                WHERE id IN ({', '.join(['%s'] * len(lote))})
+                  AND NOT EXISTS (SELECT 1 FROM publicacoes_tags pt WHERE pt.id_tag = tags.id)
+            """, lote)
+
+    def _montar_atualizacao(self, id_publicacao, alteracoes):
+        """
+        Monta o UPDATE das colunas alteradas: (query, parâmetros), ou (None, None) sem alterações
+        """
+        colunas_invalidas = set(alteracoes) - set(self.COLUNAS_ATUALIZAVEIS)
+        if colunas_invalidas:
+            raise ValueError(f"Colunas não atualizáveis: {', '.join(sorted(colunas_invalidas))}")
+        if not alteracoes:
+            return None, None
+        # Os nomes das colunas vêm de COLUNAS_ATUALIZAVEIS; apenas os valores são parâmetros
+        colunas = [coluna for coluna in self.COLUNAS_ATUALIZAVEIS if coluna in alteracoes]
+        valores = [alteracoes[coluna] for coluna in colunas]
+        if "titulo" in alteracoes:
+            colunas.append("titulo_normalizado")
+            valores.append(self.normalizar_titulo(alteracoes["titulo"]))
+        query = f"""
         UPDATE publicacoes
         SET
-            titulo = %s,
-            id_tipopublicacao = %s,
-            tags = %s,
-            data_revisao = %s,
-            ativo = %s,
-            texto = %s,
-            image_link = %s
+            {", ".join(f"{coluna} = %s" for coluna in colunas)}
         WHERE id = %s
         """
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, (titulo, id_tipopublicacao, tags, data_revisao, ativo, texto, image_link, id_publicacao))
-            self.connection.commit()
-            print("Publicação atualizada com sucesso")
-        except Error as e:
-            print(f"Erro ao atualizar publicação: {e}")
-            self.connection.rollback()  # Em caso de erro, desfaz as mudanças
-            raise
-        finally:
-            cursor.close()            
-        
-    def get_titulos_publicados(self):
+        return query, (*valores, id_publicacao)
+
+    def _executar(self, connection, cursor, query, params):
+        """
+        Executa uma inclusão ou atualização frequente: com consultas_preparadas, no cursor preparado do comando
+        (ConexaoPool.executar_preparada); senão, no cursor informado. Retorna o cursor usado, para lastrowid.
+        """
+        if self.consultas_preparadas:
+            return self.pool.executar_preparada(connection, query, params)
+        cursor.execute(query, params)
+        return cursor
+
+    def _consultar_preparada(self, query, params):
         """
-        Busca todos os titulos publicados
+        Executa uma consulta frequente no cursor preparado do comando (ConexaoPool.executar_preparada).
+        Retorna (nomes das colunas, linhas em tuplas).
         """
+        with self.pool.conexao() as connection:
+            try:
+                cursor = self.pool.executar_preparada(connection, query, params)
+                return cursor.column_names, cursor.fetchall()
+            except Error as e:
+                print(f"Erro ao executar consulta: {e}")
+                raise
+
+    @instrumentar
+    def get_titulos_publicados_pagina(self, apos_titulo=None, apos_id=None, limite=200):
+        """
+        Busca uma página de títulos publicados usando paginação por chave (keyset) em (titulo, id):
+        a página seguinte começa logo após o último título recebido, sem OFFSET.
+
+        :param apos_titulo: Título do último item da página anterior (None para a primeira página).
+        :param apos_id: Id do último item da página anterior.
+        :param limite: Quantidade máxima de títulos da página.
+        """
+        if apos_titulo is None:
+            query = """
+            SELECT 
+                id,
+                titulo
+            FROM
+                publicacoes
+            ORDER BY
+                titulo, id
+            LIMIT %s
+            """
+            params = (limite,)
+        else:
+            query = """
+            SELECT 
+                id,
+                titulo
+            FROM
+                publicacoes
+            WHERE
+                (titulo, id) > (%s, %s)
+            ORDER BY
+                titulo, id
+            LIMIT %s
+            """
+            params = (apos_titulo, apos_id, limite)
+        if self.consultas_preparadas:
+            _, linhas = self._consultar_preparada(query, params)
+            return list(map(LinhaTitulo._make, linhas))
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor(dictionary=True)
+            try:
+                cursor.execute(query, params)
+                results = cursor.fetchall()
+                return results
+            except Error as e:
+                print(f"Erro ao executar consulta: {e}")
+                raise
+            finally:
+                cursor.close()
+
+    @instrumentar
+    def get_marca_sincronizacao(self):
+        """
+        Retorna a marca d'água usada na atualização incremental da lista de títulos: o maior atualizado_em
+        """
+        self.garantir_coluna_atualizado_em()
+        query = """
+        SELECT 
+            MAX(atualizado_em) AS atualizado_em
+        FROM
+            publicacoes
+        """
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query)
+                result = cursor.fetchone()
+                return result[0] or self.MARCA_INICIAL
+            except Error as e:
+                print(f"Erro ao executar consulta: {e}")
+                raise
+            finally:
+                cursor.close()
+
+    @instrumentar
+    def get_titulos_alterados(self, desde):
+        """
+        Busca os títulos incluídos ou alterados desde a última sincronização por um único intervalo no índice
+        idx_publicacoes_atualizado_em. As gravações dos últimos MARGEM_SINCRONIZACAO antes da marca são buscadas
+        novamente, e a lista as aplica de novo sem efeito.
+
+        :param desde: Marca retornada por get_marca_sincronizacao ou o maior atualizado_em já recebido.
+        """
+        self.garantir_coluna_atualizado_em()
         query = """
         SELECT 
             id,
-            titulo
+            titulo,
+            atualizado_em
         FROM
             publicacoes
+        WHERE
+            atualizado_em >= %s
         ORDER BY
-            titulo
+            titulo, id
         """
-        try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute(query)
-            results = cursor.fetchall()
-            return results
-        except Error as e:
-            print(f"Erro ao executar consulta: {e}")
-            raise
-        finally:
-            cursor.close()
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor(dictionary=True)
+            try:
+                cursor.execute(query, (desde - self.MARGEM_SINCRONIZACAO,))
+                results = cursor.fetchall()
+                return results
+            except Error as e:
+                print(f"Erro ao executar consulta: {e}")
+                raise
+            finally:
+                cursor.close()
+
+    @instrumentar
+    def existe_titulo(self, titulo, ignorar_id=None):
+        """
+        Verifica se já existe outra publicação com o título informado.
+        A comparação é feita na coluna titulo_normalizado, com a mesma normalização do índice em memória
+        de TituloService (sem acentos, maiúsculas e espaços repetidos), e usa o índice idx_publicacoes_titulo_normalizado.
+
+        :param titulo: Título a verificar.
+        :param ignorar_id: Id da publicação que deve ser desconsiderada (a própria publicação em edição).
+        """
+        self.garantir_coluna_titulo_normalizado()
+        query = """
+        SELECT EXISTS(
+            SELECT 1
+            FROM publicacoes
+            WHERE titulo_normalizado = %s AND id <> %s
+        )
+        """
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query, (self.normalizar_titulo(titulo), ignorar_id or 0))
+                result = cursor.fetchone()
+                return result[0] == 1
+            except Error as e:
+                print(f"Erro ao executar consulta: {e}")
+                raise
+            finally:
+                cursor.close()
+
+    @instrumentar
+    def get_urls_semelhantes(self, url, ignorar_id=None):
+        """
+        Retorna as URLs de outras publicações iguais a `url` ou formadas por ela mais um sufixo
+        ("url_2", "url_3", ...), para escolher uma URL livre. Usa o índice idx_publicacoes_url.
+
+        :param url: URL gerada por gerar_slug (apenas letras minúsculas, dígitos e "_").
+        :param ignorar_id: Id da publicação que deve ser desconsiderada (a própria publicação em edição).
+        """
+        self.garantir_indice_url()
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor()
+            try:
+                return self._urls_semelhantes(cursor, url, ignorar_id)
+            except Error as e:
+                print(f"Erro ao executar consulta: {e}")
+                raise
+            finally:
+                cursor.close()
+
+    def _urls_semelhantes(self, cursor, url, ignorar_id=None):
+        # "_" é curinga do LIKE; o caractere de escape é "!" por não fazer parte das URLs
+        query = """
+        SELECT url
+        FROM publicacoes
+        WHERE (url = %s OR url LIKE %s ESCAPE '!') AND id <> %s
+        """
+        cursor.execute(query, (url, url.replace("_", "!_") + "!_%", ignorar_id or 0))
+        return {linha[0] for linha in cursor.fetchall()}
+
+    def _url_livre(self, cursor, url):
+        """
+        URL livre a partir da informada, com sufixo numérico se outra publicação já a usa (como SlugService.gerar_unica),
+        consultada na transação do cursor
+        """
+        slug = gerar_slug(url or "")
+        if not slug:
+            return url
+        return escolher_livre(slug, self._urls_semelhantes(cursor, slug))
+
+    def listar_urls(self, tamanho_bloco=1000):
+        """
+        Percorre id, titulo e url de todas as publicações em ordem de id, com um cursor sem buffer
+        (como exportar_publicacoes), sem ler o texto
+        """
+        query = """
+            SELECT id, titulo, url
+            FROM publicacoes
+            ORDER BY id
+        """
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor(dictionary=True, buffered=False)
+            try:
+                cursor.execute(query)
+                while True:
+                    linhas = cursor.fetchmany(tamanho_bloco)
+                    if not linhas:
+                        break
+                    yield from linhas
+            except Error as e:
+                print(f"Erro ao executar consulta: {e}")
+                raise
+            finally:
+                if connection.unread_result:
+                    connection.consume_results()
+                cursor.close()
+
+    @instrumentar
+    def atualizar_urls(self, urls):
+        """
+        Grava as URLs informadas com um único executemany e um único commit.
+
+        :param urls: Dicionário {id_publicacao: url}.
+        :return: Quantidade de publicações atualizadas.
+        """
+        if not urls:
+            return 0
+        query = "UPDATE publicacoes SET url = %s WHERE id = %s"
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.executemany(query, [(url, id_publicacao) for id_publicacao, url in urls.items()])
+                connection.commit()
+            except Error as e:
+                print(f"Erro ao atualizar URLs: {e}")
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+        if self.cache:
+            for id_publicacao in urls:
+                self.cache.invalidar(id_publicacao)
+        return len(urls)
+
+    @instrumentar
+    def garantir_indice_url(self):
+        """
+        Cria o índice idx_publicacoes_url (url) caso ainda não exista.
+        A verificação é feita apenas uma vez por instância.
+        """
+        if self._indice_url_verificado:
+            return
+        query = """
+        SELECT COUNT(*)
+        FROM information_schema.STATISTICS
+        WHERE table_schema = DATABASE()
+            AND table_name = 'publicacoes'
+            AND index_name = 'idx_publicacoes_url'
+        """
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query)
+                if cursor.fetchone()[0] == 0:
+                    print("Criando índice em publicacoes (url)...")
+                    cursor.execute("CREATE INDEX idx_publicacoes_url ON publicacoes (url)")
+                self._indice_url_verificado = True
+            except Error as e:
+                print(f"Erro ao criar índice de URLs: {e}")
+                raise
+            finally:
+                cursor.close()
+
+    @classmethod
+    def normalizar_titulo(cls, titulo):
+        """
+        Valor da coluna titulo_normalizado: o título normalizado por TituloService.normalizar
+        """
+        return TituloService.normalizar(titulo or "")[:cls.TAMANHO_TITULO_NORMALIZADO]
+
+    @instrumentar
+    def garantir_coluna_titulo_normalizado(self):
+        """
+        Cria a coluna titulo_normalizado e o índice idx_publicacoes_titulo_normalizado caso ainda não existam
+        (mesma definição de database/indices.sql) e preenche a coluna das publicações incluídas fora do aplicativo.
+        A verificação é feita apenas uma vez por instância.
+        """
+        if self._coluna_titulo_verificada:
+            return
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor(buffered=True)
+            try:
+                if not self._existe_coluna(cursor, "titulo_normalizado"):
+                    print("Criando a coluna titulo_normalizado em publicacoes...")
+                    cursor.execute(f"""
+                        ALTER TABLE publicacoes
+                        ADD COLUMN titulo_normalizado VARCHAR({self.TAMANHO_TITULO_NORMALIZADO}) CHARACTER SET ascii COLLATE ascii_bin NULL,
+                        ADD INDEX idx_publicacoes_titulo_normalizado (titulo_normalizado)
+                    """)
+                self._preencher_titulos_normalizados(connection, cursor)
+                self._coluna_titulo_verificada = True
+            except Error as e:
+                print(f"Erro ao criar a coluna de títulos normalizados: {e}")
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    @instrumentar
+    def garantir_coluna_atualizado_em(self):
+        """
+        Cria a coluna atualizado_em, com o instante (em microssegundos) da última gravação de cada publicação,
+        mantido pelo próprio MySQL, e o índice idx_publicacoes_atualizado_em caso ainda não existam
+        (mesma definição de database/indices.sql). A verificação é feita apenas uma vez por instância.
+        """
+        if self._coluna_atualizado_em_verificada:
+            return
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor(buffered=True)
+            try:
+                if not self._existe_coluna(cursor, "atualizado_em"):
+                    print("Criando a coluna atualizado_em em publicacoes...")
+                    cursor.execute("""
+                        ALTER TABLE publicacoes
+                        ADD COLUMN atualizado_em DATETIME(6) NOT NULL
+                            DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+                        ADD INDEX idx_publicacoes_atualizado_em (atualizado_em)
+                    """)
+                self._coluna_atualizado_em_verificada = True
+            except Error as e:
+                print(f"Erro ao criar a coluna atualizado_em: {e}")
+                raise
+            finally:
+                cursor.close()
+
+    def _existe_coluna(self, cursor, coluna):
+        query = """
+        SELECT COUNT(*)
+        FROM information_schema.COLUMNS
+        WHERE table_schema = DATABASE()
+            AND table_name = 'publicacoes'
+            AND column_name = %s
+        """
+        cursor.execute(query, (coluna,))
+        return cursor.fetchone()[0] > 0
+
+    def _preencher_titulos_normalizados(self, connection, cursor):
+        cursor.execute("SELECT id, titulo FROM publicacoes WHERE titulo_normalizado IS NULL")
+        titulos = cursor.fetchall()
+        if not titulos:
+            return
+        print(f"Normalizando o título de {len(titulos)} publicações...")
+        valores = [(self.normalizar_titulo(titulo), id_publicacao) for id_publicacao, titulo in titulos]
+        tamanho = self.TAMANHO_LOTE_TAGS
+        for inicio in range(0, len(valores), tamanho):
+            cursor.executemany("UPDATE publicacoes SET titulo_normalizado = %s WHERE id = %s", valores[inicio:inicio + tamanho])
+        connection.commit()
+
+    @instrumentar
+    def garantir_indice_fulltext(self):
+        """
+        Cria o índice FULLTEXT ft_publicacoes (titulo, tags, texto) caso ainda não exista.
+        A verificação é feita apenas uma vez por instância.
+        """
+        if self._indice_fulltext_verificado:
+            return
+        query = """
+        SELECT COUNT(*)
+        FROM information_schema.STATISTICS
+        WHERE table_schema = DATABASE()
+            AND table_name = 'publicacoes'
+            AND index_name = 'ft_publicacoes'
+        """
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query)
+                if cursor.fetchone()[0] == 0:
+                    print("Criando índice FULLTEXT em publicacoes (titulo, tags, texto)...")
+                    cursor.execute("ALTER TABLE publicacoes ADD FULLTEXT INDEX ft_publicacoes (titulo, tags, texto)")
+                self._indice_fulltext_verificado = True
+            except Error as e:
+                print(f"Erro ao criar índice FULLTEXT: {e}")
+                raise
+            finally:
+                cursor.close()
+
+    @instrumentar
+    def pesquisar_publicacoes(self, termos, limite=20):
+        """
+        Pesquisa publicações pelo índice FULLTEXT em titulo, tags e texto.
+        Cada palavra é buscada também como prefixo. Retorna id, titulo, relevancia e um trecho do texto
+        em torno da primeira palavra, ordenados pela relevância.
+        """
+        # Palavras menores que innodb_ft_min_token_size (3) não são indexadas
+        palavras = [palavra for palavra in re.findall(r'\w+', termos) if len(palavra) >= 3]
+        if not palavras:
+            return []
+        self.garantir_indice_fulltext()
 
+        expressao = " ".join(f"+{palavra}*" for palavra in palavras)
+        query = """
+            SELECT
+                id,
+                titulo,
+                MATCH(titulo, tags, texto) AGAINST(%s IN BOOLEAN MODE) AS relevancia,
+                SUBSTRING(texto, GREATEST(LOCATE(%s, texto) - 80, 1), 240) AS trecho
+            FROM publicacoes
+            WHERE MATCH(titulo, tags, texto) AGAINST(%s IN BOOLEAN MODE)
+            ORDER BY relevancia DESC
+            LIMIT %s
+        """
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor(dictionary=True)
+            try:
+                cursor.execute(query, (expressao, palavras[0], expressao, limite))
+                results = cursor.fetchall()
+                return results
+            except Error as e:
+                print(f"Erro ao executar consulta: {e}")
+                raise
+            finally:
+                cursor.close()
 
+    @instrumentar
     def get_tipos_publicacao(self):
         """
         Busca todos os tipos de publicação
@@ -156,40 +967,197 @@ class PublicacaoService:
         ORDER BY 
             id
         """
-        try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute(query)
-            results = cursor.fetchall()
-            return results
-        except Error as e:
-            print(f"Erro ao executar consulta: {e}")
-            raise
-        finally:
-            cursor.close()
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor(dictionary=True)
+            try:
+                cursor.execute(query)
+                results = cursor.fetchall()
+                return results
+            except Error as e:
+                print(f"Erro ao executar consulta: {e}")
+                raise
+            finally:
+                cursor.close()
             
+    @instrumentar
     def get_publicacao_by_id(self, id_publicacao):
         """
-        Obtém dados da publicação pelo id_publicacao
+        Obtém dados da publicação pelo id_publicacao.
+        Com cache, a cópia local é validada apenas por atualizado_em e o texto só é buscado novamente se ele mudou.
         """
+        publicacao = self._obter_do_cache(id_publicacao)
+        if publicacao is not None:
+            return publicacao
+
+        self.garantir_coluna_atualizado_em()
         query = """
-            SELECT id, id_tipopublicacao, titulo, tags, url, data_publicacao, data_revisao, ativo, texto, image_link
+            SELECT id, id_tipopublicacao, titulo, tags, url, data_publicacao, data_revisao, ativo, texto, image_link,
+                   atualizado_em
             FROM publicacoes
             WHERE id = %s
             LIMIT 1;
         """
-        try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute(query, (id_publicacao,))
-            result = cursor.fetchone()
-            return result
-        except Error as e:
-            print(f"Erro ao executar consulta: {e}")
-            raise
-        finally:
-            cursor.close()
+        result = self._obter_por_id(query, id_publicacao)
+        if result and self.cache:
+            self.cache.guardar(result)
+        return result
+
+    @instrumentar
+    def get_metadados_publicacao(self, id_publicacao):
+        """
+        Obtém os dados da publicação sem o texto, com o tamanho do texto em 'tamanho_texto'.
+        O texto é buscado depois, em partes, com get_trecho_texto. Se a publicação completa estiver
+        no cache ela é retornada com o texto.
+        """
+        publicacao = self._obter_do_cache(id_publicacao)
+        if publicacao is not None:
+            publicacao['tamanho_texto'] = len(publicacao['texto'] or "")
+            return publicacao
+
+        self.garantir_coluna_atualizado_em()
+        query = """
+            SELECT id, id_tipopublicacao, titulo, tags, url, data_publicacao, data_revisao, ativo, image_link,
+                   atualizado_em, CHAR_LENGTH(texto) AS tamanho_texto
+            FROM publicacoes
+            WHERE id = %s
+            LIMIT 1;
+        """
+        return self._obter_por_id(query, id_publicacao)
+
+    def _obter_por_id(self, query, id_publicacao):
+        """
+        Executa a consulta de uma publicação pelo id e retorna a linha como dicionário, ou None
+        """
+        if self.consultas_preparadas:
+            colunas, linhas = self._consultar_preparada(query, (id_publicacao,))
+            return dict(zip(colunas, linhas[0])) if linhas else None
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor(dictionary=True)
+            try:
+                cursor.execute(query, (id_publicacao,))
+                return cursor.fetchone()
+            except Error as e:
+                print(f"Erro ao executar consulta: {e}")
+                raise
+            finally:
+                cursor.close()
+
+    @instrumentar
+    def get_trecho_texto(self, id_publicacao, inicio, tamanho):
+        """
+        Obtém `tamanho` caracteres do texto da publicação a partir da posição `inicio` (começando em 0)
+        """
+        query = """
+            SELECT SUBSTRING(texto, %s, %s)
+            FROM publicacoes
+            WHERE id = %s
+            LIMIT 1;
+        """
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query, (inicio + 1, tamanho, id_publicacao))
+                result = cursor.fetchone()
+                return result[0] if result else None
+            except Error as e:
+                print(f"Erro ao executar consulta: {e}")
+                raise
+            finally:
+                cursor.close()
+
+    def guardar_em_cache(self, publicacao):
+        """
+        Guarda no cache a publicação montada a partir dos metadados e do texto lido em partes
+        """
+        if self.cache:
+            publicacao = dict(publicacao)
+            publicacao.pop('tamanho_texto', None)
+            self.cache.guardar(publicacao)
+
+    def _obter_do_cache(self, id_publicacao):
+        """
+        Retorna a publicação do cache se ela ainda corresponde ao banco (mesmo atualizado_em), ou None.
+        data_revisao não serve para a validação: é uma data, igual para todas as gravações do mesmo dia.
+        """
+        if not self.cache:
+            return None
+        publicacao = self.cache.obter(id_publicacao)
+        if publicacao is None:
+            return None
+        if self.cache.validado_recentemente(id_publicacao):
+            return publicacao
+        encontrada, atualizado_em = self.get_atualizado_em(id_publicacao)
+        if encontrada and atualizado_em == publicacao.get('atualizado_em'):
+            self.cache.marcar_validado(id_publicacao)
+            return publicacao
+        self.cache.invalidar(id_publicacao)
+        return None
+
+    @instrumentar
+    def get_atualizado_em(self, id_publicacao):
+        """
+        Consulta apenas o instante da última gravação da publicação (atualizado_em), usado para validar o cache.
+        Retorna (encontrada, atualizado_em).
+        """
+        self.garantir_coluna_atualizado_em()
+        query = """
+            SELECT atualizado_em
+            FROM publicacoes
+            WHERE id = %s
+            LIMIT 1;
+        """
+        if self.consultas_preparadas:
+            _, linhas = self._consultar_preparada(query, (id_publicacao,))
+            return (True, linhas[0][0]) if linhas else (False, None)
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query, (id_publicacao,))
+                result = cursor.fetchone()
+                if result is None:
+                    return False, None
+                return True, result[0]
+            except Error as e:
+                print(f"Erro ao executar consulta: {e}")
+                raise
+            finally:
+                cursor.close()
+
+    @instrumentar
+    def exportar_publicacoes(self, a_partir_id=0, tamanho_bloco=500):
+        """
+        Percorre as publicações (com o nome do tipo) em ordem de id, a partir de a_partir_id (exclusivo).
+
+        Usa um cursor sem buffer: as linhas são lidas do servidor em blocos de tamanho_bloco conforme
+        são consumidas, e a memória usada não depende do tamanho da tabela.
+        """
+        query = """
+            SELECT p.id, p.id_tipopublicacao, t.nome AS tipo, p.titulo, p.tags, p.url,
+                   p.data_publicacao, p.data_revisao, p.ativo, p.texto, p.image_link
+            FROM publicacoes p
+            LEFT JOIN tipopublicacao t ON t.id = p.id_tipopublicacao
+            WHERE p.id > %s
+            ORDER BY p.id
+        """
+        with self.pool.conexao() as connection:
+            cursor = connection.cursor(dictionary=True, buffered=False)
+            try:
+                cursor.execute(query, (a_partir_id,))
+                while True:
+                    linhas = cursor.fetchmany(tamanho_bloco)
+                    if not linhas:
+                        break
+                    yield from linhas
+            except Error as e:
+                print(f"Erro ao executar consulta: {e}")
+                raise
+            finally:
+                # Interrompido antes do fim: descarta o restante do resultado para liberar a conexão
+                if connection.unread_result:
+                    connection.consume_results()
+                cursor.close()
 
     def disconnect(self):
-        """Encerra a conexão com o banco de dados."""
-        if self.connection and self.connection.is_connected():
-            self.connection.close()
-            print("Conexão com o banco de dados encerrada.")
+        """Encerra as conexões do pool com o banco de dados."""
+        self.pool.encerrar()
+        print("Conexão com o banco de dados encerrada.")
@@ -0,0 +1,160 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+
+
+# Tamanho dos blocos em que o texto do rascunho é dividido (em caracteres)
+TAMANHO_MINIMO_BLOCO = 8 * 1024
+TAMANHO_MAXIMO_BLOCO = 64 * 1024
+# Em média uma a cada DIVISOR_CORTE quebras de linha após o tamanho mínimo encerra o bloco
+DIVISOR_CORTE = 16
+
+
+def dividir_em_blocos(texto, minimo=TAMANHO_MINIMO_BLOCO, maximo=TAMANHO_MAXIMO_BLOCO):
+    """
+    Divide o texto em blocos terminados em quebras de linha escolhidas pelo conteúdo das linhas,
+    e não pela posição: uma edição altera apenas o bloco em que foi feita (e talvez o seguinte),
+    pois os demais cortes continuam nas mesmas linhas mesmo que o texto anterior mude de tamanho.
+    Sem uma quebra de linha adequada o bloco termina em `maximo` caracteres.
+    """
+    blocos = []
+    inicio = 0
+    while inicio < len(texto):
+        fim = min(inicio + maximo, len(texto))
+        posicao = inicio + minimo
+        while posicao < fim:
+            quebra = texto.find("\n", posicao, fim)
+            if quebra == -1:
+                break
+            inicio_linha = texto.rfind("\n", inicio, quebra) + 1 or inicio
+            linha = texto[max(inicio_linha, quebra - 256):quebra]
+            if zlib.crc32(linha.encode("utf-8")) % DIVISOR_CORTE == 0:
+                fim = quebra + 1
+                break
+            posicao = quebra + 1
+        blocos.append(texto[inicio:fim])
+        inicio = fim
+    return blocos
+
+
+class RascunhoService:
+    """
+    Rascunho da publicação em edição, salvo periodicamente em um arquivo SQLite local para ser
+    recuperado depois de uma falha ou de um encerramento sem salvar.
+
+    Há um rascunho por base de destino. O texto é guardado em blocos (dividir_em_blocos) identificados
+    pelo hash do conteúdo: a cada salvamento apenas os blocos novos são gravados e os que deixaram de ser
+    usados são removidos, de forma que pequenas alterações em textos grandes gravam poucos bytes.
+    """
+    def __init__(self, caminho_db):
+        """
+        :param caminho_db: Arquivo SQLite dos rascunhos.
+        """
+        # Usado apenas pela thread da interface, mas protegido como os demais arquivos locais
+        self._lock = threading.Lock()
+        # Hashes dos blocos do texto de cada rascunho, na ordem do texto
+        self._blocos = {}
+        self._db = sqlite3.connect(caminho_db, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL;")
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS rascunhos (
+                destino TEXT PRIMARY KEY,
+                campos TEXT NOT NULL,
+                blocos TEXT NOT NULL,
+                atualizado_em REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS blocos_texto (
+                destino TEXT NOT NULL,
+                hash TEXT NOT NULL,
+                conteudo TEXT NOT NULL,
+                PRIMARY KEY (destino, hash)
+            );
+        """)
+        self._db.commit()
+
+    def salvar(self, destino, campos, texto=None):
+        """
+        Salva o rascunho, gravando apenas os blocos do texto que ainda não estão no arquivo.
+
+        :param destino: Identificação da base MySQL em que a publicação será salva.
+        :param campos: Dicionário com o estado da tela e os campos da publicação, exceto o texto.
+        :param texto: Texto da publicação, ou None se não mudou desde o último salvamento.
+        :return: Quantidade de caracteres de texto gravados.
+        """
+        with self._lock:
+            anteriores = self._obter_blocos(destino)
+            gravados = 0
+            try:
+                if texto is None:
+                    hashes = anteriores
+                else:
+                    blocos = dividir_em_blocos(texto)
+                    hashes = [hashlib.sha1(bloco.encode("utf-8")).hexdigest() for bloco in blocos]
+                    existentes = set(anteriores)
+                    novos = {}
+                    for hash_bloco, bloco in zip(hashes, blocos):
+                        if hash_bloco not in existentes:
+                            novos[hash_bloco] = bloco
+                    self._db.executemany(
+                        "INSERT OR IGNORE INTO blocos_texto (destino, hash, conteudo) VALUES (?, ?, ?);",
+                        [(destino, hash_bloco, bloco) for hash_bloco, bloco in novos.items()])
+                    gravados = sum(len(bloco) for bloco in novos.values())
+                    self._db.executemany(
+                        "DELETE FROM blocos_texto WHERE destino = ? AND hash = ?;",
+                        [(destino, hash_bloco) for hash_bloco in existentes - set(hashes)])
+                self._db.execute(
+                    "INSERT OR REPLACE INTO rascunhos (destino, campos, blocos, atualizado_em) VALUES (?, ?, ?, ?);",
+                    (destino, json.dumps(campos), json.dumps(hashes), time.time()))
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"Erro ao salvar o rascunho: {e}")
+                self._db.rollback()
+                self._blocos.pop(destino, None)
+                raise
+            self._blocos[destino] = hashes
+            return gravados
+
+    def obter(self, destino):
+        """
+        Retorna o rascunho salvo para o destino, {'campos', 'texto', 'atualizado_em'}, ou None
+        """
+        with self._lock:
+            linha = self._db.execute(
+                "SELECT campos, blocos, atualizado_em FROM rascunhos WHERE destino = ?;", (destino,)).fetchone()
+            if linha is None:
+                return None
+            hashes = json.loads(linha[1])
+            conteudos = dict(self._db.execute(
+                "SELECT hash, conteudo FROM blocos_texto WHERE destino = ?;", (destino,)).fetchall())
+        if any(hash_bloco not in conteudos for hash_bloco in hashes):
+            print("Rascunho com blocos de texto ausentes: descartado")
+            self.descartar(destino)
+            return None
+        return {
+            "campos": json.loads(linha[0]),
+            "texto": "".join(conteudos[hash_bloco] for hash_bloco in hashes),
+            "atualizado_em": linha[2]
+        }
+
+    def descartar(self, destino):
+        """
+        Remove o rascunho do destino
+        """
+        with self._lock:
+            self._db.execute("DELETE FROM rascunhos WHERE destino = ?;", (destino,))
+            self._db.execute("DELETE FROM blocos_texto WHERE destino = ?;", (destino,))
+            self._db.commit()
+            self._blocos[destino] = []
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def _obter_blocos(self, destino):
+        if destino not in self._blocos:
+            linha = self._db.execute("SELECT blocos FROM rascunhos WHERE destino = ?;", (destino,)).fetchone()
+            self._blocos[destino] = json.loads(linha[0]) if linha else []
+        return self._blocos[destino]
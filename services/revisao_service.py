@@ -0,0 +1,260 @@
+import difflib
+import json
+import zlib
+from datetime import date, datetime
+from mysql.connector import Error
+
+from services.metricas import instrumentar
+
+
+# Campos da publicação guardados em cada revisão, além do texto
+CAMPOS_REVISAO = ("titulo", "id_tipopublicacao", "tags", "ativo", "image_link")
+
+
+def calcular_delta(base, novo):
+    """
+    Calcula as operações, por linha, que transformam o texto base no novo:
+    [inicio, fim] copia as linhas base[inicio:fim] e uma string é um trecho inserido.
+    """
+    linhas_base = base.splitlines(keepends=True)
+    linhas_novo = novo.splitlines(keepends=True)
+    operacoes = []
+    for operacao, i1, i2, j1, j2 in difflib.SequenceMatcher(None, linhas_base, linhas_novo).get_opcodes():
+        if operacao == "equal":
+            operacoes.append([i1, i2])
+        elif j2 > j1:
+            operacoes.append("".join(linhas_novo[j1:j2]))
+    return operacoes
+
+
+def aplicar_delta(base, operacoes):
+    """
+    Reconstrói o texto novo a partir do texto base e das operações de calcular_delta
+    """
+    linhas_base = base.splitlines(keepends=True)
+    partes = []
+    for operacao in operacoes:
+        if isinstance(operacao, str):
+            partes.append(operacao)
+        else:
+            partes.extend(linhas_base[operacao[0]:operacao[1]])
+    return "".join(partes)
+
+
+class RevisaoService:
+    """
+    Histórico de revisões das publicações, na tabela publicacoes_revisoes da base MySQL.
+
+    Cada revisão guarda os campos da publicação e o texto comprimido (zlib): a cada `intervalo_snapshot`
+    revisões o texto inteiro e, nas demais, apenas a diferença por linha em relação à revisão anterior.
+    Assim o espaço ocupado cresce com o tamanho das alterações, e reconstruir qualquer revisão
+    exige no máximo `intervalo_snapshot - 1` diferenças.
+    """
+    def __init__(self, publicacao_service, intervalo_snapshot=10):
+        """
+        :param publicacao_service: PublicacaoService cujo pool de conexões é usado.
+        :param intervalo_snapshot: Quantidade de revisões entre duas cópias completas do texto.
+        """
+        self.publicacao_service = publicacao_service
+        self.intervalo_snapshot = intervalo_snapshot
+        self._tabela_verificada = False
+
+    def garantir_tabela(self):
+        """
+        Cria a tabela de revisões, caso ainda não exista (mesma definição de database/revisoes.sql)
+        """
+        if self._tabela_verificada:
+            return
+        query = """
+            CREATE TABLE IF NOT EXISTS publicacoes_revisoes (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                id_publicacao INT NOT NULL,
+                numero INT NOT NULL,
+                snapshot TINYINT(1) NOT NULL,
+                tamanho_texto INT NOT NULL,
+                criada_em DATETIME NOT NULL,
+                dados LONGBLOB NOT NULL,
+                UNIQUE KEY uk_publicacoes_revisoes (id_publicacao, numero)
+            )
+        """
+        with self.publicacao_service.pool.conexao() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query)
+                self._tabela_verificada = True
+            except Error as e:
+                print(f"Erro ao criar a tabela de revisões: {e}")
+                raise
+            finally:
+                cursor.close()
+
+    def registrar_na_transacao(self, cursor, id_publicacao, anterior, alteracoes):
+        """
+        Registra no histórico a versão resultante de aplicar as alterações sobre a versão anterior, no cursor
+        (com buffer) da transação que grava as alterações (PublicacaoService.aplicar_gravacoes): a revisão é
+        confirmada junto com elas, uma única vez. Se o histórico ainda não contém a versão `anterior` (primeira
+        revisão ou alteração feita fora do aplicativo), ela é registrada antes.
+        Uma falha desfaz apenas a revisão (savepoint) e é informada, sem interromper a transação.
+        garantir_tabela deve ser chamado antes de a transação começar, pois o CREATE TABLE a encerraria.
+        """
+        cursor.execute("SAVEPOINT revisao")
+        try:
+            self._registrar(cursor, id_publicacao, anterior, self._nova_versao(anterior, alteracoes))
+        except Error as e:
+            print(f"Erro ao registrar revisão da publicação {id_publicacao}: {e}")
+            cursor.execute("ROLLBACK TO SAVEPOINT revisao")
+        else:
+            cursor.execute("RELEASE SAVEPOINT revisao")
+
+    @instrumentar
+    def listar_revisoes(self, id_publicacao):
+        """
+        Lista as revisões da publicação, da mais recente para a mais antiga:
+        [{'numero', 'criada_em', 'snapshot', 'tamanho_texto', 'bytes'}]
+        """
+        self.garantir_tabela()
+        query = """
+            SELECT numero, criada_em, snapshot, tamanho_texto, LENGTH(dados) AS bytes
+            FROM publicacoes_revisoes
+            WHERE id_publicacao = %s
+            ORDER BY numero DESC
+        """
+        with self.publicacao_service.pool.conexao() as connection:
+            cursor = connection.cursor(dictionary=True)
+            try:
+                cursor.execute(query, (id_publicacao,))
+                return cursor.fetchall()
+            except Error as e:
+                print(f"Erro ao executar consulta: {e}")
+                raise
+            finally:
+                cursor.close()
+
+    @instrumentar
+    def obter_revisao(self, id_publicacao, numero):
+        """
+        Reconstrói uma revisão: {'numero', 'criada_em', campos de CAMPOS_REVISAO, 'texto'}, ou None
+        """
+        self.garantir_tabela()
+        with self.publicacao_service.pool.conexao() as connection:
+            cursor = connection.cursor(buffered=True)
+            try:
+                revisao = self._reconstruir(cursor, id_publicacao, numero)
+            except Error as e:
+                print(f"Erro ao executar consulta: {e}")
+                raise
+            finally:
+                cursor.close()
+        if revisao is None:
+            return None
+        return dict(revisao["versao"], numero=revisao["numero"], criada_em=revisao["criada_em"])
+
+    @instrumentar
+    def comparar_revisoes(self, id_publicacao, numero_base, numero):
+        """
+        Retorna as diferenças (formato unified diff) entre duas revisões; numero_base None compara com uma versão vazia
+        """
+        base = self.obter_revisao(id_publicacao, numero_base) if numero_base else None
+        revisao = self.obter_revisao(id_publicacao, numero)
+        linhas = []
+        for campo in CAMPOS_REVISAO:
+            valor_base = base[campo] if base else None
+            if valor_base != revisao[campo]:
+                linhas.append(f"{campo}: {valor_base!r} -> {revisao[campo]!r}\n")
+        # A última linha do texto pode não terminar com quebra de linha
+        linhas.extend(linha if linha.endswith("\n") else linha + "\n" for linha in difflib.unified_diff(
+            (base["texto"] if base else "").splitlines(keepends=True),
+            revisao["texto"].splitlines(keepends=True),
+            fromfile=f"revisão {numero_base}" if base else "vazio",
+            tofile=f"revisão {numero}"))
+        return "".join(linhas)
+
+    @instrumentar
+    def preparar_restauracao(self, id_publicacao, numero, pendentes=None, titulo_service=None):
+        """
+        Monta a atualização que restaura na publicação os campos e o texto de uma revisão. Ela deve ser salva
+        no diário de gravações, como as demais, para não ser sobreposta por uma atualização ainda pendente;
+        ao ser aplicada no banco entra no histórico como uma nova revisão.
+
+        :param pendentes: Alterações da publicação ainda no diário ({coluna: valor}), parte da versão atual.
+        :param titulo_service: TituloService usado para recusar um título restaurado já utilizado em outra publicação.
+        :return: {'titulo', 'anterior', 'alteracoes'}, com 'anterior' e 'alteracoes' como em DiarioGravacoes.registrar_atualizacao.
+        """
+        revisao = self.obter_revisao(id_publicacao, numero)
+        atual = self.publicacao_service.get_publicacao_by_id(id_publicacao)
+        if revisao is None or atual is None:
+            raise ValueError(f"Revisão {numero} da publicação {id_publicacao} não encontrada.")
+        anterior = {campo: atual[campo] for campo in CAMPOS_REVISAO + ("texto",)}
+        anterior.update((campo, valor) for campo, valor in (pendentes or {}).items() if campo in anterior)
+        alteracoes = {campo: revisao[campo] for campo in CAMPOS_REVISAO + ("texto",) if revisao[campo] != anterior[campo]}
+        if "titulo" in alteracoes and titulo_service is not None and titulo_service.existe(revisao["titulo"], id_publicacao):
+            raise ValueError(f"O título \"{revisao['titulo']}\" da revisão {numero} já foi utilizado em outra publicação.")
+        alteracoes["data_revisao"] = date.today()
+        return {"titulo": revisao["titulo"], "anterior": anterior, "alteracoes": alteracoes}
+
+    def _nova_versao(self, anterior, alteracoes):
+        return {campo: alteracoes.get(campo, anterior[campo]) for campo in CAMPOS_REVISAO + ("texto",)}
+
+    def _registrar(self, cursor, id_publicacao, anterior, nova):
+        ultima = self._reconstruir(cursor, id_publicacao, None)
+        if ultima is None or ultima["versao"] != self._versao(anterior):
+            ultima = self._inserir(cursor, id_publicacao, ultima, anterior)
+        self._inserir(cursor, id_publicacao, ultima, nova)
+
+    def _versao(self, publicacao):
+        # Link de imagem e texto vazios podem vir do banco como NULL e da tela como ""
+        versao = {campo: publicacao[campo] for campo in CAMPOS_REVISAO}
+        versao["image_link"] = versao["image_link"] or ""
+        versao["texto"] = publicacao["texto"] or ""
+        return versao
+
+    def _reconstruir(self, cursor, id_publicacao, numero):
+        """
+        Reconstrói a revisão `numero` (None para a última) a partir do snapshot mais próximo e das diferenças seguintes
+        """
+        if numero is None:
+            cursor.execute("SELECT MAX(numero) FROM publicacoes_revisoes WHERE id_publicacao = %s", (id_publicacao,))
+            numero = cursor.fetchone()[0]
+            if numero is None:
+                return None
+        query = """
+            SELECT numero, snapshot, criada_em, dados
+            FROM publicacoes_revisoes
+            WHERE id_publicacao = %s
+              AND numero <= %s
+              AND numero >= (
+                  SELECT MAX(numero) FROM publicacoes_revisoes
+                  WHERE id_publicacao = %s AND numero <= %s AND snapshot = 1)
+            ORDER BY numero
+        """
+        cursor.execute(query, (id_publicacao, numero, id_publicacao, numero))
+        linhas = cursor.fetchall()
+        if not linhas or linhas[-1][0] != numero:
+            return None
+        texto = ""
+        for _, snapshot, _, dados in linhas:
+            conteudo = json.loads(zlib.decompress(dados))
+            texto = conteudo["texto"] if snapshot else aplicar_delta(texto, conteudo["delta"])
+        campos = conteudo["campos"]
+        campos["texto"] = texto
+        return {"numero": numero, "criada_em": linhas[-1][2], "snapshot": linhas[-1][1], "versao": campos}
+
+    def _inserir(self, cursor, id_publicacao, ultima, publicacao):
+        """
+        Insere a revisão seguinte a `ultima` com os dados da publicação e retorna a nova última revisão
+        """
+        versao = self._versao(publicacao)
+        numero = 1 if ultima is None else ultima["numero"] + 1
+        snapshot = ultima is None or (numero - 1) % self.intervalo_snapshot == 0
+        conteudo = {"campos": {campo: versao[campo] for campo in CAMPOS_REVISAO}}
+        if snapshot:
+            conteudo["texto"] = versao["texto"]
+        else:
+            conteudo["delta"] = calcular_delta(ultima["versao"]["texto"], versao["texto"])
+        dados = zlib.compress(json.dumps(conteudo, ensure_ascii=False).encode("utf-8"))
+        criada_em = datetime.now()
+        cursor.execute("""
+            INSERT INTO publicacoes_revisoes (id_publicacao, numero, snapshot, tamanho_texto, criada_em, dados)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """, (id_publicacao, numero, 1 if snapshot else 0, len(versao["texto"]), criada_em, dados))
+        return {"numero": numero, "criada_em": criada_em, "snapshot": snapshot, "versao": versao}
@@ -0,0 +1,134 @@
+import re
+from functools import lru_cache
+
+
+# Quantidade de palavras com a transliteração memorizada
+TAMANHO_CACHE_PALAVRAS = 4096
+# Caracteres que não podem fazer parte da URL (aplicado após a transliteração)
+CARACTERES_INVALIDOS_REGEX = re.compile(r'[^a-z0-9_]')
+
+
+@lru_cache(maxsize=TAMANHO_CACHE_PALAVRAS)
+def _converter_palavra(palavra):
+    # Importado sob demanda para não pesar na inicialização
+    from unidecode import unidecode
+
+    return CARACTERES_INVALIDOS_REGEX.sub("", unidecode(palavra).lower().replace(" ", "_"))
+
+
+def gerar_slug(texto):
+    """
+    Converte o texto para um valor amigável de URL: sem acentos, em minúsculas, com "_" no lugar
+    dos espaços e sem os demais caracteres especiais.
+
+    A conversão é feita palavra a palavra, com o resultado de cada palavra memorizado: enquanto o título
+    é digitado, apenas a palavra em edição ainda não foi convertida.
+    """
+    return "_".join(_converter_palavra(palavra) for palavra in texto.split(" "))
+
+
+def escolher_livre(slug, usadas):
+    """
+    Retorna o slug, se não estiver entre as URLs usadas, ou o slug com o menor sufixo livre ("_2", "_3", ...)
+    """
+    if slug not in usadas:
+        return slug
+    numero = 2
+    while f"{slug}_{numero}" in usadas:
+        numero += 1
+    return f"{slug}_{numero}"
+
+
+class SlugService:
+    """
+    Gera URLs únicas para as publicações a partir dos títulos.
+
+    Para uma publicação (tela de edição) a colisão é verificada no banco, pelo índice idx_publicacoes_url,
+    apenas entre as URLs que começam com o slug. Em lote (importação e verificação da tabela inteira)
+    as URLs de todas as publicações são lidas uma única vez e as colisões são resolvidas em memória.
+    """
+    def __init__(self, publicacao_service):
+        """
+        :param publicacao_service: PublicacaoService usado nas consultas e na gravação das URLs.
+        """
+        self.publicacao_service = publicacao_service
+        # URLs já usadas, carregadas no primeiro uso do modo em lote
+        self._usadas = None
+
+    def gerar_unica(self, titulo, ignorar_id=None):
+        """
+        URL livre para o título, com sufixo numérico se outra publicação já usa o mesmo slug
+
+        :param ignorar_id: Id da publicação em edição, que pode manter a própria URL.
+        """
+        slug = gerar_slug(titulo)
+        if not slug:
+            return slug
+        return escolher_livre(slug, self.publicacao_service.get_urls_semelhantes(slug, ignorar_id))
+
+    def carregar(self):
+        """
+        Lê as URLs de todas as publicações para o modo em lote; retorna a quantidade de URLs
+        """
+        self._usadas = {linha['url'] for linha in self.publicacao_service.listar_urls() if linha['url']}
+        return len(self._usadas)
+
+    def reservar(self, url, titulo=None):
+        """
+        Modo em lote: retorna uma URL livre para uma publicação a incluir, a partir da URL informada
+        ou, sem ela, do título, e a marca como usada para as publicações seguintes
+        """
+        if self._usadas is None:
+            self.carregar()
+        slug = gerar_slug(url or titulo or "")
+        if not slug:
+            return slug
+        slug = escolher_livre(slug, self._usadas)
+        self._usadas.add(slug)
+        return slug
+
+    def verificar_todas(self, regenerar=False, gravar=False, tamanho_lote=1000):
+        """
+        Verifica as URLs de todas as publicações em uma única passagem pela tabela, em ordem de id.
+
+        Sem `regenerar`, URLs vazias, com caracteres inválidos ou repetidas (a publicação mais antiga mantém
+        a sua) recebem uma URL nova; com `regenerar`, a URL de cada publicação é gerada novamente a partir
+        do título. Uma URL nova é sempre diferente das URLs já vistas na passagem.
+
+        :param gravar: Grava as URLs novas no banco, em lotes de `tamanho_lote`; sem ele apenas as lista.
+        :return: {'verificadas': quantidade, 'alteracoes': [{'id', 'titulo', 'url', 'nova_url', 'motivo'}], 'gravadas': quantidade}
+        """
+        usadas = set()
+        alteracoes = []
+        verificadas = 0
+        for linha in self.publicacao_service.listar_urls():
+            verificadas += 1
+            url = linha['url'] or ""
+            if regenerar:
+                motivo = "regenerada"
+                slug = gerar_slug(linha['titulo'])
+            elif not url:
+                motivo = "vazia"
+                slug = gerar_slug(linha['titulo'])
+            elif gerar_slug(url) != url:
+                motivo = "inválida"
+                slug = gerar_slug(url)
+            elif url in usadas:
+                motivo = "repetida"
+                slug = url
+            else:
+                usadas.add(url)
+                continue
+            nova_url = escolher_livre(slug or f"publicacao_{linha['id']}", usadas)
+            usadas.add(nova_url)
+            if nova_url != url:
+                alteracoes.append(dict(linha, nova_url=nova_url, motivo=motivo))
+
+        gravadas = 0
+        if gravar:
+            for inicio in range(0, len(alteracoes), tamanho_lote):
+                gravadas += self.publicacao_service.atualizar_urls(
+                    {alteracao['id']: alteracao['nova_url'] for alteracao in alteracoes[inicio:inicio + tamanho_lote]})
+        # As URLs mudaram: o modo em lote deve lê-las novamente
+        self._usadas = None
+        return {"verificadas": verificadas, "alteracoes": alteracoes, "gravadas": gravadas}
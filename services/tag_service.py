@@ -0,0 +1,160 @@
+import threading
+
+from services.titulo_service import TituloService
+
+# Tamanho máximo de uma tag (coluna tags.nome, VARCHAR(100) em database/tags.sql)
+TAMANHO_MAXIMO_TAG = 100
+
+
+def chave_tag(tag):
+    """
+    Forma normalizada da tag usada nas comparações: sem acentos, maiúsculas ou espaços repetidos
+    """
+    return TituloService.normalizar(tag)
+
+
+def separar_tags(tags):
+    """
+    Separa o texto da coluna publicacoes.tags ('C#, Python, Linux') em uma lista de tags sem repetições,
+    mantendo a grafia da primeira ocorrência. Tags maiores que TAMANHO_MAXIMO_TAG (gravadas fora do aplicativo)
+    são truncadas, como serão gravadas na tabela tags, para não recusar a gravação de toda a publicação.
+    """
+    resultado = {}
+    for tag in (tags or "").split(","):
+        tag = " ".join(tag.split())[:TAMANHO_MAXIMO_TAG].rstrip()
+        if tag:
+            resultado.setdefault(chave_tag(tag), tag)
+    return list(resultado.values())
+
+
+def _ordem(item):
+    # Mais usadas primeiro; empates em ordem alfabética
+    return -item[0], item[1].casefold()
+
+
+class _NoTrie:
+    __slots__ = ("filhos", "melhores")
+
+    def __init__(self):
+        self.filhos = {}
+        # (quantidade de publicações, tag) das tags mais usadas com este prefixo, em ordem decrescente
+        self.melhores = []
+
+
+class TagService:
+    """
+    Sugestões de tags para o campo de tags, a partir de um índice de prefixos (trie) em memória.
+
+    O índice é montado uma vez, na conexão, com as tags e a quantidade de publicações de cada uma
+    (tabelas tags e publicacoes_tags). Cada nó guarda as tags mais usadas com aquele prefixo, de forma
+    que uma sugestão percorre apenas os caracteres digitados, qualquer que seja a quantidade de tags.
+    As tags são comparadas sem acentos e sem diferença de maiúsculas, como os títulos em TituloService.
+    """
+    def __init__(self, publicacao_service, max_sugestoes=10):
+        """
+        :param publicacao_service: PublicacaoService usado para carregar o índice e nas consultas por tag.
+        :param max_sugestoes: Quantidade de tags mantidas em cada nó, e máximo de sugestões.
+        """
+        self.publicacao_service = publicacao_service
+        self.max_sugestoes = max_sugestoes
+        self._raiz = _NoTrie()
+        self._contagens = {}
+        # Carregado em uma thread do executor e consultado pela thread da interface
+        self._lock = threading.Lock()
+
+    def carregar(self):
+        """
+        Monta o índice com todas as tags da base; retorna a quantidade de tags
+        """
+        tags = self.publicacao_service.get_tags()
+        with self._lock:
+            self._raiz = _NoTrie()
+            self._contagens = {}
+            for tag in tags:
+                self._inserir(tag['nome'], tag['publicacoes'])
+        return len(tags)
+
+    def registrar(self, tags, tags_anteriores=None):
+        """
+        Atualiza no índice as tags de uma publicação salva, sem recarregar as demais: as tags incluídas
+        ganham uma publicação e as retiradas (presentes apenas em tags_anteriores) perdem uma
+
+        :param tags: Texto da coluna tags gravado.
+        :param tags_anteriores: Texto da coluna tags antes da gravação; None em uma publicação nova.
+        """
+        novas = {chave_tag(tag): tag for tag in separar_tags(tags)}
+        anteriores = {chave_tag(tag): tag for tag in separar_tags(tags_anteriores)}
+        with self._lock:
+            for chave in anteriores:
+                if chave not in novas and chave in self._contagens:
+                    nome, quantidade = self._contagens[chave]
+                    self._atualizar(chave, nome, quantidade - 1)
+            for chave, tag in novas.items():
+                if chave not in anteriores:
+                    nome, quantidade = self._contagens.get(chave, (tag, 0))
+                    self._atualizar(chave, nome, quantidade + 1)
+
+    def sugerir(self, prefixo, limite=None):
+        """
+        Retorna as tags mais usadas que começam com o prefixo, da mais usada para a menos usada
+        """
+        limite = min(limite or self.max_sugestoes, self.max_sugestoes)
+        chave = chave_tag(prefixo)
+        if not chave:
+            return []
+        with self._lock:
+            no = self._raiz
+            for caractere in chave:
+                no = no.filhos.get(caractere)
+                if no is None:
+                    return []
+            return [nome for _, nome in no.melhores[:limite]]
+
+    def publicacoes_com_tag(self, tag, limite=20):
+        """
+        Publicações que usam a tag, consultadas pelo índice da tabela publicacoes_tags
+        """
+        return self.publicacao_service.get_publicacoes_por_tag(tag, limite)
+
+    def _inserir(self, nome, quantidade):
+        chave = chave_tag(nome)
+        anterior = self._contagens.get(chave)
+        self._contagens[chave] = (nome, quantidade)
+        no = self._raiz
+        for caractere in chave:
+            no = no.filhos.setdefault(caractere, _NoTrie())
+            melhores = [item for item in no.melhores if anterior is None or item[1] != anterior[0]]
+            if len(melhores) < self.max_sugestoes or quantidade > melhores[-1][0]:
+                melhores.append((quantidade, nome))
+                melhores.sort(key=_ordem)
+                del melhores[self.max_sugestoes:]
+            no.melhores = melhores
+
+    def _atualizar(self, chave, nome, quantidade):
+        """
+        Altera a quantidade de publicações de uma tag; sem publicações ela deixa de ser sugerida
+        """
+        anterior = self._contagens.get(chave)
+        if quantidade > 0 and (anterior is None or quantidade >= anterior[1]):
+            self._inserir(nome, quantidade)
+            return
+        if quantidade > 0:
+            self._contagens[chave] = (nome, quantidade)
+        else:
+            self._contagens.pop(chave, None)
+        # Ao perder publicações a tag pode dar lugar, nas melhores de cada prefixo, a uma tag que não estava
+        # entre elas: cada nó do caminho é refeito a partir das melhores dos filhos, do mais profundo à raiz
+        caminho = [self._raiz]
+        for caractere in chave:
+            no = caminho[-1].filhos.get(caractere)
+            if no is None:
+                return
+            caminho.append(no)
+        for profundidade in range(len(chave), 0, -1):
+            no = caminho[profundidade]
+            melhores = [item for filho in no.filhos.values() for item in filho.melhores]
+            propria = self._contagens.get(chave[:profundidade])
+            if propria is not None:
+                melhores.append((propria[1], propria[0]))
+            melhores.sort(key=_ordem)
+            no.melhores = melhores[:self.max_sugestoes]
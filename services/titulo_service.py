@@ -0,0 +1,79 @@
+import threading
+
+
+class TituloService:
+    """
+    Verifica se um título já foi utilizado em outra publicação.
+
+    Mantém em memória um índice (hash) dos títulos conhecidos, normalizados sem acentos e
+    sem diferença de maiúsculas, atualizado a cada página carregada, inclusão e atualização.
+    Quando o título não está no índice a verificação recorre a um EXISTS indexado no banco,
+    de forma que o resultado continua correto mesmo com apenas parte dos títulos carregada.
+    """
+    def __init__(self, publicacao_service):
+        self.publicacao_service = publicacao_service
+        # Título normalizado -> ids das publicações que o usam (títulos repetidos gravados fora do aplicativo)
+        self._ids_por_titulo = {}
+        self._titulo_por_id = {}
+        # Acessado tanto pela thread da interface quanto pelas threads do executor
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalizar(titulo):
+        """
+        Remove acentos, diferenças de maiúsculas/minúsculas e espaços repetidos do título
+        """
+        # Importado sob demanda para não pesar na inicialização
+        from unidecode import unidecode
+
+        return " ".join(unidecode(titulo).casefold().split())
+
+    def registrar(self, id_publicacao, titulo):
+        """
+        Inclui ou atualiza o título de uma publicação no índice
+        """
+        chave = self.normalizar(titulo)
+        with self._lock:
+            self._registrar(id_publicacao, chave)
+
+    def registrar_varios(self, linhas):
+        """
+        Inclui no índice uma lista de {'id', 'titulo'}, como as páginas da combo de títulos
+        """
+        chaves = [(linha['id'], self.normalizar(linha['titulo'])) for linha in linhas]
+        with self._lock:
+            for id_publicacao, chave in chaves:
+                self._registrar(id_publicacao, chave)
+
+    def existe(self, titulo, ignorar_id=None):
+        """
+        Indica se o título já é usado por outra publicação.
+
+        :param titulo: Título a verificar.
+        :param ignorar_id: Id da publicação em edição, que pode manter o próprio título.
+        """
+        chave = self.normalizar(titulo)
+        with self._lock:
+            outras = self._ids_por_titulo.get(chave, set()) - {ignorar_id}
+        if outras:
+            return True
+        # Título desconhecido, ou usado apenas pela própria publicação entre as carregadas
+        return self.publicacao_service.existe_titulo(titulo, ignorar_id)
+
+    def limpar(self):
+        """
+        Esvazia o índice
+        """
+        with self._lock:
+            self._ids_por_titulo.clear()
+            self._titulo_por_id.clear()
+
+    def _registrar(self, id_publicacao, chave):
+        anterior = self._titulo_por_id.get(id_publicacao)
+        if anterior is not None and anterior != chave:
+            ids = self._ids_por_titulo[anterior]
+            ids.discard(id_publicacao)
+            if not ids:
+                del self._ids_por_titulo[anterior]
+        self._ids_por_titulo.setdefault(chave, set()).add(id_publicacao)
+        self._titulo_por_id[id_publicacao] = chave
@@ -0,0 +1,95 @@
+import re
+
+from services.tag_service import TAMANHO_MAXIMO_TAG
+
+# Expressões compiladas uma única vez, na importação do módulo
+# Permitir uma palavra ou múltiplas separadas por vírgula e espaço
+TAGS_REGEX = re.compile(r'^([a-zA-Z0-9#]+|([a-zA-Z0-9#]+(, [a-zA-Z0-9#]+)*))$')
+# Formato da URL da imagem (deve começar com http://, https://, etc)
+IMAGE_LINK_REGEX = re.compile(r'^(https?|ftp)://[^\s/$.?#].[^\s]*$', re.IGNORECASE)
+
+
+def _em_branco(valor):
+    # isspace() não cria uma cópia do texto como strip(), o que importa para textos grandes
+    return not valor or valor.isspace()
+
+
+def _validar_titulo(titulo):
+    if _em_branco(titulo):
+        return ["O título da publicação deve ser informado."]
+    return []
+
+
+def _validar_tipo(id_tipopublicacao):
+    if not id_tipopublicacao or id_tipopublicacao <= 0:
+        return ["O Tipo da publicação deve ser informado."]
+    return []
+
+
+def _validar_tags(tags):
+    if _em_branco(tags):
+        return ["As tags devem ser informadas."]
+    if not TAGS_REGEX.match(tags):
+        return ["As tags devem estar no formato correto. Exemplo: 'C#, ASP.Net, Linux' ou apenas 'Python'."]
+    if any(len(tag) > TAMANHO_MAXIMO_TAG for tag in tags.split(", ")):
+        return [f"Cada tag deve ter no máximo {TAMANHO_MAXIMO_TAG} caracteres."]
+    return []
+
+
+def _validar_url(url):
+    if _em_branco(url):
+        return ["A URL deve ser informada."]
+    return []
+
+
+def _validar_texto(texto):
+    if _em_branco(texto):
+        return ["O texto da publicação deve ser preenchido."]
+    return []
+
+
+def _validar_image_link(image_link):
+    if not _em_branco(image_link) and not IMAGE_LINK_REGEX.match(image_link):
+        return ["O link da imagem fornecido não está em um formato válido."]
+    return []
+
+
+class ValidacaoService:
+    """
+    Regras de validação de uma publicação, aplicáveis campo a campo.
+
+    Permite validar apenas o campo alterado enquanto o usuário digita, e a publicação inteira ao salvar.
+    """
+    REGRAS = {
+        "titulo": _validar_titulo,
+        "id_tipopublicacao": _validar_tipo,
+        "tags": _validar_tags,
+        "url": _validar_url,
+        "texto": _validar_texto,
+        "image_link": _validar_image_link
+    }
+
+    @classmethod
+    def validar_campo(cls, campo, valor):
+        """
+        Valida um único campo e retorna a lista de erros encontrados
+        """
+        return cls.REGRAS[campo](valor)
+
+    @classmethod
+    def validar_publicacao(cls, titulo, id_tipopublicacao, tags, url, texto, image_link):
+        """
+        Valida todos os campos de uma publicação e retorna a lista de erros de validação
+        """
+        valores = {
+            "titulo": titulo,
+            "id_tipopublicacao": id_tipopublicacao,
+            "tags": tags,
+            "url": url,
+            "texto": texto,
+            "image_link": image_link
+        }
+        erros = []
+        for campo, valor in valores.items():
+            erros.extend(cls.validar_campo(campo, valor))
+        return erros
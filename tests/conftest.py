@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Os testes importam os módulos do aplicativo a partir da raiz do repositório
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Os testes de modelos Qt rodam sem janela
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
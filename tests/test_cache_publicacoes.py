@@ -0,0 +1,73 @@
+import json
+from datetime import datetime
+
+from services.cache_publicacoes import CachePublicacoes
+
+
+def publicacao(id_publicacao, texto="x" * 100):
+    return {"id": id_publicacao, "titulo": f"Publicação {id_publicacao}", "texto": texto,
+            "atualizado_em": datetime(2024, 1, id_publicacao)}
+
+
+def tamanho(dados):
+    return len(CachePublicacoes()._codificar(dados).encode("utf-8"))
+
+
+def test_publicacoes_usadas_ha_mais_tempo_sao_despejadas_pelo_limite_em_bytes():
+    cache = CachePublicacoes(limite_bytes=2 * tamanho(publicacao(1)))
+    cache.guardar(publicacao(1))
+    cache.guardar(publicacao(2))
+    # O acesso torna a publicação 1 a mais recente
+    assert cache.obter(1) == publicacao(1)
+
+    cache.guardar(publicacao(3))
+
+    assert cache.contem(1)
+    assert not cache.contem(2)
+    assert cache.contem(3)
+
+
+def test_publicacao_grande_despeja_varias_menores():
+    pequena = tamanho(publicacao(1))
+    cache = CachePublicacoes(limite_bytes=3 * pequena)
+    for id_publicacao in (1, 2, 3):
+        cache.guardar(publicacao(id_publicacao))
+
+    # Quase o dobro de uma publicação pequena: cabe apenas com a mais recente
+    cache.guardar(publicacao(4, "x" * (pequena + 50)))
+
+    assert [cache.contem(id_publicacao) for id_publicacao in (1, 2, 3, 4)] == [False, False, True, True]
+
+
+def test_publicacao_maior_que_o_limite_nao_fica_em_memoria():
+    cache = CachePublicacoes(limite_bytes=tamanho(publicacao(1)))
+    cache.guardar(publicacao(1))
+
+    cache.guardar(publicacao(2, "x" * 1000))
+
+    assert cache.contem(1)
+    assert not cache.contem(2)
+    assert cache.obter(2) is None
+
+
+def test_substituir_publicacao_atualiza_o_total_em_bytes():
+    cache = CachePublicacoes(limite_bytes=2 * tamanho(publicacao(1)))
+    cache.guardar(publicacao(1))
+    cache.guardar(publicacao(1, "y" * 100))
+    cache.guardar(publicacao(2))
+
+    assert cache.obter(1)["texto"] == "y" * 100
+    assert cache.contem(2)
+    cache.invalidar(1)
+    cache.guardar(publicacao(3))
+    assert cache.contem(2) and cache.contem(3)
+
+
+def test_cache_em_disco_preserva_as_datas(tmp_path):
+    caminho = str(tmp_path / "cache.db")
+    CachePublicacoes(caminho_db=caminho).guardar(publicacao(1))
+
+    obtida = CachePublicacoes(caminho_db=caminho).obter(1)
+
+    assert obtida == publicacao(1)
+    assert json.loads(CachePublicacoes()._codificar(obtida))["atualizado_em"] == "2024-01-01T00:00:00"
@@ -0,0 +1,101 @@
+import pytest
+from mysql.connector import DatabaseError, InterfaceError
+
+from services.diario_gravacoes import DiarioGravacoes
+
+DESTINO = "usuario@localhost:3306/blog"
+
+
+class PublicacaoServiceFalso:
+    """
+    Aplica as gravações como o MySQL: chaves já aplicadas não são repetidas.
+    Com perder_confirmacao, o lote é aplicado mas a resposta não chega (falha de conexão).
+    """
+    def __init__(self):
+        self.aplicadas = {}
+        self.perder_confirmacao = False
+        self.recusar = False
+        self._proximo_id = 100
+
+    def aplicar_gravacoes(self, gravacoes, revisao_service=None):
+        if self.recusar:
+            raise DatabaseError("gravação recusada")
+        ids = []
+        for gravacao in gravacoes:
+            if gravacao["chave"] not in self.aplicadas:
+                if gravacao["operacao"] == "incluir":
+                    self._proximo_id += 1
+                    self.aplicadas[gravacao["chave"]] = self._proximo_id
+                else:
+                    self.aplicadas[gravacao["chave"]] = gravacao["id_publicacao"]
+            ids.append(self.aplicadas[gravacao["chave"]])
+        if self.perder_confirmacao:
+            self.perder_confirmacao = False
+            raise InterfaceError("conexão perdida")
+        return ids
+
+
+@pytest.fixture
+def diario():
+    diario = DiarioGravacoes(":memory:", max_tentativas=2)
+    yield diario
+    diario.close()
+
+
+def test_atualizacoes_nao_enviadas_sao_combinadas(diario):
+    chave = diario.registrar_atualizacao(DESTINO, 1, {"titulo": "A"}, {"titulo": "Original"})
+    assert diario.registrar_atualizacao(DESTINO, 1, {"tags": "Python"}, {"titulo": "A"}) == chave
+
+    pendentes = diario.pendentes(DESTINO)
+    assert len(pendentes) == 1
+    assert pendentes[0]["dados"] == {"titulo": "A", "tags": "Python"}
+    # A versão anterior continua sendo a da primeira atualização
+    assert pendentes[0]["anterior"] == {"titulo": "Original"}
+
+
+def test_atualizacao_enviada_nao_recebe_alteracoes(diario):
+    chave = diario.registrar_atualizacao(DESTINO, 1, {"titulo": "A"}, {"titulo": "Original"})
+    diario.pendentes(DESTINO, enviar=True)
+
+    nova = diario.registrar_atualizacao(DESTINO, 1, {"titulo": "B"}, {"titulo": "A"})
+
+    assert nova != chave
+    assert [(g["chave"], g["dados"]) for g in diario.pendentes(DESTINO)] == [(chave, {"titulo": "A"}), (nova, {"titulo": "B"})]
+
+
+def test_atualizacoes_de_publicacoes_ou_destinos_diferentes_nao_sao_combinadas(diario):
+    diario.registrar_atualizacao(DESTINO, 1, {"titulo": "A"}, {})
+    diario.registrar_atualizacao(DESTINO, 2, {"titulo": "B"}, {})
+    diario.registrar_atualizacao("outro@localhost:3306/blog", 1, {"titulo": "C"}, {})
+
+    assert diario.quantidade_pendentes(DESTINO) == 2
+    assert diario.alteracoes_pendentes(DESTINO, 1) == {"titulo": "A"}
+
+
+def test_lote_reenviado_apos_falha_na_confirmacao_nao_e_repetido(diario):
+    service = PublicacaoServiceFalso()
+    inclusao = diario.registrar_inclusao(DESTINO, {"titulo": "Nova", "url": "nova"})
+    atualizacao = diario.registrar_atualizacao(DESTINO, 1, {"titulo": "A"}, {"titulo": "Original"})
+    service.perder_confirmacao = True
+
+    with pytest.raises(InterfaceError):
+        diario.enviar_pendentes(service, DESTINO, 10)
+    assert diario.quantidade_pendentes(DESTINO) == 2
+
+    resultado = diario.enviar_pendentes(service, DESTINO, 10)
+
+    assert [(g["chave"], id_publicacao) for g, id_publicacao in resultado["aplicadas"]] == [(inclusao, 101), (atualizacao, 1)]
+    assert resultado["restantes"] == 0
+    assert service.aplicadas == {inclusao: 101, atualizacao: 1}
+
+
+def test_gravacao_recusada_e_rejeitada_apos_max_tentativas(diario):
+    service = PublicacaoServiceFalso()
+    service.recusar = True
+    chave = diario.registrar_atualizacao(DESTINO, 1, {"titulo": "A"}, {})
+
+    assert diario.enviar_pendentes(service, DESTINO, 10)["rejeitadas"] == []
+    resultado = diario.enviar_pendentes(service, DESTINO, 10)
+
+    assert [g["chave"] for g in resultado["rejeitadas"]] == [chave]
+    assert resultado["restantes"] == 0
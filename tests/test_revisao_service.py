@@ -0,0 +1,26 @@
+import pytest
+
+from services.revisao_service import aplicar_delta, calcular_delta
+
+TEXTO = "Primeira linha\nSegunda linha\nTerceira linha\n"
+
+
+@pytest.mark.parametrize("base, novo", [
+    (TEXTO, TEXTO),
+    (TEXTO, TEXTO.replace("Segunda", "Outra")),
+    (TEXTO, "Nova primeira\n" + TEXTO + "Última linha"),
+    (TEXTO, "Terceira linha\nPrimeira linha\n"),
+    (TEXTO, ""),
+    ("", TEXTO),
+    ("sem quebra", "sem quebra\ncom outra linha"),
+    ("Olá\r\nmundo\r\n", "Olá\r\nmundo novo\r\n"),
+])
+def test_aplicar_delta_reconstroi_o_texto_novo(base, novo):
+    assert aplicar_delta(base, calcular_delta(base, novo)) == novo
+
+
+def test_delta_copia_as_linhas_inalteradas():
+    novo = TEXTO.replace("Segunda", "Outra")
+
+    assert calcular_delta(TEXTO, novo) == [[0, 1], "Outra linha\n", [2, 3]]
+    assert calcular_delta(TEXTO, TEXTO) == [[0, 3]]
@@ -0,0 +1,57 @@
+import pytest
+
+from services.tag_service import TAMANHO_MAXIMO_TAG, TagService, separar_tags
+
+
+class PublicacaoServiceFalso:
+    def __init__(self, tags):
+        self.tags = tags
+
+    def get_tags(self):
+        return [{"nome": nome, "publicacoes": quantidade} for nome, quantidade in self.tags]
+
+
+@pytest.fixture
+def tag_service():
+    service = TagService(PublicacaoServiceFalso([("Python", 5), ("PyQt", 3), ("Pygame", 2), ("Linux", 4)]), max_sugestoes=2)
+    service.carregar()
+    return service
+
+
+def test_sugestoes_da_mais_usada_para_a_menos_usada(tag_service):
+    assert tag_service.sugerir("py") == ["Python", "PyQt"]
+    assert tag_service.sugerir("PÝ", limite=1) == ["Python"]
+    assert tag_service.sugerir("java") == []
+
+
+def test_tag_retirada_perde_uma_publicacao(tag_service):
+    tag_service.registrar("Linux", "Linux, PyQt")
+    tag_service.registrar("Linux", "Linux, PyQt")
+
+    # Com 1 publicação, PyQt dá lugar a Pygame entre as melhores do prefixo
+    assert tag_service.sugerir("py") == ["Python", "Pygame"]
+    assert tag_service.sugerir("pyq") == ["PyQt"]
+
+
+def test_tag_sem_publicacoes_deixa_de_ser_sugerida(tag_service):
+    for _ in range(3):
+        tag_service.registrar("", "PyQt")
+
+    assert tag_service.sugerir("pyq") == []
+    assert tag_service.sugerir("p") == ["Python", "Pygame"]
+
+
+def test_tag_incluida_ganha_uma_publicacao(tag_service):
+    tag_service.registrar("Pygame, Rust", "Python")
+
+    assert tag_service.sugerir("py") == ["Python", "PyQt"]
+    assert tag_service.sugerir("pyg") == ["Pygame"]
+    assert tag_service.sugerir("r") == ["Rust"]
+    tag_service.registrar("Pygame", None)
+    assert tag_service.sugerir("py") == ["Pygame", "Python"]
+
+
+def test_separar_tags():
+    assert separar_tags(" Python,  python , C#,,Ação  rápida") == ["Python", "C#", "Ação rápida"]
+    assert separar_tags(None) == []
+    assert separar_tags("x" * (TAMANHO_MAXIMO_TAG + 10)) == ["x" * TAMANHO_MAXIMO_TAG]
@@ -0,0 +1,50 @@
+import pytest
+
+from services.slug_service import escolher_livre, gerar_slug
+from services.titulo_service import TituloService
+
+
+@pytest.mark.parametrize("titulo, esperado", [
+    ("Olá Mundo", "ola mundo"),
+    ("  AÇÃO   e\treação ", "acao e reacao"),
+    ("Straße", "strasse"),
+    ("", ""),
+])
+def test_normalizar(titulo, esperado):
+    assert TituloService.normalizar(titulo) == esperado
+
+
+@pytest.mark.parametrize("texto, esperado", [
+    ("Olá Mundo", "ola_mundo"),
+    ("C# e .NET 8!", "c_e_net_8"),
+    ("Programação Orientada a Objetos", "programacao_orientada_a_objetos"),
+    ("", ""),
+])
+def test_gerar_slug(texto, esperado):
+    assert gerar_slug(texto) == esperado
+
+
+def test_escolher_livre():
+    assert escolher_livre("ola_mundo", set()) == "ola_mundo"
+    assert escolher_livre("ola_mundo", {"ola_mundo", "ola_mundo_2"}) == "ola_mundo_3"
+
+
+class PublicacaoServiceFalso:
+    def __init__(self):
+        self.consultas = []
+
+    def existe_titulo(self, titulo, ignorar_id=None):
+        self.consultas.append(titulo)
+        return False
+
+
+def test_existe_consulta_o_banco_apenas_para_titulos_desconhecidos():
+    service = PublicacaoServiceFalso()
+    titulo_service = TituloService(service)
+    titulo_service.registrar_varios([{"id": 1, "titulo": "Olá Mundo"}])
+
+    assert titulo_service.existe("OLA  mundo")
+    assert not titulo_service.existe("Olá Mundo", ignorar_id=1)
+    titulo_service.registrar(1, "Outro título")
+    assert not titulo_service.existe("Olá Mundo")
+    assert service.consultas == ["Olá Mundo", "Olá Mundo"]
@@ -0,0 +1,59 @@
+import pytest
+from PyQt5.QtCore import QCoreApplication, Qt
+
+from titulos_model import TitulosModel
+
+
+@pytest.fixture(scope="module")
+def aplicacao():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def criar_modelo(titulos, fim=True):
+    """
+    Modelo com uma página carregada; sem fim, mais páginas estão disponíveis
+    """
+    modelo = TitulosModel(None, lambda: None, tamanho_pagina=len(titulos) + (1 if fim else 0))
+    modelo._anexar_pagina([{"id": id_publicacao, "titulo": titulo} for id_publicacao, titulo in titulos])
+    return modelo
+
+
+def titulos(modelo):
+    return [(modelo.index(linha).data(Qt.UserRole), modelo.index(linha).data()) for linha in range(modelo.rowCount())]
+
+
+def test_inclusao_na_posicao_da_ordenacao_sem_acentos_e_maiusculas(aplicacao):
+    modelo = criar_modelo([(1, "Árvores"), (2, "café"), (3, "Python")])
+
+    modelo.aplicar_linha(4, "Banco de dados")
+    modelo.aplicar_linha(5, "Ação")
+    modelo.aplicar_linha(6, "Zope")
+
+    assert titulos(modelo) == [(5, "Ação"), (1, "Árvores"), (4, "Banco de dados"), (2, "café"), (3, "Python"), (6, "Zope")]
+
+
+def test_titulos_iguais_ordenados_pelo_id(aplicacao):
+    modelo = criar_modelo([(2, "Python"), (5, "python")])
+
+    modelo.aplicar_linha(3, "PYTHON")
+
+    assert [id_publicacao for id_publicacao, _ in titulos(modelo)] == [2, 3, 5]
+
+
+def test_alteracao_move_a_linha(aplicacao):
+    modelo = criar_modelo([(1, "Alfa"), (2, "Beta"), (3, "Gama")])
+
+    modelo.aplicar_linha(1, "Delta")
+
+    assert titulos(modelo) == [(2, "Beta"), (1, "Delta"), (3, "Gama")]
+
+
+def test_titulo_apos_o_trecho_carregado_aguarda_as_proximas_paginas(aplicacao):
+    modelo = criar_modelo([(1, "Alfa"), (2, "Beta")], fim=False)
+
+    modelo.aplicar_linha(3, "Zeta")
+    modelo.aplicar_linha(1, "Omega")
+    modelo.aplicar_linha(4, "Abacaxi")
+
+    # A linha alterada para depois do trecho carregado sai da lista
+    assert titulos(modelo) == [(4, "Abacaxi"), (2, "Beta")]
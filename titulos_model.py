@@ -0,0 +1,161 @@
+from bisect import bisect_left
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt, pyqtSignal
+
+from services.titulo_service import TituloService
+from services.metricas import instrumentar
+
+
+class TitulosModel(QAbstractListModel):
+    """
+    Modelo da combo de títulos publicados.
+
+    Os títulos são buscados em páginas, sob demanda, conforme a lista é rolada (canFetchMore/fetchMore),
+    usando paginação por chave em (titulo, id). Cada linha guarda apenas (id, titulo).
+
+    Após uma gravação a lista não é recarregada: a linha alterada é aplicada localmente e uma consulta
+    delta busca apenas as publicações gravadas (atualizado_em) depois da última sincronização.
+    """
+    pagina_carregada = pyqtSignal(list)
+    titulos_alterados = pyqtSignal(list)
+
+    def __init__(self, executor, obter_service, tamanho_pagina=200, parent=None):
+        """
+        :param executor: ExecutorTarefas usado para buscar as páginas em segundo plano.
+        :param obter_service: Função que retorna o PublicacaoService atual.
+        :param tamanho_pagina: Quantidade de títulos por página.
+        """
+        super().__init__(parent)
+        self.executor = executor
+        self.obter_service = obter_service
+        self.tamanho_pagina = tamanho_pagina
+        self._linhas = []
+        self._fim = False
+        self._carregando = False
+        # Marca d'água da última sincronização: maior atualizado_em recebido
+        self._marca = None
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._linhas)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        id_publicacao, titulo = self._linhas[index.row()]
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return titulo
+        if role == Qt.UserRole:
+            return id_publicacao
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        # Sem conexão (ainda conectando ou falhou) não há o que buscar
+        return not self._fim and not self._carregando and self.obter_service() is not None
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self._carregando = True
+        apos_id, apos_titulo = self._linhas[-1] if self._linhas else (None, None)
+        self.executor.executar(
+            "titulos",
+            self.obter_service().get_titulos_publicados_pagina,
+            apos_titulo,
+            apos_id,
+            self.tamanho_pagina,
+            ao_concluir=self._anexar_pagina,
+            ao_falhar=self._falha_pagina)
+
+    def limpar(self):
+        """
+        Descarta os títulos carregados e as buscas em andamento
+        """
+        self.executor.cancelar("titulos")
+        self.executor.cancelar("titulos_delta")
+        self.executor.cancelar("titulos_marca")
+        self.beginResetModel()
+        self._linhas = []
+        self._fim = False
+        self._carregando = False
+        self._marca = None
+        self.endResetModel()
+
+    def recarregar(self):
+        """
+        Descarta os títulos carregados e busca novamente a primeira página
+        """
+        self.limpar()
+        self.executor.executar(
+            "titulos_marca",
+            self.obter_service().get_marca_sincronizacao,
+            ao_concluir=self._definir_marca)
+        self.fetchMore()
+
+    def aplicar_linha(self, id_publicacao, titulo):
+        """
+        Aplica localmente a inclusão ou alteração de um título, mantendo a ordenação.
+        Títulos posteriores ao trecho já carregado são ignorados: chegarão com as próximas páginas.
+        """
+        self._remover_id(id_publicacao)
+        chave = self._chave_ordenacao((id_publicacao, titulo))
+        posicao = bisect_left(self._linhas, chave, key=self._chave_ordenacao)
+        if posicao == len(self._linhas) and not self._fim:
+            return
+        self.beginInsertRows(QModelIndex(), posicao, posicao)
+        self._linhas.insert(posicao, (id_publicacao, titulo))
+        self.endInsertRows()
+
+    def sincronizar(self):
+        """
+        Busca apenas os títulos incluídos ou revisados desde a última sincronização e os mescla na lista
+        """
+        if self._marca is None:
+            return
+        self.executor.executar(
+            "titulos_delta",
+            self.obter_service().get_titulos_alterados,
+            self._marca,
+            ao_concluir=self._mesclar_alteracoes)
+
+    def _definir_marca(self, marca):
+        self._marca = marca
+
+    @instrumentar
+    def _mesclar_alteracoes(self, linhas):
+        for linha in linhas:
+            self.aplicar_linha(linha['id'], linha['titulo'])
+            self._marca = max(self._marca, linha['atualizado_em'])
+        self.titulos_alterados.emit(linhas)
+
+    def _remover_id(self, id_publicacao):
+        for posicao, (id_linha, _) in enumerate(self._linhas):
+            if id_linha == id_publicacao:
+                self.beginRemoveRows(QModelIndex(), posicao, posicao)
+                del self._linhas[posicao]
+                self.endRemoveRows()
+                return
+
+    @staticmethod
+    def _chave_ordenacao(linha):
+        # Aproxima a collation *_ai_ci do MySQL usada no ORDER BY titulo
+        return (TituloService.normalizar(linha[1]), linha[0])
+
+    @instrumentar
+    def _anexar_pagina(self, linhas):
+        self._carregando = False
+        if len(linhas) < self.tamanho_pagina:
+            self._fim = True
+        if linhas:
+            inicio = len(self._linhas)
+            self.beginInsertRows(QModelIndex(), inicio, inicio + len(linhas) - 1)
+            self._linhas.extend((linha['id'], linha['titulo']) for linha in linhas)
+            self.endInsertRows()
+        self.pagina_carregada.emit(linhas)
+
+    def _falha_pagina(self, erro):
+        self._carregando = False
+        if self.executor.ao_falhar_padrao:
+            self.executor.ao_falhar_padrao(erro)
@@ -0,0 +1,71 @@
+# Gerado por compilar_ui.py a partir de configuracoes.ui. Não edite este arquivo.
+HASH_UI = "2099e987a7aa0c5f83d4df725ea2493ee68e4e5e"
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'configuracoes.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(680, 328)
+        self.frame = QtWidgets.QFrame(Dialog)
+        self.frame.setGeometry(QtCore.QRect(20, 30, 631, 220))
+        self.frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame.setObjectName("frame")
+        self.txtURL = QtWidgets.QLineEdit(self.frame)
+        self.txtURL.setGeometry(QtCore.QRect(30, 82, 571, 27))
+        self.txtURL.setObjectName("txtURL")
+        self.txtUsername = QtWidgets.QLineEdit(self.frame)
+        self.txtUsername.setGeometry(QtCore.QRect(30, 140, 291, 27))
+        self.txtUsername.setObjectName("txtUsername")
+        self.txtPassword = QtWidgets.QLineEdit(self.frame)
+        self.txtPassword.setGeometry(QtCore.QRect(340, 140, 261, 27))
+        self.txtPassword.setObjectName("txtPassword")
+        self.cboLocalConexao = QtWidgets.QComboBox(self.frame)
+        self.cboLocalConexao.setGeometry(QtCore.QRect(30, 30, 571, 27))
+        self.cboLocalConexao.setObjectName("cboLocalConexao")
+        self.label = QtWidgets.QLabel(self.frame)
+        self.label.setGeometry(QtCore.QRect(30, 6, 221, 19))
+        self.label.setObjectName("label")
+        self.label_2 = QtWidgets.QLabel(self.frame)
+        self.label_2.setGeometry(QtCore.QRect(30, 190, 48, 19))
+        self.label_2.setObjectName("label_2")
+        self.lblIsDefault = QtWidgets.QLabel(self.frame)
+        self.lblIsDefault.setGeometry(QtCore.QRect(100, 190, 28, 19))
+        self.lblIsDefault.setObjectName("lblIsDefault")
+        self.frameBotoes = QtWidgets.QFrame(Dialog)
+        self.frameBotoes.setGeometry(QtCore.QRect(20, 260, 631, 51))
+        self.frameBotoes.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frameBotoes.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frameBotoes.setObjectName("frameBotoes")
+        self.btnAplicar = QtWidgets.QPushButton(self.frameBotoes)
+        self.btnAplicar.setGeometry(QtCore.QRect(450, 10, 151, 31))
+        self.btnAplicar.setObjectName("btnAplicar")
+        self.btnDefault = QtWidgets.QPushButton(self.frameBotoes)
+        self.btnDefault.setGeometry(QtCore.QRect(30, 10, 151, 31))
+        self.btnDefault.setObjectName("btnDefault")
+
+        self.retranslateUi(Dialog)
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Configurações"))
+        self.txtURL.setPlaceholderText(_translate("Dialog", "URL"))
+        self.txtUsername.setPlaceholderText(_translate("Dialog", "User Name"))
+        self.txtPassword.setPlaceholderText(_translate("Dialog", "Password"))
+        self.label.setText(_translate("Dialog", "Local da Conexão"))
+        self.label_2.setText(_translate("Dialog", "Padrão"))
+        self.lblIsDefault.setText(_translate("Dialog", "Não"))
+        self.btnAplicar.setText(_translate("Dialog", "Aplicar"))
+        self.btnDefault.setText(_translate("Dialog", "Usar como Padrão"))
@@ -0,0 +1,46 @@
+# Gerado por compilar_ui.py a partir de diagnostico.ui. Não edite este arquivo.
+HASH_UI = "0664af3ab7ec50fbe5b028bef4e4c9a30cab6c77"
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'diagnostico.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(860, 440)
+        self.tblMetricas = QtWidgets.QTableWidget(Dialog)
+        self.tblMetricas.setGeometry(QtCore.QRect(20, 20, 821, 341))
+        self.tblMetricas.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.tblMetricas.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.tblMetricas.setObjectName("tblMetricas")
+        self.tblMetricas.setColumnCount(0)
+        self.tblMetricas.setRowCount(0)
+        self.lblLog = QtWidgets.QLabel(Dialog)
+        self.lblLog.setGeometry(QtCore.QRect(20, 380, 481, 31))
+        self.lblLog.setText("")
+        self.lblLog.setObjectName("lblLog")
+        self.btnLimpar = QtWidgets.QPushButton(Dialog)
+        self.btnLimpar.setGeometry(QtCore.QRect(530, 380, 151, 31))
+        self.btnLimpar.setObjectName("btnLimpar")
+        self.btnAtualizar = QtWidgets.QPushButton(Dialog)
+        self.btnAtualizar.setGeometry(QtCore.QRect(690, 380, 151, 31))
+        self.btnAtualizar.setObjectName("btnAtualizar")
+
+        self.retranslateUi(Dialog)
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Diagnóstico"))
+        self.tblMetricas.setSortingEnabled(True)
+        self.btnLimpar.setText(_translate("Dialog", "Limpar"))
+        self.btnAtualizar.setText(_translate("Dialog", "Atualizar"))
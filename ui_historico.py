@@ -0,0 +1,54 @@
+# Gerado por compilar_ui.py a partir de historico.ui. Não edite este arquivo.
+HASH_UI = "8cf4a6b27dc23218de7477617070ba2156565481"
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'historico.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(860, 560)
+        self.tblRevisoes = QtWidgets.QTableWidget(Dialog)
+        self.tblRevisoes.setGeometry(QtCore.QRect(20, 20, 821, 181))
+        self.tblRevisoes.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.tblRevisoes.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.tblRevisoes.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.tblRevisoes.setObjectName("tblRevisoes")
+        self.tblRevisoes.setColumnCount(0)
+        self.tblRevisoes.setRowCount(0)
+        self.label = QtWidgets.QLabel(Dialog)
+        self.label.setGeometry(QtCore.QRect(20, 210, 401, 17))
+        self.label.setObjectName("label")
+        self.txtDiferencas = QtWidgets.QPlainTextEdit(Dialog)
+        self.txtDiferencas.setGeometry(QtCore.QRect(20, 230, 821, 271))
+        font = QtGui.QFont()
+        font.setFamily("Monospace")
+        self.txtDiferencas.setFont(font)
+        self.txtDiferencas.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+        self.txtDiferencas.setReadOnly(True)
+        self.txtDiferencas.setObjectName("txtDiferencas")
+        self.btnRestaurar = QtWidgets.QPushButton(Dialog)
+        self.btnRestaurar.setGeometry(QtCore.QRect(530, 515, 151, 31))
+        self.btnRestaurar.setObjectName("btnRestaurar")
+        self.btnFechar = QtWidgets.QPushButton(Dialog)
+        self.btnFechar.setGeometry(QtCore.QRect(690, 515, 151, 31))
+        self.btnFechar.setObjectName("btnFechar")
+
+        self.retranslateUi(Dialog)
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Histórico de Revisões"))
+        self.label.setText(_translate("Dialog", "Alterações em relação à revisão anterior"))
+        self.btnRestaurar.setText(_translate("Dialog", "Restaurar Revisão"))
+        self.btnFechar.setText(_translate("Dialog", "Fechar"))
@@ -0,0 +1,166 @@
+# Gerado por compilar_ui.py a partir de principal.ui. Não edite este arquivo.
+HASH_UI = "a26693a100e1fa5ef9991e1a5f91f2f16989a752"
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'principal.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(955, 843)
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.frameBotoes = QtWidgets.QFrame(self.centralwidget)
+        self.frameBotoes.setGeometry(QtCore.QRect(30, 760, 871, 51))
+        self.frameBotoes.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frameBotoes.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frameBotoes.setObjectName("frameBotoes")
+        self.btnNovaPublicacao = QtWidgets.QPushButton(self.frameBotoes)
+        self.btnNovaPublicacao.setGeometry(QtCore.QRect(40, 10, 151, 31))
+        self.btnNovaPublicacao.setObjectName("btnNovaPublicacao")
+        self.btnSalvarPublicacao = QtWidgets.QPushButton(self.frameBotoes)
+        self.btnSalvarPublicacao.setGeometry(QtCore.QRect(200, 10, 151, 31))
+        self.btnSalvarPublicacao.setObjectName("btnSalvarPublicacao")
+        self.btnConfiguracoes = QtWidgets.QPushButton(self.frameBotoes)
+        self.btnConfiguracoes.setGeometry(QtCore.QRect(682, 10, 151, 31))
+        self.btnConfiguracoes.setObjectName("btnConfiguracoes")
+        self.btnCancelar = QtWidgets.QPushButton(self.frameBotoes)
+        self.btnCancelar.setGeometry(QtCore.QRect(360, 10, 151, 31))
+        self.btnCancelar.setObjectName("btnCancelar")
+        self.btnHistorico = QtWidgets.QPushButton(self.frameBotoes)
+        self.btnHistorico.setGeometry(QtCore.QRect(520, 10, 151, 31))
+        self.btnHistorico.setObjectName("btnHistorico")
+        self.cboTitulosPublicados = QtWidgets.QComboBox(self.centralwidget)
+        self.cboTitulosPublicados.setGeometry(QtCore.QRect(30, 60, 751, 27))
+        self.cboTitulosPublicados.setObjectName("cboTitulosPublicados")
+        self.label = QtWidgets.QLabel(self.centralwidget)
+        self.label.setGeometry(QtCore.QRect(30, 30, 122, 19))
+        self.label.setObjectName("label")
+        self.txtPesquisa = QtWidgets.QLineEdit(self.centralwidget)
+        self.txtPesquisa.setGeometry(QtCore.QRect(530, 26, 371, 27))
+        self.txtPesquisa.setClearButtonEnabled(True)
+        self.txtPesquisa.setObjectName("txtPesquisa")
+        self.frameCampos = QtWidgets.QFrame(self.centralwidget)
+        self.frameCampos.setGeometry(QtCore.QRect(29, 100, 871, 641))
+        self.frameCampos.setStyleSheet("")
+        self.frameCampos.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frameCampos.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frameCampos.setObjectName("frameCampos")
+        self.txtLinkImagem = QtWidgets.QLineEdit(self.frameCampos)
+        self.txtLinkImagem.setGeometry(QtCore.QRect(40, 330, 791, 27))
+        self.txtLinkImagem.setObjectName("txtLinkImagem")
+        self.txtPublicadoEm = QtWidgets.QLineEdit(self.frameCampos)
+        self.txtPublicadoEm.setGeometry(QtCore.QRect(40, 270, 281, 27))
+        self.txtPublicadoEm.setStyleSheet("color: rgb(52, 101, 164);")
+        self.txtPublicadoEm.setReadOnly(True)
+        self.txtPublicadoEm.setObjectName("txtPublicadoEm")
+        self.cboTipoPublicacao = QtWidgets.QComboBox(self.frameCampos)
+        self.cboTipoPublicacao.setGeometry(QtCore.QRect(40, 30, 361, 27))
+        self.cboTipoPublicacao.setProperty("placeholderText", "")
+        self.cboTipoPublicacao.setObjectName("cboTipoPublicacao")
+        self.txtTituloPublicacao = QtWidgets.QLineEdit(self.frameCampos)
+        self.txtTituloPublicacao.setGeometry(QtCore.QRect(40, 90, 791, 27))
+        self.txtTituloPublicacao.setObjectName("txtTituloPublicacao")
+        self.txtTagsPublicacao = QtWidgets.QLineEdit(self.frameCampos)
+        self.txtTagsPublicacao.setGeometry(QtCore.QRect(40, 150, 791, 27))
+        self.txtTagsPublicacao.setObjectName("txtTagsPublicacao")
+        self.txtURLPublicacao = QtWidgets.QLineEdit(self.frameCampos)
+        self.txtURLPublicacao.setGeometry(QtCore.QRect(40, 210, 791, 27))
+        self.txtURLPublicacao.setStyleSheet("color: rgb(52, 101, 164);")
+        self.txtURLPublicacao.setReadOnly(True)
+        self.txtURLPublicacao.setObjectName("txtURLPublicacao")
+        self.label_2 = QtWidgets.QLabel(self.frameCampos)
+        self.label_2.setGeometry(QtCore.QRect(40, 6, 126, 19))
+        self.label_2.setObjectName("label_2")
+        self.txtRevisadoEm = QtWidgets.QLineEdit(self.frameCampos)
+        self.txtRevisadoEm.setGeometry(QtCore.QRect(340, 270, 281, 27))
+        self.txtRevisadoEm.setStyleSheet("color: rgb(52, 101, 164);")
+        self.txtRevisadoEm.setReadOnly(True)
+        self.txtRevisadoEm.setObjectName("txtRevisadoEm")
+        self.chkPublicacaoAtiva = QtWidgets.QCheckBox(self.frameCampos)
+        self.chkPublicacaoAtiva.setGeometry(QtCore.QRect(690, 270, 141, 25))
+        self.chkPublicacaoAtiva.setObjectName("chkPublicacaoAtiva")
+        self.txtTextoPublicacao = QtWidgets.QPlainTextEdit(self.frameCampos)
+        self.txtTextoPublicacao.setGeometry(QtCore.QRect(40, 390, 791, 240))
+        self.txtTextoPublicacao.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOn)
+        self.txtTextoPublicacao.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.txtTextoPublicacao.setObjectName("txtTextoPublicacao")
+        self.label_3 = QtWidgets.QLabel(self.frameCampos)
+        self.label_3.setGeometry(QtCore.QRect(40, 68, 40, 17))
+        self.label_3.setObjectName("label_3")
+        self.label_4 = QtWidgets.QLabel(self.frameCampos)
+        self.label_4.setGeometry(QtCore.QRect(40, 130, 131, 17))
+        self.label_4.setObjectName("label_4")
+        self.label_5 = QtWidgets.QLabel(self.frameCampos)
+        self.label_5.setGeometry(QtCore.QRect(40, 190, 78, 17))
+        self.label_5.setObjectName("label_5")
+        self.label_6 = QtWidgets.QLabel(self.frameCampos)
+        self.label_6.setGeometry(QtCore.QRect(40, 250, 131, 17))
+        self.label_6.setObjectName("label_6")
+        self.label_7 = QtWidgets.QLabel(self.frameCampos)
+        self.label_7.setGeometry(QtCore.QRect(340, 250, 111, 17))
+        self.label_7.setObjectName("label_7")
+        self.label_8 = QtWidgets.QLabel(self.frameCampos)
+        self.label_8.setGeometry(QtCore.QRect(40, 310, 211, 17))
+        self.label_8.setObjectName("label_8")
+        self.label_9 = QtWidgets.QLabel(self.frameCampos)
+        self.label_9.setGeometry(QtCore.QRect(40, 370, 211, 17))
+        self.label_9.setObjectName("label_9")
+        self.btnTextoCompleto = QtWidgets.QPushButton(self.frameCampos)
+        self.btnTextoCompleto.setVisible(False)
+        self.btnTextoCompleto.setGeometry(QtCore.QRect(680, 362, 151, 25))
+        self.btnTextoCompleto.setObjectName("btnTextoCompleto")
+        self.btnLerPublicacao = QtWidgets.QPushButton(self.centralwidget)
+        self.btnLerPublicacao.setGeometry(QtCore.QRect(790, 60, 51, 27))
+        self.btnLerPublicacao.setObjectName("btnLerPublicacao")
+        self.btnEditarPublicacao = QtWidgets.QPushButton(self.centralwidget)
+        self.btnEditarPublicacao.setGeometry(QtCore.QRect(850, 60, 51, 27))
+        self.btnEditarPublicacao.setObjectName("btnEditarPublicacao")
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.statusbar = QtWidgets.QStatusBar(MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "Blog Desktop"))
+        self.btnNovaPublicacao.setText(_translate("MainWindow", "Nova Publicação"))
+        self.btnSalvarPublicacao.setText(_translate("MainWindow", "Salvar Publicação"))
+        self.btnConfiguracoes.setText(_translate("MainWindow", "Configurações..."))
+        self.btnCancelar.setText(_translate("MainWindow", "Cancelar"))
+        self.btnHistorico.setText(_translate("MainWindow", "Histórico..."))
+        self.label.setText(_translate("MainWindow", "Títulos Publicados"))
+        self.txtPesquisa.setToolTip(_translate("MainWindow", "Pesquisa no título, tags e texto; use tag:nome para listar as publicações com uma tag"))
+        self.txtPesquisa.setPlaceholderText(_translate("MainWindow", "Pesquisar no título, tags e texto..."))
+        self.txtLinkImagem.setPlaceholderText(_translate("MainWindow", "Link da Imagem da Publicação"))
+        self.txtPublicadoEm.setPlaceholderText(_translate("MainWindow", "Data da Primeira Publicação"))
+        self.txtTituloPublicacao.setPlaceholderText(_translate("MainWindow", "Título da Publicação"))
+        self.txtTagsPublicacao.setPlaceholderText(_translate("MainWindow", "Tags da Publicação"))
+        self.txtURLPublicacao.setPlaceholderText(_translate("MainWindow", "URL da Publicação no Site"))
+        self.label_2.setText(_translate("MainWindow", "Tipo de Publicação"))
+        self.txtRevisadoEm.setPlaceholderText(_translate("MainWindow", "Última Revisão Em"))
+        self.chkPublicacaoAtiva.setText(_translate("MainWindow", "Publicação Ativa?"))
+        self.label_3.setText(_translate("MainWindow", "Título"))
+        self.label_4.setText(_translate("MainWindow", "Tags Relacionadas"))
+        self.label_5.setText(_translate("MainWindow", "URL no Site"))
+        self.label_6.setText(_translate("MainWindow", "Data de Publicação"))
+        self.label_7.setText(_translate("MainWindow", "Data de Revisão"))
+        self.label_8.setText(_translate("MainWindow", "Link da Imagem da Publicação"))
+        self.label_9.setText(_translate("MainWindow", "Texto Publicado"))
+        self.btnTextoCompleto.setText(_translate("MainWindow", "Texto completo"))
+        self.btnLerPublicacao.setToolTip(_translate("MainWindow", "Exibir Publicação Apenas"))
+        self.btnLerPublicacao.setText(_translate("MainWindow", "🔍"))
+        self.btnEditarPublicacao.setToolTip(_translate("MainWindow", "Exibir e Editar Publicação"))
+        self.btnEditarPublicacao.setText(_translate("MainWindow", "☰"))